@@ -6,6 +6,8 @@ A package to work with NBA player tracking stats from
 """
 
 REQUEST_TIMEOUT = 30
+# max number of requests in flight at once for async functions
+ASYNC_CONCURRENCY = 4
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; rv:78.0) Gecko/20100101 Firefox/78.0"
 REFERER = "https://www.nba.com/stats/"
 HEADERS = {
@@ -0,0 +1,80 @@
+"""
+Module for accumulating totals for each player/team without changing the items that are added.
+
+How stats are combined comes from the field metadata of the item models
+(see :mod:`nba_stats_tracking.models.fields`) - counting stats are summed and averages
+(ex ``avg_speed``) are weighted. Adding items is
+associative, so accumulators for partial results (ex for each season, date or worker) can be
+merged in any order and give the same totals.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+
+class TotalsAccumulator:
+    """
+    Accumulates totals for items grouped by an entity key.
+    Totals are copies, items that are added are never changed.
+
+    :param entity_key: field to group items by, ex ``player_id`` or ``team_id``.
+        None accumulates all items into one total.
+    """
+
+    def __init__(self, entity_key: Optional[str] = None):
+        self.entity_key = entity_key
+        self._totals: Dict[Any, Any] = {}
+
+    def add(self, item: Any) -> "TotalsAccumulator":
+        """
+        Adds an item to the totals for its entity
+        """
+        key = None if self.entity_key is None else item[self.entity_key]
+        total = self._totals.get(key)
+        if total is None:
+            self._totals[key] = item.copy()
+        else:
+            total += item
+        return self
+
+    def update(self, items: Iterable[Any]) -> "TotalsAccumulator":
+        """
+        Adds items to the totals for their entities
+        """
+        for item in items:
+            self.add(item)
+        return self
+
+    def _check_entity_key(self, other: "TotalsAccumulator"):
+        if other.entity_key != self.entity_key:
+            raise ValueError(
+                f"Can't merge totals by {other.entity_key} "
+                f"with totals by {self.entity_key}"
+            )
+
+    def merge(self, other: "TotalsAccumulator") -> "TotalsAccumulator":
+        """
+        Gets a new accumulator with the totals of both accumulators.
+        Neither accumulator is changed.
+        """
+        self._check_entity_key(other)
+        merged = TotalsAccumulator(self.entity_key)
+        merged.update(self._totals.values())
+        merged.update(other._totals.values())
+        return merged
+
+    def __add__(self, other: "TotalsAccumulator") -> "TotalsAccumulator":
+        return self.merge(other)
+
+    def __iadd__(self, other: "TotalsAccumulator") -> "TotalsAccumulator":
+        self._check_entity_key(other)
+        return self.update(other._totals.values())
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def results(self) -> List[Any]:
+        """
+        Gets totals for each entity, in order of first appearance.
+        Totals belong to the accumulator, so adding more items changes them.
+        """
+        return list(self._totals.values())
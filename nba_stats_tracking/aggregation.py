@@ -0,0 +1,242 @@
+"""
+Module for aggregating :class:`~nba_stats_tracking.columnar.ColumnarResults` with vectorized
+group-by reductions instead of adding up items one at a time. Requires NumPy.
+
+How each field is aggregated comes from the field metadata in
+:mod:`nba_stats_tracking.models.fields` - additive stats are summed, averages (ex ``avg_speed``)
+are weighted and ids and names are taken from the first row for each player/team.
+Ratios (ex ``efg``) can be computed from aggregated columns with :func:`get_ratio_columns`.
+"""
+
+from typing import Any, Dict, Optional, Sequence, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from nba_stats_tracking.columnar import ColumnarResults
+from nba_stats_tracking.models import fields
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+SUM = "sum"
+WEIGHTED_AVERAGE = "weighted_average"
+FIRST = "first"
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "NumPy is required for vectorized aggregation. "
+            "Install it with pip install nba_stats_tracking[numpy]"
+        )
+
+
+def get_entity_key(entity_type: str) -> Optional[str]:
+    """
+    Gets field to group by for entity type. None for league.
+
+    :param entity_type: player, team, opponent or league
+    """
+    entity_type = getattr(entity_type, "value", entity_type).lower()
+    if entity_type == "player":
+        return "player_id"
+    if entity_type in ("team", "opponent"):
+        return "team_id"
+    if entity_type == "league":
+        return None
+    raise ValueError(f"Unknown entity type {entity_type}")
+
+
+def get_field_aggregation(item_class: Type[BaseModel], name: str) -> str:
+    """
+    Gets how a field is aggregated - SUM, WEIGHTED_AVERAGE or FIRST.
+    Uses the field metadata from :mod:`nba_stats_tracking.models.fields`.
+    """
+    field = item_class.__fields__.get(name)
+    aggregation = None if field is None else fields.get_field_aggregation(field)
+    if aggregation == fields.ADDITIVE:
+        return SUM
+    if aggregation == fields.WEIGHTED_AVERAGE:
+        return WEIGHTED_AVERAGE
+    return FIRST
+
+
+def concat_columns(results: Sequence[ColumnarResults]) -> ColumnarResults:
+    """
+    Combines columnar results for the same item model, ex for multiple seasons or filters.
+    Only columns that are in all results are kept.
+    """
+    _require_numpy()
+    if len(results) == 0:
+        raise ValueError("No results to combine")
+    item_class = results[0].item_class
+    names = [
+        name
+        for name in results[0].columns
+        if all(name in result.columns for result in results)
+    ]
+    columns = {}
+    for name in names:
+        parts = [result[name] for result in results]
+        if isinstance(parts[0], list):
+            columns[name] = [value for part in parts for value in part]
+        else:
+            columns[name] = np.concatenate([np.asarray(part) for part in parts])
+    return ColumnarResults.from_columns(item_class, columns)
+
+
+def _group_sum(inverse, values, group_count: int):
+    return np.bincount(
+        inverse, weights=np.asarray(values, dtype=np.float64), minlength=group_count
+    )
+
+
+def group_by(
+    results: Union[ColumnarResults, Sequence[ColumnarResults]], key: Optional[str]
+) -> ColumnarResults:
+    """
+    Aggregates rows with the same key. Groups are in order of first appearance.
+
+    :param results: columnar results to aggregate
+    :param key: field to group by, ex ``player_id``. None aggregates all rows into one.
+    """
+    _require_numpy()
+    if not isinstance(results, ColumnarResults):
+        results = concat_columns(results)
+    item_class = results.item_class
+    row_count = len(results)
+
+    if key is None:
+        inverse = np.zeros(row_count, dtype=np.int64)
+        first_index = np.zeros(min(row_count, 1), dtype=np.int64)
+    else:
+        keys = np.asarray(results[key])
+        _, first_index, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        # np.unique sorts keys, reorder groups by first appearance
+        order = np.argsort(first_index, kind="stable")
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+        inverse = rank[inverse.reshape(-1)]
+        first_index = first_index[order]
+    group_count = len(first_index)
+
+    columns = {}
+    for name, column in results.columns.items():
+        aggregation = get_field_aggregation(item_class, name)
+        if aggregation == FIRST:
+            if isinstance(column, list):
+                columns[name] = [column[index] for index in first_index]
+            else:
+                columns[name] = np.asarray(column)[first_index]
+        elif aggregation == SUM:
+            total = _group_sum(inverse, column, group_count)
+            if np.asarray(column).dtype.kind == "i":
+                total = np.rint(total).astype(np.int64)
+            columns[name] = total
+        else:
+            weight_name = fields.get_field_weight(item_class.__fields__[name])
+            if weight_name not in results.columns:
+                continue
+            weights = np.asarray(results[weight_name], dtype=np.float64)
+            values = np.nan_to_num(np.asarray(column, dtype=np.float64))
+            weighted_total = _group_sum(inverse, values * weights, group_count)
+            weight_total = _group_sum(inverse, weights, group_count)
+            columns[name] = np.divide(
+                weighted_total,
+                weight_total,
+                out=np.zeros(group_count),
+                where=weight_total != 0,
+            )
+    return ColumnarResults.from_columns(item_class, columns)
+
+
+def aggregate(
+    results: Union[ColumnarResults, Sequence[ColumnarResults]], entity_type: str
+) -> ColumnarResults:
+    """
+    Aggregates totals for each player/team, or league totals.
+    League totals have one row with team id 0 and team abbreviation LEAGUE.
+
+    :param results: columnar results to aggregate
+    :param entity_type: player, team, opponent or league
+    """
+    key = get_entity_key(entity_type)
+    totals = group_by(results, key)
+    if key is None:
+        item_class = totals.item_class
+        columns = {
+            name: column
+            for name, column in totals.columns.items()
+            if get_field_aggregation(item_class, name) != FIRST
+        }
+        columns["team_id"] = np.zeros(1, dtype=np.int64)
+        columns["team_abbreviation"] = ["LEAGUE"]
+        totals = ColumnarResults.from_columns(item_class, columns)
+    return totals
+
+
+def lookup(
+    keys: Any, lookup_keys: Any, lookup_values: Any, default: float = 0
+) -> "np.ndarray":
+    """
+    Gets value for each key from lookup keys and values, ex to join overall shot totals
+    onto filtered shot totals by player id. Keys that aren't found get the default value.
+    """
+    _require_numpy()
+    keys = np.asarray(keys)
+    lookup_keys = np.asarray(lookup_keys)
+    lookup_values = np.asarray(lookup_values)
+    values = np.full(len(keys), default, dtype=np.result_type(lookup_values, default))
+    if len(lookup_keys) == 0:
+        return values
+    order = np.argsort(lookup_keys, kind="stable")
+    sorted_keys = lookup_keys[order]
+    positions = np.searchsorted(sorted_keys, keys)
+    positions = np.minimum(positions, len(sorted_keys) - 1)
+    found = sorted_keys[positions] == keys
+    values[found] = lookup_values[order][positions[found]]
+    return values
+
+
+def aggregate_full_season(
+    results: Sequence[ColumnarResults], entity_type: str
+) -> Tuple[ColumnarResults, ColumnarResults]:
+    """
+    Aggregates totals for each player/team and league totals
+
+    :param results: columnar results for all seasons to aggregate
+    :param entity_type: player, team or opponent
+    """
+    stats = aggregate(results, entity_type)
+    return stats, aggregate(stats, "league")
+
+
+def get_ratio_columns(results: ColumnarResults) -> Dict[str, "np.ndarray"]:
+    """
+    Computes derived ratio stats (ex ``fg3pct``) for all rows, keyed by name.
+    Ratios are 0 when the denominator is 0, like on the item models.
+    """
+    _require_numpy()
+    columns = {
+        name: np.asarray(column, dtype=np.float64)
+        for name, column in results.columns.items()
+        if get_field_aggregation(results.item_class, name) != FIRST
+    }
+    ratio_columns = {}
+    for name, ratio in fields.get_ratios(results.item_class).items():
+        if ratio.denominator not in columns or not all(
+            numerator in columns for numerator in ratio.numerator
+        ):
+            continue
+        denominator = columns[ratio.denominator]
+        ratio_columns[name] = np.divide(
+            ratio.compute(columns),
+            denominator,
+            out=np.zeros(len(denominator)),
+            where=denominator != 0,
+        )
+    return ratio_columns
@@ -0,0 +1,269 @@
+"""
+Module for resumable game log backfills.
+
+Completed units of work - a measure type or named tracking shot filter, an entity (player,
+team or opponent) and a date - are appended to a checkpoint journal once their game logs
+have been written. Reruns skip completed units, so a crashed backfill picks up where it
+stopped, and incremental runs only request dates after the last checkpoint.
+
+The journal is a text file with one json line per completed unit. Lines are flushed and
+synced to disk before a unit counts as complete. Game logs for a unit are written before it
+is recorded, so a crash in between writes them again on the next run - ``write`` should
+replace any existing rows for the date.
+"""
+
+import json
+import os
+import threading
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from dateutil.rrule import DAILY, rrule
+
+from nba_stats_tracking import tracking, tracking_shots
+from nba_stats_tracking.cache import DEFAULT_FINAL_AFTER_DAYS
+from nba_stats_tracking.models.request import ResultFormat
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+
+
+def _get_name(value: Any) -> str:
+    # enum value, ex CatchShoot for TrackingMeasureType.catch_and_shoot
+    return str(getattr(value, "value", value))
+
+
+class CheckpointJournal:
+    """
+    Append only journal of completed (unit, entity, date) backfill units
+
+    :param path: path to journal file. Created if it doesn't exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._completed: Set[Tuple[str, str, date]] = set()
+        self._last_dates: Dict[Tuple[str, str], date] = {}
+        ends_with_newline = self._load()
+        self._file = open(path, "a", encoding="utf-8")
+        if not ends_with_newline:
+            # finish line torn by a crash so the next unit starts on its own line
+            self._file.write("\n")
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def _load(self) -> bool:
+        if not os.path.exists(self.path):
+            return True
+        with open(self.path, encoding="utf-8") as f:
+            contents = f.read()
+        for line in contents.splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # partial line from a crash while recording, unit wasn't completed
+                continue
+            self._add(entry["unit"], entry["entity"], date.fromisoformat(entry["date"]))
+        return contents == "" or contents.endswith("\n")
+
+    def _add(self, unit: str, entity: str, dt: date):
+        self._completed.add((unit, entity, dt))
+        last_date = self._last_dates.get((unit, entity))
+        if last_date is None or dt > last_date:
+            self._last_dates[(unit, entity)] = dt
+
+    def is_complete(self, unit: Any, entity: Any, dt: date) -> bool:
+        """
+        Checks if a unit has been recorded as complete
+
+        :param unit: measure type or tracking shot filter name
+        :param entity: player, team or opponent
+        :param dt: date
+        """
+        return (_get_name(unit), _get_name(entity), dt) in self._completed
+
+    def get_last_date(self, unit: Any, entity: Any) -> Optional[date]:
+        """
+        Gets the latest completed date for a measure type or filter name and entity.
+        None if no dates are complete.
+        """
+        return self._last_dates.get((_get_name(unit), _get_name(entity)))
+
+    def record(self, unit: Any, entity: Any, dt: date):
+        """
+        Records a unit as complete. Returns once the entry is synced to disk.
+        """
+        unit = _get_name(unit)
+        entity = _get_name(entity)
+        line = json.dumps({"unit": unit, "entity": entity, "date": dt.isoformat()})
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._add(unit, entity, dt)
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def get_final_date(final_after_days: int = DEFAULT_FINAL_AFTER_DAYS) -> date:
+    """
+    Gets the latest date whose stats are considered final
+
+    :param final_after_days: (optional) days after a game date until stats for that date are
+        final. Defaults to the response cache default.
+    """
+    return date.today() - timedelta(days=final_after_days)
+
+
+def get_pending_dates(
+    journal: CheckpointJournal,
+    unit: Any,
+    entity: Any,
+    date_from: date,
+    date_to: date,
+    incremental: bool = False,
+) -> List[date]:
+    """
+    Gets dates between two dates that aren't complete in the journal
+
+    :param journal: checkpoint journal
+    :param unit: measure type or tracking shot filter name
+    :param entity: player, team or opponent
+    :param date_from: start date
+    :param date_to: end date
+    :param incremental: (optional) only get dates after the last completed date.
+        Defaults to False, which also gets gaps before the last completed date.
+    """
+    if incremental:
+        last_date = journal.get_last_date(unit, entity)
+        if last_date is not None:
+            date_from = max(date_from, last_date + timedelta(days=1))
+    if date_from > date_to:
+        return []
+    return [
+        dt.date()
+        for dt in rrule(DAILY, dtstart=date_from, until=date_to)
+        if not journal.is_complete(unit, entity, dt.date())
+    ]
+
+
+def _backfill(
+    journal: CheckpointJournal,
+    unit: Any,
+    entity: Any,
+    dates: List[date],
+    get_game_logs: Callable[[date], List[Any]],
+    write: Callable[[date, List[Any]], Any],
+    final_date: date,
+) -> List[date]:
+    for dt in dates:
+        write(dt, get_game_logs(dt))
+        # stats for recent dates can still change, get them again next run
+        if dt <= final_date:
+            journal.record(unit, entity, dt)
+    return dates
+
+
+def backfill_tracking_game_logs(
+    journal: CheckpointJournal,
+    measure_type: TrackingMeasureType,
+    player_or_team: PlayerOrTeam,
+    date_from: date,
+    write: Callable[[date, List[Any]], Any],
+    date_to: Optional[date] = None,
+    incremental: bool = False,
+    result_format: ResultFormat = ResultFormat.model,
+    final_after_days: int = DEFAULT_FINAL_AFTER_DAYS,
+) -> List[date]:
+    """
+    Generates game logs for dates that aren't complete in the journal and passes each date's
+    game logs to ``write``. Dates are recorded in the journal once they are written.
+    Returns list of dates that were requested.
+
+    :param journal: checkpoint journal
+    :param measure_type: Stat measure type to get game logs for
+    :param player_or_team: get game logs for player or team
+    :param date_from: start date
+    :param write: function called with date and game logs for the date,
+        ex to insert them in a database. Called with an empty list for dates without games.
+    :param date_to: (optional) end date. Defaults to today.
+    :param incremental: (optional) only request dates after the last completed date.
+        Defaults to False.
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+    :param final_after_days: (optional) days after a game date until stats for that date are
+        final. Dates that aren't final are written but not recorded, so they are requested
+        again on the next run.
+    """
+    dates = get_pending_dates(
+        journal,
+        measure_type,
+        player_or_team,
+        date_from,
+        date_to or date.today(),
+        incremental,
+    )
+
+    def get_game_logs(dt: date) -> List[Any]:
+        return tracking.generate_tracking_game_logs(
+            measure_type, player_or_team, dt, dt, result_format
+        )
+
+    return _backfill(
+        journal,
+        measure_type,
+        player_or_team,
+        dates,
+        get_game_logs,
+        write,
+        get_final_date(final_after_days),
+    )
+
+
+def backfill_tracking_shot_game_logs(
+    journal: CheckpointJournal,
+    name: str,
+    entity_type: tracking_shots.EntityType,
+    date_from: date,
+    write: Callable[[date, List[Any]], Any],
+    date_to: Optional[date] = None,
+    incremental: bool = False,
+    result_format: ResultFormat = ResultFormat.model,
+    final_after_days: int = DEFAULT_FINAL_AFTER_DAYS,
+    **kwargs,
+) -> List[date]:
+    """
+    Tracking shot version of :func:`backfill_tracking_game_logs`
+
+    :param name: name for the filters in the journal, ex ``wide_open``.
+        Use a new name when the filters change.
+    :param entity_type: Get game logs for player, team or opponent
+    :param kwargs: tracking shot filters, see
+        :func:`~nba_stats_tracking.tracking_shots.get_tracking_shot_stats`
+    """
+    dates = get_pending_dates(
+        journal, name, entity_type, date_from, date_to or date.today(), incremental
+    )
+
+    def get_game_logs(dt: date) -> List[Any]:
+        return tracking_shots.generate_tracking_shot_game_logs(
+            entity_type, dt, dt, result_format, **kwargs
+        )
+
+    return _backfill(
+        journal,
+        name,
+        entity_type,
+        dates,
+        get_game_logs,
+        write,
+        get_final_date(final_after_days),
+    )
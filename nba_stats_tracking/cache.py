@@ -0,0 +1,287 @@
+"""Module containing the optional on-disk response cache"""
+
+import gzip
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from nba_stats_tracking.request_key import canonicalize_params, get_request_key
+
+DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+DEFAULT_TTL_HOURS = 6
+# number of days after a game date until stats for that date are considered final. Dates are
+# compared in UTC, so late games on the west coast have finished well before then.
+DEFAULT_FINAL_AFTER_DAYS = 2
+# scoreboard gameStatus for games that are over
+FINAL_GAME_STATUS = 3
+
+CACHE_FILE_EXTENSION = ".json.gz"
+
+
+def get_season_end_year(season: str) -> int:
+    """
+    Gets the year a season ends in
+    ex 2020 for 2019-20
+    """
+    return int(season[:4]) + 1
+
+
+def is_season_final(season: str, today: date) -> bool:
+    """
+    Checks if a season (Format YYYY-YY) is complete.
+    Seasons are treated as complete from November 1st of the year they end in,
+    which leaves room for late finishes like the 2019-20 bubble.
+    """
+    return today >= date(get_season_end_year(season), 11, 1)
+
+
+def get_final_game_ids(response_json: Dict) -> List[str]:
+    """
+    Gets game ids for games that are over from a scoreboard response.
+    Empty for other responses.
+    """
+    scoreboard = response_json.get("scoreboard")
+    if not isinstance(scoreboard, dict):
+        return []
+    return [
+        game["gameId"]
+        for game in scoreboard.get("games", [])
+        if game.get("gameStatus") == FINAL_GAME_STATUS
+    ]
+
+
+def _parse_date(value: str) -> Optional[date]:
+    for date_format in ("%m/%d/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, date_format).date()
+        except ValueError:
+            pass
+    return None
+
+
+class ResponseCache:
+    """
+    Caches json responses on disk, keyed on url and canonicalized request params.
+
+    Responses for requests on a date that is at least `final_after_days` days in the
+    past (in UTC), for a completed season or for a game that a cached scoreboard shows
+    is over, never expire. All other responses expire after `ttl_hours`. When the total size of cached files exceeds `max_bytes` the least
+    recently used responses are removed.
+
+    :param directory: directory to store cached responses in
+    :param max_bytes: max total size of cached responses
+    :param ttl_hours: hours until responses that aren't final expire
+    :param final_after_days: days after a game date until stats for that date are final
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl_hours: float = DEFAULT_TTL_HOURS,
+        final_after_days: int = DEFAULT_FINAL_AFTER_DAYS,
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_hours = ttl_hours
+        self.final_after_days = final_after_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        # game ids of games that are over, from scoreboard responses
+        self._final_game_ids = set()
+        # maps key to file size, ordered from least to most recently used
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _load_index(self):
+        files = []
+        for dir_path, _, file_names in os.walk(self.directory):
+            for file_name in file_names:
+                if file_name.endswith(CACHE_FILE_EXTENSION):
+                    stat = os.stat(os.path.join(dir_path, file_name))
+                    key = file_name[: -len(CACHE_FILE_EXTENSION)]
+                    files.append((stat.st_mtime, key, stat.st_size))
+        for _, key, size in sorted(files):
+            self._index[key] = size
+            self._total_bytes += size
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + CACHE_FILE_EXTENSION)
+
+    def get_ttl(self, params: Dict) -> Optional[float]:
+        """
+        Gets number of seconds until a response for request params expires.
+        None if the response is final and never expires.
+        """
+        params = dict(canonicalize_params(params))
+        game_id = params.get("GameID")
+        with self._lock:
+            if game_id in self._final_game_ids:
+                return None
+        today = datetime.now(timezone.utc).date()
+        for date_param in ("GameDate", "DateTo"):
+            request_date = _parse_date(params.get(date_param, ""))
+            if request_date is not None:
+                if request_date <= today - timedelta(days=self.final_after_days):
+                    return None
+                return self.ttl_hours * 3600
+        season = params.get("Season")
+        if season is None and game_id is not None and len(game_id) == 10:
+            season = f"20{game_id[3:5]}"
+        if season and is_season_final(season, today):
+            return None
+        return self.ttl_hours * 3600
+
+    def get(self, url: str, params: Dict) -> Optional[Dict]:
+        """
+        Gets cached response for request. None if not cached or expired.
+        """
+        key = get_request_key(url, params)
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+        path = self._get_path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self._remove(key, miss=True)
+            return None
+        if entry["expires_at"] is not None and entry["expires_at"] < time.time():
+            self._remove(key, miss=True)
+            return None
+        self._add_final_game_ids(entry["response"])
+        with self._lock:
+            if key in self._index:
+                self._index.move_to_end(key)
+            self.hits += 1
+        try:
+            # file mtime keeps track of recency across processes
+            os.utime(path)
+        except OSError:
+            pass
+        return entry["response"]
+
+    def set(self, url: str, params: Dict, response_json: Dict):
+        """
+        Adds response to cache and evicts least recently used responses if over max_bytes
+        """
+        key = get_request_key(url, params)
+        self._add_final_game_ids(response_json)
+        ttl = self.get_ttl(params)
+        entry = {
+            "url": url,
+            "params": canonicalize_params(params),
+            "expires_at": None if ttl is None else time.time() + ttl,
+            "response": response_json,
+        }
+        path = self._get_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to temp file and rename so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb") as f:
+                f.write(json.dumps(entry).encode("utf-8"))
+            os.replace(temp_path, path)
+        except OSError:
+            self._remove_file_path(temp_path)
+            raise
+        size = os.path.getsize(path)
+        with self._lock:
+            self._total_bytes += size - self._index.pop(key, 0)
+            self._index[key] = size
+            evicted = []
+            while self._total_bytes > self.max_bytes and len(self._index) > 1:
+                evicted_key, evicted_size = self._index.popitem(last=False)
+                self._total_bytes -= evicted_size
+                evicted.append(evicted_key)
+        for evicted_key in evicted:
+            self._remove_file(evicted_key)
+
+    def _add_final_game_ids(self, response_json: Dict):
+        # scoreboards are requested before boxscores, so they mark games as final first
+        final_game_ids = get_final_game_ids(response_json)
+        if final_game_ids:
+            with self._lock:
+                self._final_game_ids.update(final_game_ids)
+
+    def _remove(self, key: str, miss: bool = False):
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+            if miss:
+                self.misses += 1
+        self._remove_file(key)
+
+    def _remove_file(self, key: str):
+        self._remove_file_path(self._get_path(key))
+
+    @staticmethod
+    def _remove_file_path(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Removes all cached responses
+        """
+        with self._lock:
+            keys = list(self._index.keys())
+            self._index.clear()
+            self._total_bytes = 0
+        for key in keys:
+            self._remove_file(key)
+
+
+_response_cache = None
+
+
+def get_cache() -> Optional[ResponseCache]:
+    """
+    Gets the response cache used by all requests. None if caching is disabled.
+    """
+    return _response_cache
+
+
+def set_cache(response_cache: Optional[ResponseCache]):
+    """
+    Replaces the response cache used by all requests. Pass None to disable caching.
+
+    :param response_cache: response cache to use for all requests
+    """
+    global _response_cache
+    _response_cache = response_cache
+
+
+def configure_cache(
+    directory: str,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    ttl_hours: float = DEFAULT_TTL_HOURS,
+    final_after_days: int = DEFAULT_FINAL_AFTER_DAYS,
+):
+    """
+    Enables caching responses on disk for all requests
+
+    :param directory: directory to store cached responses in
+    :param max_bytes: max total size of cached responses
+    :param ttl_hours: hours until responses that aren't final expire
+    :param final_after_days: days after a game date until stats for that date are final
+    """
+    set_cache(ResponseCache(directory, max_bytes, ttl_hours, final_after_days))
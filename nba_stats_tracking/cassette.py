@@ -0,0 +1,177 @@
+"""
+Module for recording requests and responses to a cassette file and replaying them.
+
+A cassette is a gzipped file with one json line per request containing the endpoint,
+canonicalized params, response and number of seconds the request took.
+"""
+
+import copy
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, Optional
+
+from nba_stats_tracking import transport
+from nba_stats_tracking.request_key import canonicalize_params, get_endpoint
+
+
+def read_cassette(path: str) -> Iterator[Dict]:
+    """
+    Reads recorded requests from a cassette file
+
+    :param path: path to cassette file
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RecordingTransport(transport.Transport):
+    """
+    Sends requests through another transport and writes each request and response
+    to a cassette file. Call :meth:`close` when done to finish writing the file.
+
+    :param path: path to cassette file. Existing files are overwritten.
+    :param wrapped: (optional) transport to send requests through.
+        Defaults to :class:`~nba_stats_tracking.transport.RequestsTransport`
+    """
+
+    def __init__(self, path: str, wrapped: Optional[transport.Transport] = None):
+        self.path = path
+        self.wrapped = wrapped if wrapped is not None else transport.RequestsTransport()
+        self.rate_limited = self.wrapped.rate_limited
+        self.recorded = 0
+        self._lock = threading.Lock()
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    def get_json(self, url: str, params: Dict) -> Optional[Dict]:
+        start = time.monotonic()
+        response_json = self.wrapped.get_json(url, params)
+        elapsed = time.monotonic() - start
+        line = json.dumps(
+            {
+                "endpoint": get_endpoint(url),
+                "params": dict(canonicalize_params(params)),
+                "elapsed": round(elapsed, 4),
+                "response": response_json,
+            }
+        )
+        with self._lock:
+            if not self._file.closed:
+                self._file.write(line + "\n")
+                self.recorded += 1
+        return response_json
+
+    def close(self):
+        with self._lock:
+            self._file.close()
+
+
+class CassetteTransport(transport.Transport):
+    """
+    Serves responses recorded to a cassette file. Requests are matched on endpoint
+    and canonicalized params, if a request was recorded more than once the last
+    response is used. Requests that weren't recorded raise
+    :class:`~nba_stats_tracking.transport.MissingResponseError`.
+
+    :param path: path to cassette file
+    :param simulate_latency: (optional) wait as long as the recorded request took
+        before returning a response. Defaults to False.
+    :param latency_scale: (optional) multiplier for simulated latency. Defaults to 1.
+    """
+
+    rate_limited = False
+
+    def __init__(
+        self, path: str, simulate_latency: bool = False, latency_scale: float = 1.0
+    ):
+        self.path = path
+        self.simulate_latency = simulate_latency
+        self.latency_scale = latency_scale
+        self._entries = {}
+        for entry in read_cassette(path):
+            key = transport.get_replay_key(entry["endpoint"], entry["params"])
+            self._entries[key] = entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_json(self, url: str, params: Dict) -> Optional[Dict]:
+        key = transport.get_replay_key(url, params)
+        entry = self._entries.get(key)
+        if entry is None:
+            raise transport.MissingResponseError(
+                f"No recorded response for {key[0]} {dict(key[1])}"
+            )
+        if self.simulate_latency and entry["elapsed"] > 0:
+            time.sleep(entry["elapsed"] * self.latency_scale)
+        # copy so callers that modify a response don't change later replays
+        return copy.deepcopy(entry["response"])
+
+
+def export_cassette(path: str, directory: str) -> int:
+    """
+    Writes responses in a cassette to json files in a directory with a manifest.json,
+    laid out so it can be served by :class:`~nba_stats_tracking.transport.ReplayTransport`.
+    Returns number of responses written.
+
+    :param path: path to cassette file
+    :param directory: directory to write response files and manifest.json to
+    """
+    manifest = {}
+    for entry in read_cassette(path):
+        key = transport.get_replay_key(entry["endpoint"], entry["params"])
+        digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+        file_path = f"{key[0]}/{digest}.json"
+        os.makedirs(os.path.join(directory, key[0]), exist_ok=True)
+        with open(os.path.join(directory, file_path), "w") as f:
+            json.dump(entry["response"], f)
+        manifest[key] = {
+            "endpoint": entry["endpoint"],
+            "params": entry["params"],
+            "path": file_path,
+        }
+    with open(os.path.join(directory, transport.MANIFEST_FILE_NAME), "w") as f:
+        json.dump(list(manifest.values()), f, indent=4)
+    return len(manifest)
+
+
+def start_recording(path: str) -> RecordingTransport:
+    """
+    Records all requests sent through the current transport to a cassette file
+    until :func:`stop_recording` is called
+
+    :param path: path to cassette file. Existing files are overwritten.
+    """
+    recorder = RecordingTransport(path, transport.get_transport())
+    transport.set_transport(recorder)
+    return recorder
+
+
+def stop_recording():
+    """
+    Finishes writing the cassette file and goes back to the transport
+    that was being recorded
+    """
+    recorder = transport.get_transport()
+    if isinstance(recorder, RecordingTransport):
+        recorder.close()
+        transport.set_transport(recorder.wrapped)
+
+
+def configure_cassette_replay(
+    path: str, simulate_latency: bool = False, latency_scale: float = 1.0
+):
+    """
+    Serves all responses from a cassette file instead of stats.nba.com
+
+    :param path: path to cassette file
+    :param simulate_latency: (optional) wait as long as the recorded request took
+        before returning a response. Defaults to False.
+    :param latency_scale: (optional) multiplier for simulated latency. Defaults to 1.
+    """
+    transport.set_transport(CassetteTransport(path, simulate_latency, latency_scale))
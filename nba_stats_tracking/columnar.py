@@ -0,0 +1,149 @@
+"""
+Module for parsing response result sets into typed columns without building a model per row.
+
+Numeric columns are NumPy arrays when NumPy is installed (``pip install nba_stats_tracking[numpy]``),
+otherwise stdlib :class:`array.array`. String columns are lists.
+"""
+
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Type
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+
+def get_alias_field_map(item_class: Type[BaseModel]) -> Dict[str, Any]:
+    """
+    Gets dict mapping response header to model field for an item model
+    """
+    return {field.alias: field for field in item_class.__fields__.values()}
+
+
+def make_column(values: Sequence, field_type: type, fill_value: Optional[float]):
+    """
+    Converts a list of values to a typed column
+
+    :param values: column values
+    :param field_type: int, float or str
+    :param fill_value: value for missing numeric values. When None, missing values make
+        int columns float and are filled with nan.
+
+    Whole number floats in int columns (ex ``AGE`` is ``24.0`` in some responses) are
+    converted to ints. Other floats make int columns float.
+    """
+    if field_type not in (int, float):
+        return list(values)
+    if any(value is None for value in values):
+        if fill_value is None:
+            field_type = float
+            fill_value = float("nan")
+        values = [fill_value if value is None else value for value in values]
+    if field_type is int:
+        if all(float(value).is_integer() for value in values):
+            values = [int(value) for value in values]
+        else:
+            field_type = float
+    if np is not None:
+        return np.array(values, dtype=np.int64 if field_type is int else np.float64)
+    return array("q" if field_type is int else "d", values)
+
+
+class ColumnarResults:
+    """
+    Response result set parsed into one typed column per model field.
+
+    Columns are keyed by model field name (ex ``drives`` for the ``DRIVES`` header).
+    Missing stat values are 0, like the `set_*` validators on the models. Item models
+    are only built when asked for, with :meth:`get_item` or :meth:`to_items`.
+
+    Results can also be built from existing columns with :meth:`from_columns`,
+    ex aggregated columns from :mod:`nba_stats_tracking.aggregation`.
+
+    :param item_class: item model for rows (ex :class:`~nba_stats_tracking.models.tracking.DrivesItem`)
+    :param headers: response result set headers
+    :param rows: response result set rows
+    """
+
+    def __init__(
+        self,
+        item_class: Type[BaseModel],
+        headers: List[str],
+        rows: List[List[Any]],
+    ):
+        self.item_class = item_class
+        self.headers = headers
+        self.rows = rows
+        self.columns = {}
+        alias_field_map = get_alias_field_map(item_class)
+        for index, header in enumerate(headers):
+            field = alias_field_map.get(header)
+            if field is None:
+                continue
+            values = [row[index] for row in rows]
+            fill_value = 0 if field.default == 0 else None
+            self.columns[field.name] = make_column(values, field.type_, fill_value)
+        self._length = len(rows)
+
+    @classmethod
+    def from_result_set(
+        cls, item_class: Type[BaseModel], result_set: Dict
+    ) -> "ColumnarResults":
+        """
+        Parses a result set (ex ``response_json["resultSets"][0]``)
+        """
+        return cls(
+            item_class, result_set.get("headers", []), result_set.get("rowSet", [])
+        )
+
+    @classmethod
+    def from_columns(
+        cls, item_class: Type[BaseModel], columns: Dict[str, Any]
+    ) -> "ColumnarResults":
+        """
+        Creates results from columns keyed by model field name. All columns must be the same length.
+        """
+        results = cls(item_class, [], [])
+        results.headers = None
+        results.rows = None
+        results.columns = dict(columns)
+        results._length = len(next(iter(columns.values()))) if columns else 0
+        return results
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, name: str):
+        return self.columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.columns
+
+    def get_item(self, index: int) -> BaseModel:
+        """
+        Builds item model for a row
+        """
+        if self.rows is not None:
+            return self.item_class(**dict(zip(self.headers, self.rows[index])))
+        fields = self.item_class.__fields__
+        values = {}
+        for name, column in self.columns.items():
+            value = column[index]
+            # convert numpy scalars to python values
+            values[fields[name].alias] = (
+                value.item() if hasattr(value, "item") else value
+            )
+        return self.item_class(**values)
+
+    def iter_items(self) -> Iterator[BaseModel]:
+        for index in range(self._length):
+            yield self.get_item(index)
+
+    def to_items(self) -> List[BaseModel]:
+        """
+        Builds item models for all rows
+        """
+        return list(self.iter_items())
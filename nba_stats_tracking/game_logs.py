@@ -0,0 +1,325 @@
+"""
+Module for generating game logs for multiple tracking measure types and tracking shot filters
+in one pass over dates. Scoreboard and boxscore maps for each date are only resolved once and
+shared by all measure types and filters.
+"""
+
+import asyncio
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+from dateutil.rrule import DAILY, rrule
+
+from nba_stats_tracking import ASYNC_CONCURRENCY, helpers, tracking, tracking_shots
+from nba_stats_tracking.models.request import PerMode, ResultFormat, SeasonType
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+
+
+class DateGames(NamedTuple):
+    """
+    Season and maps for setting game log ids for games on a date
+    """
+
+    season: str
+    season_type: SeasonType
+    team_id_game_id_map: Dict
+    team_id_opponent_team_id_map: Dict
+    player_id_team_id_map: Dict
+
+
+def make_date_games(
+    team_id_game_id_map: Dict,
+    team_id_opponent_team_id_map: Dict,
+    player_id_team_id_map: Dict,
+) -> DateGames:
+    date_game_id = list(team_id_game_id_map.values())[0]
+    return DateGames(
+        helpers.get_season_from_game_id(date_game_id),
+        helpers.get_season_type_from_game_id(date_game_id),
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+        player_id_team_id_map,
+    )
+
+
+def get_date_games(dt: date, player_or_team: PlayerOrTeam) -> Optional[DateGames]:
+    """
+    Gets season and maps for games on a date. None if there are no games.
+    Boxscores for the player id to team id map are only requested for player game logs.
+
+    :param dt: date
+    :param player_or_team: player or team game logs
+    """
+    (
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+    ) = helpers.get_team_id_maps_for_date(dt)
+    if len(team_id_game_id_map) == 0:
+        return None
+    player_id_team_id_map = {}
+    if player_or_team == PlayerOrTeam.player:
+        player_id_team_id_map = helpers.get_memoized_player_team_map_for_date(dt)
+    return make_date_games(
+        team_id_game_id_map, team_id_opponent_team_id_map, player_id_team_id_map
+    )
+
+
+async def async_get_date_games(
+    dt: date, player_or_team: PlayerOrTeam, semaphore: asyncio.Semaphore
+) -> Optional[DateGames]:
+    """
+    Async version of :func:`get_date_games`
+    """
+    (
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+    ) = await helpers.async_get_team_id_maps_for_date(dt, semaphore=semaphore)
+    if len(team_id_game_id_map) == 0:
+        return None
+    player_id_team_id_map = {}
+    if player_or_team == PlayerOrTeam.player:
+        player_id_team_id_map = (
+            await helpers.async_get_memoized_player_team_map_for_date(
+                dt, semaphore=semaphore
+            )
+        )
+    return make_date_games(
+        team_id_game_id_map, team_id_opponent_team_id_map, player_id_team_id_map
+    )
+
+
+def get_shot_entity_type(player_or_team: PlayerOrTeam) -> tracking_shots.EntityType:
+    return tracking_shots.EntityType(PlayerOrTeam(player_or_team).value.lower())
+
+
+def get_date_kwargs(dt: date) -> Dict[str, str]:
+    return {"DateFrom": dt.strftime("%m/%d/%Y"), "DateTo": dt.strftime("%m/%d/%Y")}
+
+
+def check_shot_filters(shot_filters: Dict[str, Dict]):
+    """
+    Raises ValueError if any shot filters have dates, game logs are requested for each date
+    """
+    for filter_name, filters in shot_filters.items():
+        date_filters = [name for name in ("DateFrom", "DateTo") if name in filters]
+        if date_filters:
+            raise ValueError(
+                f"Shot filters {filter_name} can't have {date_filters}, "
+                "use date_from and date_to instead"
+            )
+
+
+def set_measure_game_log_ids(
+    game_logs: List[Any], player_or_team: PlayerOrTeam, games: DateGames
+):
+    tracking.set_game_log_ids(
+        game_logs,
+        player_or_team,
+        games.team_id_game_id_map,
+        games.team_id_opponent_team_id_map,
+        games.player_id_team_id_map,
+    )
+
+
+def set_shot_game_log_ids(
+    game_logs: List[Any], player_or_team: PlayerOrTeam, games: DateGames
+):
+    tracking_shots.set_game_log_ids(
+        game_logs,
+        get_shot_entity_type(player_or_team),
+        games.team_id_game_id_map,
+        games.team_id_opponent_team_id_map,
+        games.player_id_team_id_map,
+    )
+
+
+def generate_game_logs(
+    player_or_team: PlayerOrTeam,
+    date_from: date,
+    date_to: date,
+    measure_types: List[TrackingMeasureType],
+    shot_filters: Optional[Dict[str, Dict]] = None,
+    result_format: ResultFormat = ResultFormat.model,
+) -> Dict[Union[TrackingMeasureType, str], List[Any]]:
+    """
+    Generates game logs for multiple measure types and tracking shot filters for all games
+    between two dates. Returns dict mapping each measure type and shot filter name to game logs.
+    Requests for all measure types and shot filters for a date are made concurrently on a
+    thread pool once the date's maps are resolved. Use :func:`async_generate_game_logs` to
+    also process dates concurrently.
+
+    :param player_or_team: get game logs for player or team
+    :param date_from: start date
+    :param date_to: end date
+    :param measure_types: Stat measure types to get game logs for
+    :param shot_filters: (optional) dict mapping a name to tracking shot filters, ex
+        ``{"wide_open": {"CloseDefDistRange": [CloseDefDist.range_6_plus_ft]}}``.
+        See :func:`~nba_stats_tracking.tracking_shots.get_tracking_shot_stats` for filters,
+        other than DateFrom and DateTo, which raise ValueError.
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+    """
+    shot_filters = shot_filters or {}
+    check_shot_filters(shot_filters)
+    game_logs = {key: [] for key in itertools.chain(measure_types, shot_filters)}
+    request_count = len(measure_types) + len(shot_filters)
+    with ThreadPoolExecutor(
+        max_workers=max(1, min(request_count, ASYNC_CONCURRENCY)),
+        thread_name_prefix="nba_stats_tracking_game_logs",
+    ) as executor:
+        for dt in rrule(DAILY, dtstart=date_from, until=date_to):
+            date_game_logs = _get_game_logs_for_date(
+                executor, player_or_team, dt, measure_types, shot_filters, result_format
+            )
+            for key, key_game_logs in date_game_logs.items():
+                game_logs[key] += key_game_logs
+    return game_logs
+
+
+def _get_game_logs_for_date(
+    executor: ThreadPoolExecutor,
+    player_or_team: PlayerOrTeam,
+    dt: date,
+    measure_types: List[TrackingMeasureType],
+    shot_filters: Dict[str, Dict],
+    result_format: ResultFormat,
+) -> Dict[Union[TrackingMeasureType, str], List[Any]]:
+    games = get_date_games(dt, player_or_team)
+    if games is None:
+        return {}
+    entity_type = get_shot_entity_type(player_or_team)
+    measure_requests = [
+        executor.submit(
+            tracking.get_tracking_stats,
+            measure_type,
+            [games.season],
+            [games.season_type],
+            player_or_team,
+            result_format,
+            # User per game here because it gives results to more decimal places
+            PerMode=PerMode.per_game,  # camel case to match request param key
+            **get_date_kwargs(dt),
+        )
+        for measure_type in measure_types
+    ]
+    shot_requests = [
+        executor.submit(
+            tracking_shots.get_tracking_shot_stats,
+            entity_type,
+            [games.season],
+            [games.season_type],
+            result_format,
+            **{**filters, **get_date_kwargs(dt)},
+        )
+        for filters in shot_filters.values()
+    ]
+    results = [request.result() for request in measure_requests + shot_requests]
+    return _make_date_game_logs(
+        player_or_team, games, measure_types, shot_filters, results
+    )
+
+
+def _make_date_game_logs(
+    player_or_team: PlayerOrTeam,
+    games: DateGames,
+    measure_types: List[TrackingMeasureType],
+    shot_filters: Dict[str, Dict],
+    results: List[List[Any]],
+) -> Dict[Union[TrackingMeasureType, str], List[Any]]:
+    # results are stats for each measure type followed by each shot filter
+    entity_type = get_shot_entity_type(player_or_team)
+    game_logs = {}
+    for measure_type, measure_game_logs in zip(measure_types, results):
+        set_measure_game_log_ids(measure_game_logs, player_or_team, games)
+        game_logs[measure_type] = measure_game_logs
+    for name, shot_stats in zip(shot_filters, results[len(measure_types) :]):
+        shot_game_logs = tracking_shots.sum_tracking_shot_totals(
+            entity_type, shot_stats
+        )
+        set_shot_game_log_ids(shot_game_logs, player_or_team, games)
+        game_logs[name] = shot_game_logs
+    return game_logs
+
+
+async def async_generate_game_logs(
+    player_or_team: PlayerOrTeam,
+    date_from: date,
+    date_to: date,
+    measure_types: List[TrackingMeasureType],
+    shot_filters: Optional[Dict[str, Dict]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+) -> Dict[Union[TrackingMeasureType, str], List[Any]]:
+    """
+    Async version of :func:`generate_game_logs`
+    All dates are processed concurrently, and requests for all measure types and shot filters
+    for a date are made concurrently once its maps are resolved. Game logs are in date order.
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    shot_filters = shot_filters or {}
+    check_shot_filters(shot_filters)
+    game_logs_by_date = await asyncio.gather(
+        *[
+            _async_get_game_logs_for_date(
+                player_or_team,
+                dt,
+                measure_types,
+                shot_filters,
+                semaphore,
+                result_format,
+            )
+            for dt in rrule(DAILY, dtstart=date_from, until=date_to)
+        ]
+    )
+    game_logs = {key: [] for key in itertools.chain(measure_types, shot_filters)}
+    for date_game_logs in game_logs_by_date:
+        for key, key_game_logs in date_game_logs.items():
+            game_logs[key] += key_game_logs
+    return game_logs
+
+
+async def _async_get_game_logs_for_date(
+    player_or_team: PlayerOrTeam,
+    dt: date,
+    measure_types: List[TrackingMeasureType],
+    shot_filters: Dict[str, Dict],
+    semaphore: asyncio.Semaphore,
+    result_format: ResultFormat,
+) -> Dict[Union[TrackingMeasureType, str], List[Any]]:
+    games = await async_get_date_games(dt, player_or_team, semaphore)
+    if games is None:
+        return {}
+    entity_type = get_shot_entity_type(player_or_team)
+    measure_requests = [
+        tracking.async_get_tracking_stats(
+            measure_type,
+            [games.season],
+            [games.season_type],
+            player_or_team,
+            semaphore=semaphore,
+            result_format=result_format,
+            # User per game here because it gives results to more decimal places
+            PerMode=PerMode.per_game,  # camel case to match request param key
+            **get_date_kwargs(dt),
+        )
+        for measure_type in measure_types
+    ]
+    shot_requests = [
+        tracking_shots.async_get_tracking_shot_stats(
+            entity_type,
+            [games.season],
+            [games.season_type],
+            semaphore=semaphore,
+            result_format=result_format,
+            **{**filters, **get_date_kwargs(dt)},
+        )
+        for filters in shot_filters.values()
+    ]
+    results = await asyncio.gather(*measure_requests, *shot_requests)
+    return _make_date_game_logs(
+        player_or_team, games, measure_types, shot_filters, results
+    )
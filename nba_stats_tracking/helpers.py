@@ -1,31 +1,193 @@
-from datetime import date
-from typing import Dict, List, Tuple
+import asyncio
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Tuple
 
 import requests
 
-from nba_stats_tracking import HEADERS, REQUEST_TIMEOUT
+from nba_stats_tracking import (
+    ASYNC_CONCURRENCY,
+    cache,
+    player_team_index,
+    rate_limit,
+    retry,
+    schedule,
+    session,
+    single_flight,
+    transport,
+)
 from nba_stats_tracking.models import SeasonType
 from nba_stats_tracking.models.boxscore import (
     BoxscoreRequestParameters,
     BoxscoreResults,
 )
+from nba_stats_tracking.models.game_log import LeagueGameLogRequestParameters
+from nba_stats_tracking.models.schedule import ScheduleRequestParameters
 from nba_stats_tracking.models.scoreboard import (
     ScoreboardRequestParameters,
     ScoreboardResults,
 )
+from nba_stats_tracking.player_team_map import PlayerTeamMapBuilder
+from nba_stats_tracking.request_key import get_request_key
+
+# Scoreboards and player/team maps are memoized by date so game logs for multiple
+# measure types, entity types and filters on the same date only request them once
+DATE_MAPS_MEMO_SIZE = 128
 
 
-def get_json_response(url: str, params: Dict) -> Dict:
+class DateMemo:
+    """
+    Thread safe, size bounded LRU memo of values keyed by date
+
+    :param maxsize: max number of dates to keep values for
+    """
+
+    def __init__(self, maxsize: int = DATE_MAPS_MEMO_SIZE):
+        self.maxsize = maxsize
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(game_date: date) -> date:
+        # rrule yields datetimes, which don't compare equal to dates
+        if isinstance(game_date, datetime):
+            return game_date.date()
+        return game_date
+
+    def get(self, game_date: date) -> Optional[Any]:
+        key = self._get_key(game_date)
+        with self._lock:
+            if key not in self._values:
+                return None
+            self._values.move_to_end(key)
+            return self._values[key]
+
+    def set(self, game_date: date, value: Any):
+        key = self._get_key(game_date)
+        with self._lock:
+            self._values[key] = value
+            self._values.move_to_end(key)
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def invalidate(self, game_date: Optional[date] = None):
+        """
+        Removes value for date, or values for all dates if game_date is None
+        """
+        with self._lock:
+            if game_date is None:
+                self._values.clear()
+            else:
+                self._values.pop(self._get_key(game_date), None)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+_scoreboard_memo = DateMemo()
+_player_team_map_memo = DateMemo()
+
+
+def clear_date_maps(game_date: Optional[date] = None):
+    """
+    Clears memoized scoreboards and player/team maps. Use this to pick up changes
+    for games that were in progress when they were first requested.
+
+    :param game_date: (optional) only clear maps for this date. Defaults to all dates.
+    """
+    _scoreboard_memo.invalidate(game_date)
+    _player_team_map_memo.invalidate(game_date)
+
+
+def get_json_response(
+    url: str,
+    params: Dict,
+    http_session: Optional[requests.Session] = None,
+    rate_limited: bool = False,
+) -> Dict:
     """
     Helper function to get json response for request
+
+    :param url: endpoint url
+    :param params: query string parameters
+    :param http_session: (optional) session to make the request with. Defaults to the
+        shared transport from :mod:`nba_stats_tracking.transport`, which sends requests
+        with the shared session from :mod:`nba_stats_tracking.session`
+    :param rate_limited: (optional) wait for the shared rate limiter from
+        :mod:`nba_stats_tracking.rate_limit` before making the request. Defaults to False.
+        Responses served from the cache don't wait.
+
+    Timeouts, connection errors, 429 and 5xx responses are retried with the shared
+    retry policy from :mod:`nba_stats_tracking.retry` and all requests wait while its
+    circuit breaker is open. Other errors are raised right away.
+
+    Concurrent calls for the same url and equivalent params share a single request and
+    the same parsed response, which must not be modified. Calls with their own
+    ``http_session`` aren't shared, since it may have different auth or proxy settings.
     """
-    response = requests.get(
-        url, params=params, headers=HEADERS, timeout=REQUEST_TIMEOUT
+    response_cache = cache.get_cache()
+    if response_cache is not None:
+        cached_response = response_cache.get(url, params)
+        if cached_response is not None:
+            return cached_response
+
+    if http_session is not None:
+        return _get_json_response_with_retries(url, params, http_session, rate_limited)
+    return single_flight.get_single_flight().do(
+        get_request_key(url, params),
+        _get_json_response_with_retries,
+        url,
+        params,
+        http_session,
+        rate_limited,
     )
-    if response.status_code == 200:
-        return response.json()
-    else:
-        response.raise_for_status()
+
+
+def _get_json_response_with_retries(
+    url: str,
+    params: Dict,
+    http_session: Optional[requests.Session] = None,
+    rate_limited: bool = False,
+) -> Dict:
+    response_cache = cache.get_cache()
+    rate_limiter = rate_limit.get_rate_limiter()
+    attempt = 0
+    while True:
+        retry.wait_until_closed()
+        if _is_rate_limited(rate_limited) and rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            response_json = _request_json(url, params, http_session)
+        except requests.RequestException as e:
+            backoff = retry.record_failure(e, attempt)
+            if backoff is None:
+                raise
+            time.sleep(backoff)
+            attempt += 1
+            continue
+        retry.record_success()
+        if response_cache is not None and response_json is not None:
+            response_cache.set(url, params, response_json)
+        return response_json
+
+
+def _request_json(
+    url: str, params: Dict, http_session: Optional[requests.Session] = None
+) -> Optional[Dict]:
+    """
+    Makes a single request through the shared transport without checking the cache or retrying
+    """
+    if http_session is not None:
+        return transport.RequestsTransport(http_session).get_json(url, params)
+    return transport.get_transport().get_json(url, params)
+
+
+def _is_rate_limited(rate_limited: bool) -> bool:
+    return rate_limited and transport.get_transport().rate_limited
 
 
 def get_scoreboard_response_json_for_date(game_date: date) -> Dict:
@@ -41,12 +203,54 @@ def get_scoreboard_response_json_for_date(game_date: date) -> Dict:
     return response_json["scoreboard"]
 
 
+def get_schedule_response_json_for_season(season: str) -> Dict:
+    """
+    Gets response data for schedule endpoint
+
+    :param season: Format YYYY-YY ex 2019-20
+    """
+    parameters = ScheduleRequestParameters(Season=season)
+
+    response_json = get_json_response(
+        "https://stats.nba.com/stats/scheduleleaguev2", parameters.dict(by_alias=True)
+    )
+
+    return response_json["leagueSchedule"]
+
+
+def get_scheduled_scoreboard_for_date(game_date: date) -> Optional[ScoreboardResults]:
+    """
+    Gets scoreboard for a date from the schedule index. None if the schedule index is
+    disabled or might not have all games on the date yet.
+    """
+    schedule_index = schedule.get_schedule_index()
+    if schedule_index is None:
+        return None
+    return schedule_index.get_scoreboard_for_date(
+        game_date, get_schedule_response_json_for_season
+    )
+
+
+def get_scoreboard_results_for_date(game_date: date) -> ScoreboardResults:
+    """
+    Gets scoreboard for a given date. Scoreboards are memoized by date.
+    Games are read from the schedule index when it is enabled.
+    """
+    scoreboard_result = _scoreboard_memo.get(game_date)
+    if scoreboard_result is None:
+        scoreboard_result = get_scheduled_scoreboard_for_date(game_date)
+        if scoreboard_result is None:
+            results = get_scoreboard_response_json_for_date(game_date)
+            scoreboard_result = ScoreboardResults(**results)
+        _scoreboard_memo.set(game_date, scoreboard_result)
+    return scoreboard_result
+
+
 def get_game_ids_for_date(game_date: date) -> List[str]:
     """
     Gets game ids for all games played on a given date
     """
-    results = get_scoreboard_response_json_for_date(game_date)
-    scoreboard_result = ScoreboardResults(**results)
+    scoreboard_result = get_scoreboard_results_for_date(game_date)
     return [game.game_id for game in scoreboard_result.games]
 
 
@@ -98,8 +302,14 @@ def get_team_id_maps_for_date(game_date: date) -> Tuple[Dict, Dict]:
     Creates dicts mapping team id to game id and team id
     to opponent team id for games on a given date
     """
-    results = get_scoreboard_response_json_for_date(game_date)
-    scoreboard_result = ScoreboardResults(**results)
+    return make_team_id_maps(get_scoreboard_results_for_date(game_date))
+
+
+def make_team_id_maps(scoreboard_result: ScoreboardResults) -> Tuple[Dict, Dict]:
+    """
+    Creates dicts mapping team id to game id and team id
+    to opponent team id for games on a scoreboard
+    """
     team_id_game_id_map = {}
     team_id_opponent_id_map = {}
     for game in scoreboard_result.games:
@@ -124,15 +334,329 @@ def make_player_team_map_for_game(boxscore_data: BoxscoreResults) -> Dict:
     return player_game_team_map
 
 
+def get_league_game_log_results_for_season(
+    season: str, season_type: SeasonType
+) -> Dict:
+    """
+    Gets player game logs for all games in a season from league game log endpoint
+
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: season type
+    """
+    parameters = LeagueGameLogRequestParameters(Season=season, SeasonType=season_type)
+
+    response_json = get_json_response(
+        "https://stats.nba.com/stats/leaguegamelog", parameters.dict(by_alias=True)
+    )
+
+    return response_json["resultSets"][0]
+
+
+def get_indexed_player_team_map_for_date(
+    game_date: date, game_ids: List[str]
+) -> Optional[Dict]:
+    """
+    Gets dict mapping player id to team id for games on a date from the player/team index.
+    None if the index is disabled or doesn't have the date yet.
+
+    :param game_date: date
+    :param game_ids: game ids for games on the date
+    """
+    index = player_team_index.get_player_team_index()
+    if index is None:
+        return None
+    season_filters = {
+        (get_season_from_game_id(game_id), get_season_type_from_game_id(game_id))
+        for game_id in game_ids
+    }
+    if any(season_type is None for _, season_type in season_filters):
+        # preseason and all star games aren't in league game logs
+        return None
+    return index.get_player_team_map_for_date(
+        game_date, season_filters, get_league_game_log_results_for_season
+    )
+
+
+def get_memoized_player_team_map_for_date(game_date: date) -> Dict:
+    """
+    Gets dict mapping player id to team id for all games on a given date
+    Maps are memoized by date and returned without copying, so they shouldn't be modified.
+    Maps are read from the player/team index when it is enabled, otherwise boxscores for all
+    games on the date are requested concurrently.
+    """
+    player_game_team_map = _player_team_map_memo.get(game_date)
+    if player_game_team_map is None:
+        game_ids = get_game_ids_for_date(game_date)
+        player_game_team_map = get_indexed_player_team_map_for_date(game_date, game_ids)
+        if player_game_team_map is None:
+            builder = PlayerTeamMapBuilder()
+            for results in _get_boxscore_responses(game_ids):
+                builder.add_boxscore(BoxscoreResults(**results))
+            player_game_team_map = builder.build()
+        _player_team_map_memo.set(game_date, player_game_team_map)
+    return player_game_team_map
+
+
+def _get_boxscore_responses(game_ids: List[str]) -> List[Dict]:
+    # boxscores in game id order, requested concurrently under the shared rate limit
+    if len(game_ids) <= 1:
+        return [get_boxscore_response_for_game(game_id) for game_id in game_ids]
+    with ThreadPoolExecutor(
+        max_workers=min(len(game_ids), ASYNC_CONCURRENCY),
+        thread_name_prefix="nba_stats_tracking_boxscore",
+    ) as executor:
+        return list(executor.map(get_boxscore_response_for_game, game_ids))
+
+
 def get_player_team_map_for_date(game_date: date) -> Dict:
     """
     Creates a dict mapping player id to team id for all games on a given date
+    Use :func:`get_memoized_player_team_map_for_date` to get the memoized map without copying it.
+    """
+    # return a copy so changes made by the caller don't affect the memoized map
+    return dict(get_memoized_player_team_map_for_date(game_date))
+
+
+# async versions of the functions above
+# requests are made on a dedicated thread pool so they don't tie up the event loop's
+# default executor, with the number of requests in flight bounded by a semaphore
+_async_executor = None
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    global _async_executor
+    if _async_executor is None:
+        _async_executor = ThreadPoolExecutor(
+            max_workers=session.get_pool_size(),
+            thread_name_prefix="nba_stats_tracking",
+        )
+    return _async_executor
+
+
+def get_semaphore(semaphore: Optional[asyncio.Semaphore] = None) -> asyncio.Semaphore:
+    """
+    Returns semaphore if set, otherwise a new semaphore allowing
+    ASYNC_CONCURRENCY requests in flight at once
+    """
+    if semaphore is None:
+        return asyncio.Semaphore(ASYNC_CONCURRENCY)
+    return semaphore
+
+
+async def async_iter_in_order(
+    awaitables: Iterable[Awaitable], ahead: int = ASYNC_CONCURRENCY
+) -> AsyncIterator[Any]:
+    """
+    Yields results of awaitables in order, running up to ``ahead`` of them at once.
+    Awaitables are only started as earlier results are consumed, so results that haven't
+    been consumed yet don't pile up in memory. Unfinished awaitables are cancelled if the
+    consumer stops early.
+
+    :param awaitables: iterable of awaitables, ex a generator of coroutines
+    :param ahead: (optional) max number of awaitables running at once.
+        Defaults to ASYNC_CONCURRENCY.
+    """
+    awaitables = iter(awaitables)
+    pending = deque(map(asyncio.ensure_future, itertools.islice(awaitables, ahead)))
+    try:
+        while pending:
+            result = await pending.popleft()
+            # start the next one before yielding so it runs while the result is consumed
+            pending.extend(map(asyncio.ensure_future, itertools.islice(awaitables, 1)))
+            yield result
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def async_get_json_response(
+    url: str,
+    params: Dict,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    rate_limited: bool = False,
+) -> Dict:
+    """
+    Async version of :func:`get_json_response`
+
+    :param url: endpoint url
+    :param params: query string parameters
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    :param rate_limited: (optional) wait for the shared rate limiter before making
+        the request. Defaults to False.
+    """
+    response_cache = cache.get_cache()
+    if response_cache is not None:
+        cached_response = response_cache.get(url, params)
+        if cached_response is not None:
+            return cached_response
+
+    return await single_flight.get_single_flight().async_do(
+        get_request_key(url, params),
+        _async_get_json_response_with_retries,
+        url,
+        params,
+        semaphore,
+        rate_limited,
+    )
+
+
+async def _async_get_json_response_with_retries(
+    url: str,
+    params: Dict,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    rate_limited: bool = False,
+) -> Dict:
+    response_cache = cache.get_cache()
+    semaphore = get_semaphore(semaphore)
+    loop = asyncio.get_running_loop()
+    rate_limiter = rate_limit.get_rate_limiter()
+    attempt = 0
+    while True:
+        await retry.async_wait_until_closed()
+        try:
+            async with semaphore:
+                if _is_rate_limited(rate_limited) and rate_limiter is not None:
+                    await rate_limiter.async_acquire()
+                response_json = await loop.run_in_executor(
+                    _get_async_executor(), _request_json, url, params
+                )
+        except requests.RequestException as e:
+            backoff = retry.record_failure(e, attempt)
+            if backoff is None:
+                raise
+            # wait outside the semaphore so other requests can go ahead
+            await asyncio.sleep(backoff)
+            attempt += 1
+            continue
+        retry.record_success()
+        if response_cache is not None and response_json is not None:
+            response_cache.set(url, params, response_json)
+        return response_json
+
+
+async def async_get_scoreboard_response_json_for_date(
+    game_date: date, semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict:
+    """
+    Async version of :func:`get_scoreboard_response_json_for_date`
+    """
+    parameters = ScoreboardRequestParameters(GameDate=game_date)
+
+    response_json = await async_get_json_response(
+        "https://stats.nba.com/stats/scoreboardV3",
+        parameters.dict(by_alias=True),
+        semaphore=semaphore,
+    )
+
+    return response_json["scoreboard"]
+
+
+async def async_get_scoreboard_results_for_date(
+    game_date: date, semaphore: Optional[asyncio.Semaphore] = None
+) -> ScoreboardResults:
+    """
+    Async version of :func:`get_scoreboard_results_for_date`
     """
-    player_game_team_map = {}
-    game_ids = get_game_ids_for_date(game_date)
-    for game_id in game_ids:
-        results = get_boxscore_response_for_game(game_id)
-        boxscore_data = BoxscoreResults(**results)
-        player_game_team_map_for_game = make_player_team_map_for_game(boxscore_data)
-        player_game_team_map = {**player_game_team_map, **player_game_team_map_for_game}
+    scoreboard_result = _scoreboard_memo.get(game_date)
+    if scoreboard_result is None:
+        if schedule.get_schedule_index() is not None:
+            # schedule is only requested once per season, don't block the event loop on it
+            scoreboard_result = await asyncio.get_running_loop().run_in_executor(
+                _get_async_executor(), get_scheduled_scoreboard_for_date, game_date
+            )
+        if scoreboard_result is None:
+            results = await async_get_scoreboard_response_json_for_date(
+                game_date, semaphore=semaphore
+            )
+            scoreboard_result = ScoreboardResults(**results)
+        _scoreboard_memo.set(game_date, scoreboard_result)
+    return scoreboard_result
+
+
+async def async_get_game_ids_for_date(
+    game_date: date, semaphore: Optional[asyncio.Semaphore] = None
+) -> List[str]:
+    """
+    Async version of :func:`get_game_ids_for_date`
+    """
+    scoreboard_result = await async_get_scoreboard_results_for_date(
+        game_date, semaphore=semaphore
+    )
+    return [game.game_id for game in scoreboard_result.games]
+
+
+async def async_get_boxscore_response_for_game(
+    game_id: str, semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict:
+    """
+    Async version of :func:`get_boxscore_response_for_game`
+    """
+    parameters = BoxscoreRequestParameters(GameID=game_id)
+
+    response_json = await async_get_json_response(
+        "https://stats.nba.com/stats/boxscoretraditionalv3",
+        parameters.dict(by_alias=True),
+        semaphore=semaphore,
+    )
+
+    return response_json["boxScoreTraditional"]
+
+
+async def async_get_team_id_maps_for_date(
+    game_date: date, semaphore: Optional[asyncio.Semaphore] = None
+) -> Tuple[Dict, Dict]:
+    """
+    Async version of :func:`get_team_id_maps_for_date`
+    """
+    scoreboard_result = await async_get_scoreboard_results_for_date(
+        game_date, semaphore=semaphore
+    )
+    return make_team_id_maps(scoreboard_result)
+
+
+async def async_get_memoized_player_team_map_for_date(
+    game_date: date, semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict:
+    """
+    Async version of :func:`get_memoized_player_team_map_for_date`
+    Boxscores for all games on the date are requested concurrently
+    """
+    player_game_team_map = _player_team_map_memo.get(game_date)
+    if player_game_team_map is None:
+        semaphore = get_semaphore(semaphore)
+        game_ids = await async_get_game_ids_for_date(game_date, semaphore=semaphore)
+        if player_team_index.get_player_team_index() is not None:
+            # game logs are only requested once per season, don't block the event loop on it
+            player_game_team_map = await asyncio.get_running_loop().run_in_executor(
+                _get_async_executor(),
+                get_indexed_player_team_map_for_date,
+                game_date,
+                game_ids,
+            )
+        if player_game_team_map is None:
+            boxscores = await asyncio.gather(
+                *[
+                    async_get_boxscore_response_for_game(game_id, semaphore=semaphore)
+                    for game_id in game_ids
+                ]
+            )
+            builder = PlayerTeamMapBuilder()
+            for results in boxscores:
+                builder.add_boxscore(BoxscoreResults(**results))
+            player_game_team_map = builder.build()
+        _player_team_map_memo.set(game_date, player_game_team_map)
     return player_game_team_map
+
+
+async def async_get_player_team_map_for_date(
+    game_date: date, semaphore: Optional[asyncio.Semaphore] = None
+) -> Dict:
+    """
+    Async version of :func:`get_player_team_map_for_date`
+    Boxscores for all games on the date are requested concurrently
+    """
+    return dict(
+        await async_get_memoized_player_team_map_for_date(
+            game_date, semaphore=semaphore
+        )
+    )
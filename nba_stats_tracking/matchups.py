@@ -1,3 +1,6 @@
+import asyncio
+from typing import Optional
+
 from nba_stats_tracking import helpers
 from nba_stats_tracking.models.matchups import MatchupResults, MatchupsRequestParameters
 
@@ -20,3 +23,26 @@ def get_matchup_results_for_game_id(game_id: str) -> MatchupResults:
     )
 
     return MatchupResults(**response_json["boxScoreMatchups"])
+
+
+async def async_get_matchup_results_for_game_id(
+    game_id: str, semaphore: Optional[asyncio.Semaphore] = None
+) -> MatchupResults:
+    """
+    Async version of :func:`get_matchup_results_for_game_id`
+
+    :param str game_id: nba.com game id
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    :return: matchup results
+    :rtype: MatchupResults
+    """
+    url = "https://stats.nba.com/stats/boxscorematchupsv3"
+    parameters = MatchupsRequestParameters(
+        GameID=game_id,
+    )
+
+    response_json = await helpers.async_get_json_response(
+        url, parameters.dict(by_alias=True, exclude_none=True), semaphore=semaphore
+    )
+
+    return MatchupResults(**response_json["boxScoreMatchups"])
@@ -1,6 +1,13 @@
-from nba_stats_tracking.models.request import PerMode, SeasonType
+from nba_stats_tracking.models.request import (
+    PerMode,
+    ResultFormat,
+    SeasonType,
+    WorkerType,
+)
 
 __all__ = [
     "PerMode",
+    "ResultFormat",
     "SeasonType",
+    "WorkerType",
 ]
@@ -0,0 +1,179 @@
+"""
+Declarative field metadata for item models.
+
+Stat fields are declared with how they combine when items are added up:
+
+* :func:`additive_field` - counting stats that are summed, ex ``fga``
+* :func:`weighted_average_field` - averages weighted by another field, ex ``avg_speed`` by ``minutes``
+* :class:`Ratio` - derived stats computed from totals, ex ``fg3pct`` is ``fg3m / fg3a``
+
+Item models subclass :class:`StatsItem`, which generates ``__add__`` and ``__iadd__`` from the
+metadata once when the model class is created. Missing values for stat fields are set to 0.
+The same metadata is used by :mod:`nba_stats_tracking.aggregation` for vectorized aggregation.
+"""
+
+from typing import Any, Dict, Optional, Tuple, Union
+
+from pydantic import BaseModel, Field, validator
+
+ADDITIVE = "additive"
+WEIGHTED_AVERAGE = "weighted_average"
+
+
+def additive_field(alias: Optional[str] = None, default: Any = 0) -> Any:
+    """
+    Field for a stat that is summed when items are added
+
+    :param alias: response header, ex ``FGA``
+    :param default: (optional) value when the header isn't in the response. Defaults to 0.
+    """
+    return Field(default=default, alias=alias, aggregation=ADDITIVE)
+
+
+def weighted_average_field(
+    alias: Optional[str] = None, weight: str = "minutes", default: Any = 0
+) -> Any:
+    """
+    Field for a stat that is an average, weighted by another field when items are added
+
+    :param alias: response header, ex ``AVG_SPEED``
+    :param weight: (optional) field the average is weighted by. Defaults to ``minutes``.
+    :param default: (optional) value when the header isn't in the response. Defaults to 0.
+    """
+    return Field(
+        default=default, alias=alias, aggregation=WEIGHTED_AVERAGE, weight=weight
+    )
+
+
+def get_field_aggregation(field) -> Optional[str]:
+    """
+    Gets ADDITIVE or WEIGHTED_AVERAGE for a model field, None for other fields (ex ids)
+    """
+    return field.field_info.extra.get("aggregation")
+
+
+def get_field_weight(field) -> Optional[str]:
+    """
+    Gets the field a weighted average field is weighted by
+    """
+    return field.field_info.extra.get("weight")
+
+
+class Ratio(property):
+    """
+    Derived stat computed from the totals of other fields. 0 when the denominator is 0.
+
+    :param numerator: field name, or dict mapping field names to coefficients,
+        ex ``{"fgm": 1, "fg3m": 0.5}`` for ``fgm + 0.5 * fg3m``
+    :param denominator: field name
+    """
+
+    def __init__(self, numerator: Union[str, Dict[str, float]], denominator: str):
+        if isinstance(numerator, str):
+            numerator = {numerator: 1}
+        self.numerator = dict(numerator)
+        self.denominator = denominator
+        super().__init__(self._get)
+
+    def _get(self, item: Any) -> float:
+        denominator = getattr(item, self.denominator)
+        if denominator == 0:
+            return 0
+        return self.compute(item) / denominator
+
+    def get_value(self, values: Dict[str, Any]) -> float:
+        """
+        Computes the ratio from a dict of field values, ex a response row keyed by field name
+        """
+        denominator = values[self.denominator]
+        if not denominator:
+            return 0
+        return self.compute(values) / denominator
+
+    def compute(self, item: Any) -> Any:
+        # numerator for an item, or for columns when item is a dict of columns
+        if isinstance(item, dict):
+            values = [
+                item[name] * coefficient for name, coefficient in self.numerator.items()
+            ]
+        else:
+            values = [
+                getattr(item, name) * coefficient
+                for name, coefficient in self.numerator.items()
+            ]
+        return sum(values[1:], values[0])
+
+
+def get_ratios(item_class: type) -> Dict[str, Ratio]:
+    """
+    Gets derived ratio stats for an item model, keyed by name
+    """
+    return {
+        name: value
+        for klass in reversed(item_class.__mro__)
+        for name, value in vars(klass).items()
+        if isinstance(value, Ratio)
+    }
+
+
+def _make_iadd(additive: Tuple[str, ...], weighted: Tuple[Tuple[str, str], ...]):
+    # build __iadd__ source once per model, like dataclasses do for __init__
+    lines = ["def __iadd__(self, other):"]
+    # averages are weighted before their weights are summed
+    for name, weight in weighted:
+        lines += [
+            f"    weight = self.{weight} + other.{weight}",
+            "    if weight != 0:",
+            f"        self.{name} = (",
+            f"            self.{name} * self.{weight} + other.{name} * other.{weight}",
+            "        ) / weight",
+        ]
+    lines += [f"    self.{name} += other.{name}" for name in additive]
+    lines.append("    return self")
+    namespace = {}
+    exec("\n".join(lines), {}, namespace)
+    return namespace["__iadd__"]
+
+
+def fill_missing_stat(cls, v, field):
+    """
+    Validator that sets missing values for stat fields to 0
+    """
+    if v is None and get_field_aggregation(field) is not None:
+        return 0
+    return v
+
+
+class StatsItem(BaseModel):
+    """
+    Base class for item models with stat fields declared with :func:`additive_field`,
+    :func:`weighted_average_field` and :class:`Ratio`
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        additive = tuple(
+            field.name
+            for field in cls.__fields__.values()
+            if get_field_aggregation(field) == ADDITIVE
+        )
+        weighted = tuple(
+            (field.name, get_field_weight(field))
+            for field in cls.__fields__.values()
+            if get_field_aggregation(field) == WEIGHTED_AVERAGE
+        )
+        iadd = _make_iadd(additive, weighted)
+        iadd.__qualname__ = f"{cls.__name__}.__iadd__"
+        cls.__iadd__ = iadd
+
+    # if value from request is None, set it to 0
+    set_missing_stats = validator("*", pre=True, allow_reuse=True)(fill_missing_stat)
+
+    def __add__(self, other):
+        # add to a copy so neither item is changed
+        total = self.copy()
+        total += other
+        return total
+
+    def __getitem__(self, item):
+        return getattr(self, item)
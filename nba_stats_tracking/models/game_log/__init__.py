@@ -0,0 +1,5 @@
+from nba_stats_tracking.models.game_log.request import LeagueGameLogRequestParameters
+
+__all__ = [
+    "LeagueGameLogRequestParameters",
+]
@@ -0,0 +1,21 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+from nba_stats_tracking.models.request import LeagueID, SeasonType
+
+
+class LeagueGameLogRequestParameters(BaseModel):
+    # Required Fields
+    season: str = Field(alias="Season")
+    season_type: SeasonType = Field(alias="SeasonType")
+    player_or_team: str = Field(default="P", alias="PlayerOrTeam")  # P or T
+    league_id: LeagueID = Field(default=LeagueID.nba, alias="LeagueID")
+
+    # Optional Fields that need to be in the request
+    # These will use the default value in the request if unset
+    counter: Optional[int] = Field(default=0, alias="Counter")
+    direction: Optional[str] = Field(default="ASC", alias="Direction")
+    sorter: Optional[str] = Field(default="DATE", alias="Sorter")
+    date_from: Optional[str] = Field(default="", alias="DateFrom")  # MM/DD/YYYY
+    date_to: Optional[str] = Field(default="", alias="DateTo")  # MM/DD/YYYY
@@ -0,0 +1,204 @@
+"""
+Lazy alternative to the Results dataclasses that only builds item models for rows that are used
+"""
+
+import bisect
+import itertools
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+
+class _Segment:
+    # rows from a single response with the same headers and extra attributes
+    __slots__ = ("headers", "header_index", "rows", "extra")
+
+    def __init__(self, headers: List[str], rows: List[List[Any]], extra: Dict):
+        self.headers = headers
+        self.header_index = {header: index for index, header in enumerate(headers)}
+        self.rows = rows
+        self.extra = extra
+
+
+class LazyResults(Sequence):
+    """
+    Keeps raw response ``headers`` and ``rowSet`` and builds an item for a row only when the
+    row is accessed. Items are cached, so changes made to them are kept.
+
+    Supports ``len``, indexing, iteration, filtering with :meth:`filter` and column access with
+    :meth:`column`. Results for multiple responses (ex multiple seasons) can be combined with ``+``.
+
+    :param item_class: item model to build for rows
+    :param headers: response result set headers
+    :param rows: response result set rows
+    :param extra: (optional) attributes to set on every item, ex ``{"season": "2019-20 Playoffs"}``
+    """
+
+    def __init__(
+        self,
+        item_class: Type[BaseModel],
+        headers: Optional[List[str]] = None,
+        rows: Optional[List[List[Any]]] = None,
+        extra: Optional[Dict] = None,
+    ):
+        self.item_class = item_class
+        self._segments: List[_Segment] = []
+        # offset of first row of each segment
+        self._offsets: List[int] = []
+        self._length = 0
+        self._items: Dict[int, Any] = {}
+        if rows:
+            self._add_segment(_Segment(headers, rows, extra or {}))
+
+    @classmethod
+    def from_result_set(
+        cls,
+        item_class: Type[BaseModel],
+        result_set: Dict,
+        extra: Optional[Dict] = None,
+    ) -> "LazyResults":
+        """
+        Creates lazy results for a result set (ex ``response_json["resultSets"][0]``)
+        """
+        return cls(
+            item_class,
+            result_set.get("headers", []),
+            result_set.get("rowSet", []),
+            extra,
+        )
+
+    @classmethod
+    def concat(
+        cls, item_class: Type[BaseModel], results: Iterable["LazyResults"]
+    ) -> "LazyResults":
+        """
+        Combines lazy results without building any items
+        """
+        combined = cls(item_class)
+        for result in results:
+            combined += result
+        return combined
+
+    def _add_segment(self, segment: _Segment):
+        self._segments.append(segment)
+        self._offsets.append(self._length)
+        self._length += len(segment.rows)
+
+    def __add__(self, other: "LazyResults") -> "LazyResults":
+        combined = LazyResults(self.item_class)
+        combined += self
+        combined += other
+        return combined
+
+    def __iadd__(self, other: "LazyResults") -> "LazyResults":
+        if not isinstance(other, LazyResults):
+            return NotImplemented
+        offset = self._length
+        for segment in other._segments:
+            self._add_segment(segment)
+        # keep items that have already been built
+        for index, item in other._items.items():
+            self._items[offset + index] = item
+        return self
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def built_count(self) -> int:
+        """
+        Number of rows that items have been built for
+        """
+        return len(self._items)
+
+    def _locate(self, index: int):
+        segment_index = bisect.bisect_right(self._offsets, index) - 1
+        segment = self._segments[segment_index]
+        return segment, segment.rows[index - self._offsets[segment_index]]
+
+    def _get_item(self, index: int) -> Any:
+        item = self._items.get(index)
+        if item is None:
+            segment, row = self._locate(index)
+            item = self.item_class(**dict(zip(segment.headers, row)))
+            for name, value in segment.extra.items():
+                setattr(item, name, value)
+            self._items[index] = item
+        return item
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._get_item(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("LazyResults index out of range")
+        return self._get_item(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(self._length):
+            yield self._get_item(index)
+
+    def _get_alias(self, name: str) -> str:
+        field = self.item_class.__fields__.get(name)
+        return field.alias if field is not None else name
+
+    def _iter_raw_values(self, name: str) -> Iterator[Any]:
+        alias = self._get_alias(name)
+        index = 0
+        for segment in self._segments:
+            header_position = segment.header_index.get(alias)
+            for row in segment.rows:
+                item = self._items.get(index)
+                if item is not None:
+                    yield getattr(item, name)
+                elif name in segment.extra:
+                    yield segment.extra[name]
+                elif header_position is not None:
+                    yield row[header_position]
+                else:
+                    yield None
+                index += 1
+
+    def column(self, name: str) -> List[Any]:
+        """
+        Gets values of a field for all rows without building items.
+        Raw response values are returned for rows that items haven't been built for.
+
+        :param name: field name, ex ``player_id``
+        """
+        return list(self._iter_raw_values(name))
+
+    def filter(self, **criteria) -> List[Any]:
+        """
+        Gets items for rows matching all criteria. Only items for matching rows are built.
+        ex ``results.filter(player_id=203507)`` or ``results.filter(team_id=1610612749)``
+        All items are returned when there are no criteria.
+        """
+        if not criteria:
+            return self.to_list()
+        matches = None
+        for name, value in criteria.items():
+            column_matches = {
+                index
+                for index, row_value in enumerate(self._iter_raw_values(name))
+                if row_value == value
+            }
+            matches = column_matches if matches is None else matches & column_matches
+        return [self._get_item(index) for index in sorted(matches)]
+
+    def to_list(self) -> List[Any]:
+        """
+        Builds items for all rows
+        """
+        return list(self)
+
+
+def concat_results(results: List[Any]) -> Union[List[Any], LazyResults]:
+    """
+    Combines lists of parsed items. Lazy results are combined without building items.
+    """
+    if results and all(isinstance(result, LazyResults) for result in results):
+        return LazyResults.concat(results[0].item_class, results)
+    return list(itertools.chain.from_iterable(results))
@@ -16,3 +16,14 @@ class LeagueID(str, Enum):
     nba = "00"
     wnba = "10"  # unused for tracking stats but including it in case they ever are
     gleague = "20"  # unused for tracking stats but including it in case they ever are
+
+
+class ResultFormat(str, Enum):
+    model = "model"  # pydantic models
+    slotted = "slotted"  # lightweight __slots__ items, see models.slotted
+    lazy = "lazy"  # pydantic models built when rows are accessed, see models.lazy
+
+
+class WorkerType(str, Enum):
+    thread = "thread"  # worker threads in this process
+    process = "process"  # worker processes, results are pickled back to this process
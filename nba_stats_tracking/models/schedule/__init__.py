@@ -0,0 +1,8 @@
+from nba_stats_tracking.models.schedule.request import ScheduleRequestParameters
+from nba_stats_tracking.models.schedule.schedule import GameDateItem, ScheduleResults
+
+__all__ = [
+    "ScheduleRequestParameters",
+    "GameDateItem",
+    "ScheduleResults",
+]
@@ -0,0 +1,9 @@
+from pydantic import BaseModel, Field
+
+from nba_stats_tracking.models.request import LeagueID
+
+
+class ScheduleRequestParameters(BaseModel):
+    # Required Fields
+    season: str = Field(alias="Season")
+    league_id: LeagueID = Field(default=LeagueID.nba, alias="LeagueID")
@@ -0,0 +1,23 @@
+from datetime import date, datetime
+from typing import List
+
+from pydantic import BaseModel, Field, validator
+
+from nba_stats_tracking.models.scoreboard import GameItem
+
+
+class GameDateItem(BaseModel):
+    game_date: date = Field(alias="gameDate")
+    games: List[GameItem] = Field(alias="games")
+
+    @validator("game_date", pre=True)
+    def parse_game_date(cls, v):
+        # ex 02/02/2020 00:00:00
+        if isinstance(v, str):
+            return datetime.strptime(v[:10], "%m/%d/%Y").date()
+        return v
+
+
+class ScheduleResults(BaseModel):
+    season: str = Field(alias="seasonYear")
+    game_dates: List[GameDateItem] = Field(alias="gameDates")
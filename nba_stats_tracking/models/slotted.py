@@ -0,0 +1,203 @@
+"""
+Lightweight ``__slots__`` based alternatives to the pydantic item models.
+
+:func:`get_slotted_item_class` builds a class with the same attribute names, derived
+properties, ``__add__`` and ``__iadd__`` as an item model. Values are converted to the
+field type and the model's validators are applied, but there is no other validation.
+Instances use less memory and are much faster to build than pydantic models.
+"""
+
+import types
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+from pydantic.class_validators import make_generic_validator
+
+from nba_stats_tracking.models import fields
+
+_MISSING = object()
+
+# dunder methods of item models that are shared with slotted items
+SHARED_METHODS = ("__add__", "__iadd__", "__getitem__")
+
+_slotted_item_classes: Dict[Type[BaseModel], type] = {}
+
+
+def _make_converter(field, model_class: Type[BaseModel]) -> Callable[[Any], Any]:
+    field_type = field.type_
+    config = model_class.__config__
+    fill_missing = fields.get_field_aggregation(field) is not None
+    pre_validators = []
+    validators = []
+    for validator in field.class_validators.values():
+        if validator.func is fields.fill_missing_stat:
+            # applied inline with fill_missing, it's called for every field
+            continue
+        generic_validator = make_generic_validator(validator.func)
+        if validator.pre:
+            pre_validators.append(generic_validator)
+        else:
+            validators.append(generic_validator)
+
+    def convert(value):
+        for func in pre_validators:
+            value = func(model_class, value, {}, field, config)
+        if value is None:
+            if fill_missing:
+                value = 0
+        elif field_type in (int, float, str) and type(value) is not field_type:
+            value = field_type(value)
+        for func in validators:
+            value = func(model_class, value, {}, field, config)
+        return value
+
+    if (
+        not pre_validators
+        and not validators
+        and not fill_missing
+        and field_type not in (int, float, str)
+    ):
+        return lambda value: value
+    return convert
+
+
+class SlottedItem:
+    """
+    Base class for slotted items. Use :func:`get_slotted_item_class` to create subclasses.
+    """
+
+    __slots__ = ()
+    # (field name, alias, default, required, converter) for each model field
+    _fields: Tuple[Tuple[str, str, Any, bool, Callable], ...] = ()
+    model_class: Optional[Type[BaseModel]] = None
+
+    def __init__(self, **kwargs):
+        for name, alias, default, required, convert in self._fields:
+            value = kwargs.get(alias, kwargs.get(name, _MISSING))
+            if value is _MISSING:
+                if required:
+                    raise ValueError(f"{alias} is required")
+                value = default
+            else:
+                value = convert(value)
+            setattr(self, name, value)
+
+    @classmethod
+    def from_rows(
+        cls, headers: List[str], rows: List[List[Any]]
+    ) -> List["SlottedItem"]:
+        """
+        Builds items from response result set headers and rows
+        """
+        header_index = {header: index for index, header in enumerate(headers)}
+        plan = []
+        for name, alias, default, required, convert in cls._fields:
+            index = header_index.get(alias, header_index.get(name))
+            if index is None and required:
+                raise ValueError(f"{alias} is required")
+            plan.append((name, index, default, convert))
+        items = []
+        new = object.__new__
+        for row in rows:
+            item = new(cls)
+            for name, index, default, convert in plan:
+                if index is None:
+                    setattr(item, name, default)
+                else:
+                    setattr(item, name, convert(row[index]))
+            items.append(item)
+        return items
+
+    def dict(self, by_alias: bool = False) -> Dict[str, Any]:
+        return {
+            alias if by_alias else name: getattr(self, name)
+            for name, alias, _, _, _ in self._fields
+        }
+
+    def copy(self) -> "SlottedItem":
+        """
+        Gets a shallow copy of the item, like the pydantic model ``copy``
+        """
+        item = object.__new__(type(self))
+        for name, _, _, _, _ in self._fields:
+            setattr(item, name, getattr(self, name))
+        return item
+
+    def to_model(self) -> BaseModel:
+        """
+        Converts item to the pydantic model it was created from
+        """
+        return self.model_class(**self.dict(by_alias=True))
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for name, _, _, _, _ in self._fields
+        )
+
+    def __repr__(self):
+        values = ", ".join(
+            f"{name}={getattr(self, name)!r}" for name, _, _, _, _ in self._fields
+        )
+        return f"{type(self).__name__}({values})"
+
+    def __reduce__(self):
+        # slotted classes are created at runtime so pickle them by their model class
+        values = tuple(getattr(self, name) for name, _, _, _, _ in self._fields)
+        return _restore_slotted_item, (self.model_class, values)
+
+
+def _restore_slotted_item(model_class: Type[BaseModel], values: Tuple) -> SlottedItem:
+    slotted_class = get_slotted_item_class(model_class)
+    item = object.__new__(slotted_class)
+    for (name, _, _, _, _), value in zip(slotted_class._fields, values):
+        setattr(item, name, value)
+    return item
+
+
+def get_slotted_item_class(item_class: Type[BaseModel]) -> type:
+    """
+    Gets slotted version of an item model, ex SlottedDrivesItem for DrivesItem.
+    Properties and methods (ex ``pts_per_drive``, ``__add__``) are shared with the model.
+
+    :param item_class: pydantic item model
+    """
+    slotted_class = _slotted_item_classes.get(item_class)
+    if slotted_class is not None:
+        return slotted_class
+
+    fields = tuple(
+        (
+            field.name,
+            field.alias,
+            field.default,
+            field.required,
+            _make_converter(field, item_class),
+        )
+        for field in item_class.__fields__.values()
+    )
+    namespace = {
+        "__slots__": tuple(field[0] for field in fields),
+        "__module__": __name__,
+        "_fields": fields,
+        "model_class": item_class,
+    }
+    # share derived properties, operators and other methods with the model
+    # include methods inherited from base classes of the model, ex StatsItem
+    model_classes = [
+        klass
+        for klass in reversed(item_class.__mro__)
+        if issubclass(klass, BaseModel) and klass is not BaseModel
+    ]
+    for klass in model_classes:
+        for attr_name, value in vars(klass).items():
+            if isinstance(value, property) or (
+                isinstance(value, types.FunctionType)
+                and (attr_name in SHARED_METHODS or attr_name[0] != "_")
+            ):
+                namespace[attr_name] = value
+    slotted_class = type(f"Slotted{item_class.__name__}", (SlottedItem,), namespace)
+    _slotted_item_classes[item_class] = slotted_class
+    return slotted_class
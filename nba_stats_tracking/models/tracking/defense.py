@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from nba_stats_tracking.models.fields import Ratio, StatsItem, additive_field
 
-class DefenseItem(BaseModel):
+
+class DefenseItem(StatsItem):
     # Only for player stats
     player_id: Optional[int] = Field(alias="PLAYER_ID")
     player_name: Optional[str] = Field(alias="PLAYER_NAME")
@@ -21,36 +23,17 @@ class DefenseItem(BaseModel):
 
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
-    games_played: int = Field(default=0, alias="GP")
-    wins: int = Field(default=0, alias="W")
-    losses: int = Field(default=0, alias="L")
-    minutes: float = Field(default=0, alias="MIN")
-    steals: float = Field(default=0, alias="STL")
-    blocks: float = Field(default=0, alias="BLK")
-    dreb: float = Field(default=0, alias="DREB")
-    def_rim_fga: float = Field(default=0, alias="DEF_RIM_FGA")
-    def_rim_fgm: float = Field(default=0, alias="DEF_RIM_FGM")
-
-    @property
-    def def_rim_fgpct(self):
-        if self.def_rim_fga == 0:
-            return 0
-        return self.def_rim_fgm / self.def_rim_fga
-
-    def __add__(self, other):
-        self.games_played += other.games_played
-        self.wins += other.wins
-        self.losses += other.losses
-        self.minutes += other.minutes
-        self.steals += other.steals
-        self.blocks += other.blocks
-        self.dreb += other.dreb
-        self.def_rim_fga += other.def_rim_fga
-        self.def_rim_fgm += other.def_rim_fgm
-        return self
-
-    def __getitem__(self, item):
-        return getattr(self, item)
+    games_played: int = additive_field("GP")
+    wins: int = additive_field("W")
+    losses: int = additive_field("L")
+    minutes: float = additive_field("MIN")
+    steals: float = additive_field("STL")
+    blocks: float = additive_field("BLK")
+    dreb: float = additive_field("DREB")
+    def_rim_fga: float = additive_field("DEF_RIM_FGA")
+    def_rim_fgm: float = additive_field("DEF_RIM_FGM")
+
+    def_rim_fgpct = Ratio("def_rim_fgm", "def_rim_fga")
 
 
 @dataclass
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from nba_stats_tracking.models.fields import StatsItem, additive_field
 
-class EfficiencyItem(BaseModel):
+
+class EfficiencyItem(StatsItem):
     # Only for player stats
     player_id: Optional[int] = Field(alias="PLAYER_ID")
     player_name: Optional[str] = Field(alias="PLAYER_NAME")
@@ -21,34 +23,17 @@ class EfficiencyItem(BaseModel):
 
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
-    games_played: int = Field(default=0, alias="GP")
-    wins: int = Field(default=0, alias="W")
-    losses: int = Field(default=0, alias="L")
-    minutes: float = Field(default=0, alias="MIN")
-    points: float = Field(default=0, alias="POINTS")
-    drive_pts: float = Field(default=0, alias="DRIVE_PTS")
-    catch_shoot_pts: float = Field(default=0, alias="CATCH_SHOOT_PTS")
-    pull_up_pts: float = Field(default=0, alias="PULL_UP_PTS")
-    paint_touch_pts: float = Field(default=0, alias="PAINT_TOUCH_PTS")
-    post_touch_pts: float = Field(default=0, alias="POST_TOUCH_PTS")
-    elbow_touch_pts: float = Field(default=0, alias="ELBOW_TOUCH_PTS")
-
-    def __add__(self, other):
-        self.games_played += other.games_played
-        self.wins += other.wins
-        self.losses += other.losses
-        self.minutes += other.minutes
-        self.points += other.points
-        self.drive_pts += other.drive_pts
-        self.catch_shoot_pts += other.catch_shoot_pts
-        self.pull_up_pts += other.pull_up_pts
-        self.paint_touch_pts += other.paint_touch_pts
-        self.post_touch_pts += other.post_touch_pts
-        self.elbow_touch_pts += other.elbow_touch_pts
-        return self
-
-    def __getitem__(self, item):
-        return getattr(self, item)
+    games_played: int = additive_field("GP")
+    wins: int = additive_field("W")
+    losses: int = additive_field("L")
+    minutes: float = additive_field("MIN")
+    points: float = additive_field("POINTS")
+    drive_pts: float = additive_field("DRIVE_PTS")
+    catch_shoot_pts: float = additive_field("CATCH_SHOOT_PTS")
+    pull_up_pts: float = additive_field("PULL_UP_PTS")
+    paint_touch_pts: float = additive_field("PAINT_TOUCH_PTS")
+    post_touch_pts: float = additive_field("POST_TOUCH_PTS")
+    elbow_touch_pts: float = additive_field("ELBOW_TOUCH_PTS")
 
 
 @dataclass
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from nba_stats_tracking.models.fields import Ratio, StatsItem, additive_field
 
-class PaintTouchesItem(BaseModel):
+
+class PaintTouchesItem(StatsItem):
     # Only for player stats
     player_id: Optional[int] = Field(alias="PLAYER_ID")
     player_name: Optional[str] = Field(alias="PLAYER_NAME")
@@ -21,71 +23,27 @@ class PaintTouchesItem(BaseModel):
 
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
-    games_played: int = Field(default=0, alias="GP")
-    wins: int = Field(default=0, alias="W")
-    losses: int = Field(default=0, alias="L")
-    minutes: float = Field(default=0, alias="MIN")
-    touches: float = Field(default=0, alias="TOUCHES")
-    paint_touches: float = Field(default=0, alias="PAINT_TOUCHES")
-    fgm: float = Field(default=0, alias="PAINT_TOUCH_FGM")
-    fga: float = Field(default=0, alias="PAINT_TOUCH_FGA")
-    ftm: float = Field(default=0, alias="PAINT_TOUCH_FTM")
-    fta: float = Field(default=0, alias="PAINT_TOUCH_FTA")
-    points: float = Field(default=0, alias="PAINT_TOUCH_PTS")
-    passes: float = Field(default=0, alias="PAINT_TOUCH_PASSES")
-    assists: float = Field(default=0, alias="PAINT_TOUCH_AST")
-    turnovers: float = Field(default=0, alias="PAINT_TOUCH_TOV")
-    fouls: float = Field(default=0, alias="PAINT_TOUCH_FOULS")
-
-    @property
-    def pass_pct(self):
-        if self.paint_touches == 0:
-            return 0
-        return self.passes / self.paint_touches
-
-    @property
-    def assist_pct(self):
-        if self.paint_touches == 0:
-            return 0
-        return self.assists / self.paint_touches
-
-    @property
-    def turnover_pct(self):
-        if self.paint_touches == 0:
-            return 0
-        return self.turnovers / self.paint_touches
-
-    @property
-    def foul_pct(self):
-        if self.paint_touches == 0:
-            return 0
-        return self.fouls / self.paint_touches
-
-    @property
-    def pts_per_paint_touch(self):
-        if self.paint_touches == 0:
-            return 0
-        return self.points / self.paint_touches
-
-    def __add__(self, other):
-        self.games_played += other.games_played
-        self.wins += other.wins
-        self.losses += other.losses
-        self.minutes += other.minutes
-        self.touches += other.touches
-        self.paint_touches += other.paint_touches
-        self.fgm += other.fgm
-        self.fga += other.fga
-        self.ftm + other.ftm
-        self.points + other.points
-        self.passes + other.passes
-        self.assists + other.assists
-        self.turnovers + other.turnovers
-        self.fouls + other.fouls
-        return self
-
-    def __getitem__(self, item):
-        return getattr(self, item)
+    games_played: int = additive_field("GP")
+    wins: int = additive_field("W")
+    losses: int = additive_field("L")
+    minutes: float = additive_field("MIN")
+    touches: float = additive_field("TOUCHES")
+    paint_touches: float = additive_field("PAINT_TOUCHES")
+    fgm: float = additive_field("PAINT_TOUCH_FGM")
+    fga: float = additive_field("PAINT_TOUCH_FGA")
+    ftm: float = additive_field("PAINT_TOUCH_FTM")
+    fta: float = additive_field("PAINT_TOUCH_FTA")
+    points: float = additive_field("PAINT_TOUCH_PTS")
+    passes: float = additive_field("PAINT_TOUCH_PASSES")
+    assists: float = additive_field("PAINT_TOUCH_AST")
+    turnovers: float = additive_field("PAINT_TOUCH_TOV")
+    fouls: float = additive_field("PAINT_TOUCH_FOULS")
+
+    pass_pct = Ratio("passes", "paint_touches")
+    assist_pct = Ratio("assists", "paint_touches")
+    turnover_pct = Ratio("turnovers", "paint_touches")
+    foul_pct = Ratio("fouls", "paint_touches")
+    pts_per_paint_touch = Ratio("points", "paint_touches")
 
 
 @dataclass
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from nba_stats_tracking.models.fields import Ratio, StatsItem, additive_field
 
-class PassingItem(BaseModel):
+
+class PassingItem(StatsItem):
     # Only for player stats
     player_id: Optional[int] = Field(alias="PLAYER_ID")
     player_name: Optional[str] = Field(alias="PLAYER_NAME")
@@ -21,55 +23,22 @@ class PassingItem(BaseModel):
 
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
-    games_played: int = Field(default=0, alias="GP")
-    wins: int = Field(default=0, alias="W")
-    losses: int = Field(default=0, alias="L")
-    minutes: float = Field(default=0, alias="MIN")
-    passes_made: Optional[float] = Field(default=0, alias="PASSES_MADE")
-    passes_received: Optional[float] = Field(default=0, alias="PASSES_RECEIVED")
-    assists: Optional[float] = Field(default=0, alias="AST")
-    ft_assists: Optional[float] = Field(default=0, alias="FT_AST")
-    secondary_assists: Optional[float] = Field(default=0, alias="SECONDARY_AST")
-    potential_assists: Optional[float] = Field(default=0, alias="POTENTIAL_AST")
-    adj_assists: Optional[float] = Field(default=0, alias="AST_ADJ")
-    assist_pts: Optional[float] = Field(default=0, alias="AST_POINTS_CREATED")
-
-    @property
-    def pts_per_assist(self):
-        if self.assists == 0:
-            return 0
-        return self.assist_pts / self.assists
-
-    @property
-    def assists_per_pass(self):
-        if self.passes_made == 0:
-            return 0
-        return self.assists / self.passes_made
-
-    @property
-    def potential_assists_per_pass(self):
-        if self.passes_made == 0:
-            return 0
-        return self.potential_assists / self.passes_made
-
-    def __add__(self, other):
-        self.games_played += other.games_played
-        self.wins += other.wins
-        self.losses += other.losses
-        self.minutes += other.minutes
-        self.passes_made += other.passes_made
-        self.passes_received += other.passes_received
-        self.assists += other.assists
-        self.ft_assists += other.ft_assists
-        self.secondary_assists + other.secondary_assists
-        self.potential_assists + other.potential_assists
-        self.adj_assists + other.adj_assists
-        self.assist_pts + other.assist_pts
-
-        return self
-
-    def __getitem__(self, item):
-        return getattr(self, item)
+    games_played: int = additive_field("GP")
+    wins: int = additive_field("W")
+    losses: int = additive_field("L")
+    minutes: float = additive_field("MIN")
+    passes_made: Optional[float] = additive_field("PASSES_MADE")
+    passes_received: Optional[float] = additive_field("PASSES_RECEIVED")
+    assists: Optional[float] = additive_field("AST")
+    ft_assists: Optional[float] = additive_field("FT_AST")
+    secondary_assists: Optional[float] = additive_field("SECONDARY_AST")
+    potential_assists: Optional[float] = additive_field("POTENTIAL_AST")
+    adj_assists: Optional[float] = additive_field("AST_ADJ")
+    assist_pts: Optional[float] = additive_field("AST_POINTS_CREATED")
+
+    pts_per_assist = Ratio("assist_pts", "assists")
+    assists_per_pass = Ratio("assists", "passes_made")
+    potential_assists_per_pass = Ratio("potential_assists", "passes_made")
 
 
 @dataclass
@@ -1,10 +1,17 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from nba_stats_tracking.models.fields import (
+    Ratio,
+    StatsItem,
+    additive_field,
+    weighted_average_field,
+)
 
-class PossessionsItem(BaseModel):
+
+class PossessionsItem(StatsItem):
     # Only for player stats
     player_id: Optional[int] = Field(alias="PLAYER_ID")
     player_name: Optional[str] = Field(alias="PLAYER_NAME")
@@ -21,49 +28,26 @@ class PossessionsItem(BaseModel):
 
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
-    games_played: int = Field(default=0, alias="GP")
-    wins: int = Field(default=0, alias="W")
-    losses: int = Field(default=0, alias="L")
-    minutes: float = Field(default=0, alias="MIN")
-    points: float = Field(default=0, alias="POINTS")
-    touches: float = Field(default=0, alias="TOUCHES")
-    front_court_touches: float = Field(default=0, alias="FRONT_CT_TOUCHES")
-    time_of_poss: float = Field(default=0, alias="TIME_OF_POSS")
-    elbow_touches: float = Field(default=0, alias="ELBOW_TOUCHES")
-    post_touches: float = Field(default=0, alias="POST_TOUCHES")
-    paint_touches: float = Field(default=0, alias="PAINT_TOUCHES")
-
-    seconds_per_touch: float = Field(default=0, alias="AVG_SEC_PER_TOUCH")
-    dribbles_per_touch: float = Field(default=0, alias="AVG_DRIB_PER_TOUCH")
-
-    @property
-    def pts_per_touch(self):
-        if self.touches == 0:
-            return 0
-        return self.points / self.touches
-
-    def __add__(self, other):
-        self.games_played += other.games_played
-        self.wins += other.wins
-        self.losses += other.losses
-        self.minutes += other.minutes
-        self.points += other.points
-        self.touches += other.touches
-        self.front_court_touches += other.front_court_touches
-        self.time_of_poss += other.time_of_poss
-        self.elbow_touches + other.elbow_touches
-        self.post_touches + other.post_touches
-        self.post_touches + other.post_touches
-        self.paint_touches + other.paint_touches
-
-        # when summed, these values are meaningless, set to 0
-        self.seconds_per_touch = 0
-        self.dribbles_per_touch = 0
-
-        return self
-
-    def __getitem__(self, item):
-        return getattr(self, item)
+    games_played: int = additive_field("GP")
+    wins: int = additive_field("W")
+    losses: int = additive_field("L")
+    minutes: float = additive_field("MIN")
+    points: float = additive_field("POINTS")
+    touches: float = additive_field("TOUCHES")
+    front_court_touches: float = additive_field("FRONT_CT_TOUCHES")
+    time_of_poss: float = additive_field("TIME_OF_POSS")
+    elbow_touches: float = additive_field("ELBOW_TOUCHES")
+    post_touches: float = additive_field("POST_TOUCHES")
+    paint_touches: float = additive_field("PAINT_TOUCHES")
+
+    seconds_per_touch: float = weighted_average_field(
+        "AVG_SEC_PER_TOUCH", weight="touches"
+    )
+    dribbles_per_touch: float = weighted_average_field(
+        "AVG_DRIB_PER_TOUCH", weight="touches"
+    )
+
+    pts_per_touch = Ratio("points", "touches")
 
 
 @dataclass
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
 from typing import List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from nba_stats_tracking.models.fields import Ratio, StatsItem, additive_field
 
-class ReboundingItem(BaseModel):
+
+class ReboundingItem(StatsItem):
     # Only for player stats
     player_id: Optional[int] = Field(alias="PLAYER_ID")
     player_name: Optional[str] = Field(alias="PLAYER_NAME")
@@ -21,52 +23,23 @@ class ReboundingItem(BaseModel):
 
     team_id: int = Field(alias="TEAM_ID")
     team_abbreviation: str = Field(alias="TEAM_ABBREVIATION")
-    games_played: int = Field(default=0, alias="GP")
-    wins: int = Field(default=0, alias="W")
-    losses: int = Field(default=0, alias="L")
-    minutes: float = Field(default=0, alias="MIN")
-    oreb: float = Field(default=0, alias="OREB")
-    oreb_contest: float = Field(default=0, alias="OREB_CONTEST")
-    oreb_uncontest: float = Field(default=0, alias="OREB_UNCONTEST")
-    oreb_chances: float = Field(default=0, alias="OREB_CHANCES")
-    oreb_chance_defer: float = Field(default=0, alias="OREB_CHANCE_DEFER")
-    dreb: float = Field(default=0, alias="DREB")
-    dreb_contest: float = Field(default=0, alias="DREB_CONTEST")
-    dreb_uncontest: float = Field(default=0, alias="DREB_UNCONTEST")
-    dreb_chances: float = Field(default=0, alias="DREB_CHANCES")
-    dreb_chance_defer: float = Field(default=0, alias="DREB_CHANCE_DEFER")
-
-    @property
-    def contested_oreb_pct(self):
-        if self.oreb == 0:
-            return 0
-        return self.oreb_contest / self.oreb
-
-    @property
-    def contested_dreb_pct(self):
-        if self.dreb == 0:
-            return 0
-        return self.dreb_contest / self.dreb
-
-    def __add__(self, other):
-        self.games_played += other.games_played
-        self.wins += other.wins
-        self.losses += other.losses
-        self.minutes += other.minutes
-        self.oreb += other.oreb
-        self.oreb_contest += other.oreb_contest
-        self.oreb_uncontest += other.oreb_uncontest
-        self.oreb_chances += other.oreb_chances
-        self.oreb_chance_defer + other.oreb_chance_defer
-        self.dreb + other.dreb
-        self.dreb_contest + other.dreb_contest
-        self.dreb_uncontest + other.dreb_uncontest
-        self.dreb_chances + other.dreb_chances
-        self.dreb_chance_defer + other.dreb_chance_defer
-        return self
-
-    def __getitem__(self, item):
-        return getattr(self, item)
+    games_played: int = additive_field("GP")
+    wins: int = additive_field("W")
+    losses: int = additive_field("L")
+    minutes: float = additive_field("MIN")
+    oreb: float = additive_field("OREB")
+    oreb_contest: float = additive_field("OREB_CONTEST")
+    oreb_uncontest: float = additive_field("OREB_UNCONTEST")
+    oreb_chances: float = additive_field("OREB_CHANCES")
+    oreb_chance_defer: float = additive_field("OREB_CHANCE_DEFER")
+    dreb: float = additive_field("DREB")
+    dreb_contest: float = additive_field("DREB_CONTEST")
+    dreb_uncontest: float = additive_field("DREB_UNCONTEST")
+    dreb_chances: float = additive_field("DREB_CHANCES")
+    dreb_chance_defer: float = additive_field("DREB_CHANCE_DEFER")
+
+    contested_oreb_pct = Ratio("oreb_contest", "oreb")
+    contested_dreb_pct = Ratio("dreb_contest", "dreb")
 
 
 @dataclass
@@ -0,0 +1,238 @@
+"""
+Module containing the optional season player/team index.
+
+When enabled, the player game logs for a season and season type are requested once from the
+``leaguegamelog`` endpoint and the team each player was on for games on a date is read from
+them, instead of requesting ``boxscoretraditionalv3`` for every game on the date.
+
+Indexes are kept in memory and, if a directory is set, stored on disk. Indexes for completed
+seasons never expire. Indexes for seasons that aren't complete are requested again after
+`ttl_hours`, and dates that aren't in them yet fall back to requesting boxscores.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from nba_stats_tracking.cache import DEFAULT_TTL_HOURS, is_season_final
+from nba_stats_tracking.models.request import SeasonType
+
+
+class SeasonPlayerTeams:
+    """
+    Team id for each player id that played on each date of a season and season type
+
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: season type
+    :param player_teams_by_date: dict mapping date to dict mapping player id to team id
+    :param fetched_at: (optional) unix time game logs were requested. Defaults to now.
+    """
+
+    def __init__(
+        self,
+        season: str,
+        season_type: SeasonType,
+        player_teams_by_date: Dict[date, Dict[int, int]],
+        fetched_at: Optional[float] = None,
+    ):
+        self.season = season
+        self.season_type = SeasonType(season_type)
+        self.player_teams_by_date = player_teams_by_date
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    @classmethod
+    def from_result_set(
+        cls, season: str, season_type: SeasonType, result_set: Dict
+    ) -> "SeasonPlayerTeams":
+        """
+        Creates index from the result set of a player leaguegamelog response
+        """
+        headers = result_set["headers"]
+        player_id_index = headers.index("PLAYER_ID")
+        team_id_index = headers.index("TEAM_ID")
+        game_date_index = headers.index("GAME_DATE")
+        player_teams_by_date = {}
+        for row in result_set["rowSet"]:
+            # ex 2020-02-02, some responses include a time
+            game_date = date.fromisoformat(row[game_date_index][:10])
+            player_teams = player_teams_by_date.setdefault(game_date, {})
+            player_teams[row[player_id_index]] = row[team_id_index]
+        return cls(season, season_type, player_teams_by_date)
+
+    def to_json(self) -> Dict:
+        return {
+            "season": self.season,
+            "season_type": self.season_type.value,
+            "fetched_at": self.fetched_at,
+            "player_teams": {
+                game_date.isoformat(): player_teams
+                for game_date, player_teams in self.player_teams_by_date.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "SeasonPlayerTeams":
+        player_teams_by_date = {
+            date.fromisoformat(game_date): {
+                int(player_id): team_id for player_id, team_id in player_teams.items()
+            }
+            for game_date, player_teams in data["player_teams"].items()
+        }
+        return cls(
+            data["season"],
+            data["season_type"],
+            player_teams_by_date,
+            data["fetched_at"],
+        )
+
+
+class PlayerTeamIndex:
+    """
+    Season player/team indexes used to look up the team each player was on for games on a date
+
+    :param directory: (optional) directory to store indexes in. Defaults to only keeping
+        them in memory.
+    :param ttl_hours: (optional) hours until indexes for seasons that aren't complete
+        are requested again
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, ttl_hours: float = DEFAULT_TTL_HOURS
+    ):
+        self.directory = directory
+        self.ttl_hours = ttl_hours
+        self._indexes: Dict[Tuple[str, SeasonType], SeasonPlayerTeams] = {}
+        self._lock = threading.Lock()
+
+    def _get_path(self, season: str, season_type: SeasonType) -> str:
+        file_name = f"{season}-{season_type.value}.json".replace(" ", "")
+        return os.path.join(self.directory, file_name)
+
+    def _is_fresh(self, index: SeasonPlayerTeams) -> bool:
+        if is_season_final(index.season, date.today()):
+            return True
+        return time.time() - index.fetched_at < self.ttl_hours * 3600
+
+    def _load(
+        self, season: str, season_type: SeasonType
+    ) -> Optional[SeasonPlayerTeams]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._get_path(season, season_type)) as f:
+                return SeasonPlayerTeams.from_json(json.loads(f.read()))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save(self, index: SeasonPlayerTeams):
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # write to temp file and rename so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(index.to_json()))
+            os.replace(temp_path, self._get_path(index.season, index.season_type))
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+    def get_season_player_teams(
+        self,
+        season: str,
+        season_type: SeasonType,
+        fetch: Callable[[str, SeasonType], Dict],
+    ) -> SeasonPlayerTeams:
+        """
+        Gets index for a season and season type, requesting it if it isn't stored or has expired
+
+        :param season: Format YYYY-YY ex 2019-20
+        :param season_type: season type
+        :param fetch: function that requests the player game log result set for a season and
+            season type
+        """
+        season_type = SeasonType(season_type)
+        with self._lock:
+            index = self._indexes.get((season, season_type))
+            if index is None or not self._is_fresh(index):
+                index = self._load(season, season_type)
+                if index is None or not self._is_fresh(index):
+                    index = SeasonPlayerTeams.from_result_set(
+                        season, season_type, fetch(season, season_type)
+                    )
+                    self._save(index)
+                self._indexes[(season, season_type)] = index
+            return index
+
+    def get_player_team_map_for_date(
+        self,
+        game_date: date,
+        season_filters: Iterable[Tuple[str, SeasonType]],
+        fetch: Callable[[str, SeasonType], Dict],
+    ) -> Optional[Dict[int, int]]:
+        """
+        Gets dict mapping player id to team id for players that played on a date.
+        None if the index doesn't have game logs for the date, ex if they aren't available
+        yet, so boxscores can be used instead.
+
+        :param game_date: date
+        :param season_filters: (season, season type) of games on the date
+        :param fetch: function that requests the player game log result set for a season and
+            season type
+        """
+        if isinstance(game_date, datetime):
+            game_date = game_date.date()
+        player_team_map = {}
+        for season, season_type in season_filters:
+            index = self.get_season_player_teams(season, season_type, fetch)
+            player_teams = index.player_teams_by_date.get(game_date)
+            if player_teams is None:
+                return None
+            player_team_map.update(player_teams)
+        return player_team_map
+
+    def clear(self):
+        """
+        Removes indexes from memory. Stored indexes are kept.
+        """
+        with self._lock:
+            self._indexes.clear()
+
+
+_player_team_index = None
+
+
+def get_player_team_index() -> Optional[PlayerTeamIndex]:
+    """
+    Gets the index used to look up player teams on a date. None if it is disabled.
+    """
+    return _player_team_index
+
+
+def set_player_team_index(player_team_index: Optional[PlayerTeamIndex]):
+    """
+    Replaces the player/team index. Pass None to request boxscores for each game.
+
+    :param player_team_index: index to use for looking up player teams on a date
+    """
+    global _player_team_index
+    _player_team_index = player_team_index
+
+
+def configure_player_team_index(
+    directory: Optional[str] = None, ttl_hours: float = DEFAULT_TTL_HOURS
+):
+    """
+    Enables looking up player teams on a date from season player game logs
+
+    :param directory: (optional) directory to store indexes in. Defaults to only keeping
+        them in memory.
+    :param ttl_hours: (optional) hours until indexes for seasons that aren't complete
+        are requested again
+    """
+    set_player_team_index(PlayerTeamIndex(directory, ttl_hours))
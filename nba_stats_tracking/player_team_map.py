@@ -0,0 +1,32 @@
+"""
+Streaming builder for the mapping of player id to team id for games on a date.
+"""
+
+from typing import Dict
+
+from nba_stats_tracking.models.boxscore import BoxscoreResults
+
+
+class PlayerTeamMapBuilder:
+    """
+    Builds a dict mapping player id to team id from boxscores one game at a time.
+    Each game's players are added in place, so building a map for a date is linear in the
+    number of players instead of copying the map for every game.
+    """
+
+    def __init__(self):
+        self._player_team_map: Dict[int, int] = {}
+
+    def add(self, player_id: int, team_id: int):
+        self._player_team_map[player_id] = team_id
+
+    def add_boxscore(self, boxscore_data: BoxscoreResults):
+        """
+        Adds players of both teams in a game
+        """
+        for team in (boxscore_data.away_team, boxscore_data.home_team):
+            for player in team.players:
+                self.add(player.player_id, team.team_id)
+
+    def build(self) -> Dict[int, int]:
+        return self._player_team_map
@@ -0,0 +1,296 @@
+"""
+Module for planning the requests needed for tracking shot stats for combinations of filters.
+
+:func:`~nba_stats_tracking.tracking_shots.get_tracking_shot_stats` sums stats over every
+combination of the filters it is given. The planner finds the fewest requests that give the
+same totals:
+
+* Equivalent filter combinations (ex ``Period`` 1 and "1") are only requested once, and the
+  overall request used for frequencies is shared with a filter combination that matches it.
+* With ``derive=True``, the ranges of a dimension that partition all shots (the four
+  ``CloseDefDistRange`` and five ``DribbleRange`` ranges) add up to the stats without that
+  filter. When requesting the stats without the filter and the ranges that weren't asked for
+  takes fewer requests than requesting the ranges that were, the ranges that were asked for
+  are derived by subtracting the others, ex 3 of the 4 closest defender ranges take 2
+  requests instead of 3 and all 4 take 1. Games played can't be subtracted, so it is taken
+  from the stats without the filter.
+
+Plans can be made with :func:`plan_tracking_shot_queries` to check how many requests are
+needed before any are made.
+"""
+
+import itertools
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from nba_stats_tracking.models import fields
+from nba_stats_tracking.models.tracking_shots import (
+    CloseDefDist,
+    Dribbles,
+    GeneralRange,
+    Location,
+    ShotClock,
+    ShotDist,
+    TouchTime,
+    TrackingShotItem,
+)
+
+# request parameter, enum and default value for each filter dimension
+DIMENSIONS = [
+    ("CloseDefDistRange", CloseDefDist, CloseDefDist.all),
+    ("ShotClockRange", ShotClock, ShotClock.all),
+    ("ShotDistRange", ShotDist, ShotDist.all),
+    ("TouchTimeRange", TouchTime, TouchTime.all),
+    ("DribbleRange", Dribbles, Dribbles.all),
+    ("GeneralRange", GeneralRange, GeneralRange.overall),
+    ("Period", str, ""),
+]
+
+# ranges that add up to all shots, keyed by request parameter. Shot clock and touch time
+# ranges aren't included, shots without a shot clock or touch aren't in any of their ranges.
+PARTITIONS = {
+    "CloseDefDistRange": [value for value in CloseDefDist if value != CloseDefDist.all],
+    "DribbleRange": [value for value in Dribbles if value != Dribbles.all],
+}
+
+GAMES_PLAYED_HEADER = "GP"
+
+# response headers for stats that are summed, ex FGA
+ADDITIVE_HEADERS = [
+    model_field.alias
+    for model_field in TrackingShotItem.__fields__.values()
+    if fields.get_field_aggregation(model_field) == fields.ADDITIVE
+    and model_field.alias != model_field.name
+]
+
+
+def _normalize(value_type, value) -> str:
+    # str enums hash by name, so use values to compare filters
+    if value_type is str:
+        return str(value)
+    return value_type(value).value
+
+
+def _get_coefficients(
+    values: List[str], default: str, partition: Optional[List[str]]
+) -> Dict[str, int]:
+    # equivalent values are the same shots, only count them once
+    requested = dict.fromkeys(values, 1)
+    if partition is None:
+        return requested
+    ranges = [value for value in partition if value in requested]
+    missing = [value for value in partition if value not in requested]
+    # requested ranges add up to the stats without the filter minus the missing ranges
+    derived = {
+        value: coefficient
+        for value, coefficient in requested.items()
+        if value not in ranges
+    }
+    derived[default] = derived.get(default, 0) + 1
+    for value in missing:
+        derived[value] = -1
+    if len(derived) < len(requested):
+        return derived
+    return requested
+
+
+@dataclass
+class ShotQueryPlan:
+    """
+    Requests to make for a combination of tracking shot filters and how to combine them
+
+    :param requests: request parameters for each request to make
+    :param terms: (coefficient, request index) for each request that is summed. Requests with
+        negative coefficients are subtracted.
+    :param overall_index: index of the overall request, used to compute frequencies
+    :param naive_request_count: number of requests without planning
+    :param games_played_terms: (coefficient, request index) for each request games played is
+        summed over, the terms that don't have a subtracted range
+    """
+
+    requests: List[Dict]
+    terms: List[Tuple[int, int]]
+    overall_index: int
+    naive_request_count: int
+    games_played_terms: List[Tuple[int, int]]
+
+    @property
+    def request_count(self) -> int:
+        """
+        Number of requests for each season and season type
+        """
+        return len(self.requests)
+
+    def get_request_count(
+        self, season_count: int = 1, season_type_count: int = 1
+    ) -> int:
+        """
+        Number of requests for seasons and season types
+
+        :param season_count: (optional) number of seasons. Defaults to 1.
+        :param season_type_count: (optional) number of season types. Defaults to 1.
+        """
+        return self.request_count * season_count * season_type_count
+
+    def combine(self, entity_type: str, results: Sequence[Dict]) -> Tuple[Dict, Dict]:
+        """
+        Combines response results into results for the filters
+        Returns (filter results, overall results)
+
+        :param entity_type: player, team or opponent
+        :param results: response results for each request, in the same order as requests
+        """
+        filter_results = combine_result_sets(
+            entity_type,
+            [(coefficient, results[index]) for coefficient, index in self.terms],
+            [
+                (coefficient, results[index])
+                for coefficient, index in self.games_played_terms
+            ],
+        )
+        return filter_results, results[self.overall_index]
+
+
+def plan_tracking_shot_queries(derive: bool = False, **kwargs) -> ShotQueryPlan:
+    """
+    Plans requests for tracking shot stats for every combination of filters
+
+    :param derive: (optional) derive ranges of dimensions in :data:`PARTITIONS` from the
+        stats without the filter when it takes fewer requests. Defaults to False, which only
+        skips duplicate requests.
+    :param list[CloseDefDist] CloseDefDistRange: (optional)
+    :param list[ShotClock] ShotClockRange: (optional)
+    :param list[ShotDist] ShotDistRange: (optional)
+    :param list[TouchTime] TouchTimeRange: (optional)
+    :param list[Dribbles] DribbleRange: (optional)
+    :param list[General] GeneralRange: (optional)
+    :param list[int] Period: (optional) Only get stats for specific period
+    :param str DateFrom: (optional) Format - MM/DD/YYYY
+    :param str DateTo: (optional) Format - MM/DD/YYYY
+    :param str Location: (optional) - Options: 'Home' or 'Road'
+    """
+    coefficients_by_dimension = []
+    naive_request_count = 1
+    for name, value_type, default in DIMENSIONS:
+        values = [
+            _normalize(value_type, value) for value in kwargs.get(name, [default])
+        ]
+        naive_request_count *= len(values)
+        partition = None
+        if derive and name in PARTITIONS:
+            partition = [value.value for value in PARTITIONS[name]]
+        coefficients = _get_coefficients(
+            values, _normalize(value_type, default), partition
+        )
+        coefficients_by_dimension.append(list(coefficients.items()))
+
+    date_from = kwargs.get("DateFrom", "")
+    date_to = kwargs.get("DateTo", "")
+    location = Location(kwargs.get("Location", "")).value
+    requests = []
+    request_indexes = {}
+
+    def get_request_index(values: Tuple[str, ...], location: str) -> int:
+        key = (values, location)
+        if key not in request_indexes:
+            request_indexes[key] = len(requests)
+            request_parameters = {
+                name: value for (name, _, _), value in zip(DIMENSIONS, values)
+            }
+            request_parameters["DateFrom"] = date_from
+            request_parameters["DateTo"] = date_to
+            request_parameters["Location"] = location
+            requests.append(request_parameters)
+        return request_indexes[key]
+
+    terms = []
+    games_played_terms = []
+    for combination in itertools.product(*coefficients_by_dimension):
+        coefficient = 1
+        for _, value_coefficient in combination:
+            coefficient *= value_coefficient
+        values = tuple(value for value, _ in combination)
+        terms.append((coefficient, get_request_index(values, location)))
+        if all(value_coefficient > 0 for _, value_coefficient in combination):
+            games_played_terms.append(terms[-1])
+
+    # overall request is the request without any filters other than dates
+    overall_values = tuple(
+        _normalize(value_type, default) for _, value_type, default in DIMENSIONS
+    )
+    overall_index = get_request_index(overall_values, "")
+    return ShotQueryPlan(
+        requests, terms, overall_index, naive_request_count + 1, games_played_terms
+    )
+
+
+def combine_result_sets(
+    entity_type: str,
+    weighted_results: Sequence[Tuple[int, Dict]],
+    games_played_results: Optional[Sequence[Tuple[int, Dict]]] = None,
+) -> Dict:
+    """
+    Sums stats for each player/team over response results, each multiplied by a coefficient.
+    Ids and names are taken from the first row for each player/team.
+    When results are subtracted, players/teams without any shots left are removed.
+
+    :param entity_type: player, team or opponent
+    :param weighted_results: (coefficient, response results) to sum
+    :param games_played_results: (optional) (coefficient, response results) to sum games
+        played over. Defaults to weighted_results.
+    """
+    if games_played_results is None:
+        games_played_results = weighted_results
+    if len(weighted_results) == 1 and weighted_results[0][0] == 1:
+        return weighted_results[0][1]
+    weighted_results = [
+        (coefficient, results)
+        for coefficient, results in weighted_results
+        if results.get("headers")
+    ]
+    if not weighted_results:
+        return {"headers": [], "rowSet": []}
+    headers = weighted_results[0][1]["headers"]
+    entity_header = "PLAYER_ID" if entity_type == "player" else "TEAM_ID"
+    shot_indexes = [
+        index
+        for index, header in enumerate(headers)
+        if header in ADDITIVE_HEADERS and header != GAMES_PLAYED_HEADER
+    ]
+    rows = {}
+    for coefficient, results in weighted_results:
+        result_headers = results["headers"]
+        entity_index = result_headers.index(entity_header)
+        header_indexes = [result_headers.index(header) for header in headers]
+        for result_row in results.get("rowSet", []):
+            row = [result_row[index] for index in header_indexes]
+            totals = rows.get(result_row[entity_index])
+            if totals is None:
+                totals = list(row)
+                for index in shot_indexes:
+                    totals[index] = 0
+                if GAMES_PLAYED_HEADER in headers:
+                    totals[headers.index(GAMES_PLAYED_HEADER)] = 0
+                rows[result_row[entity_index]] = totals
+            for index in shot_indexes:
+                if row[index] is not None:
+                    totals[index] += coefficient * row[index]
+
+    # games played isn't additive over ranges, so it is never subtracted
+    if GAMES_PLAYED_HEADER in headers:
+        games_played_index = headers.index(GAMES_PLAYED_HEADER)
+        for coefficient, results in games_played_results:
+            result_headers = results.get("headers", [])
+            if GAMES_PLAYED_HEADER not in result_headers:
+                continue
+            entity_index = result_headers.index(entity_header)
+            result_index = result_headers.index(GAMES_PLAYED_HEADER)
+            for result_row in results.get("rowSet", []):
+                totals = rows.get(result_row[entity_index])
+                if totals is not None and result_row[result_index] is not None:
+                    totals[games_played_index] += coefficient * result_row[result_index]
+
+    row_set = list(rows.values())
+    if any(coefficient < 0 for coefficient, _ in weighted_results):
+        row_set = [row for row in row_set if any(row[index] for index in shot_indexes)]
+    return {"headers": list(headers), "rowSet": row_set}
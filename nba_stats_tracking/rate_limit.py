@@ -0,0 +1,134 @@
+"""Module containing the rate limiter shared by all stats requests"""
+
+import asyncio
+import multiprocessing
+import threading
+import time
+from typing import Optional
+
+# Making too many requests in a short period can result in timeouts.
+# Default allows one request every 2 seconds
+DEFAULT_RATE = 0.5
+DEFAULT_BURST = 1
+
+
+class RateLimiter:
+    """
+    Token bucket rate limiter. Safe to share between threads and async tasks.
+
+    Tokens refill continuously at `rate` per second up to `burst`, so time spent
+    waiting on a response counts towards the next request. Each caller reserves a
+    token when it arrives and waits until that token is available, which keeps
+    callers in arrival order and total throughput at `rate`.
+
+    :param rate: requests per second
+    :param burst: max number of requests that can be made at once after being idle
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Reserves a token and returns number of seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated_at) * self.rate
+            )
+            self._updated_at = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+            return -self._tokens / self.rate
+
+    def acquire(self):
+        """
+        Blocks until a request can be made
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def async_acquire(self):
+        """
+        Waits without blocking the event loop until a request can be made
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class ProcessRateLimiter(RateLimiter):
+    """
+    Token bucket rate limiter with state in shared memory, so one limit is shared by the
+    process that creates it and worker processes it is passed to when they are started.
+
+    :param rate: requests per second
+    :param burst: max number of requests that can be made at once after being idle
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+        super().__init__(rate, burst)
+        # tokens and time of last update, monotonic time is system wide
+        self._state = multiprocessing.Array("d", [float(burst), time.monotonic()])
+
+    def reserve(self) -> float:
+        with self._state.get_lock():
+            tokens, updated_at = self._state
+            now = time.monotonic()
+            tokens = min(self.burst, tokens + (now - updated_at) * self.rate) - 1
+            self._state[0] = tokens
+            self._state[1] = now
+        if tokens >= 0:
+            return 0
+        return -tokens / self.rate
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # thread lock isn't used, shared state has its own lock
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+_rate_limiter = RateLimiter()
+
+
+def get_rate_limiter() -> Optional[RateLimiter]:
+    """
+    Gets the rate limiter shared by all stats requests. None if rate limiting is disabled.
+    """
+    return _rate_limiter
+
+
+def set_rate_limiter(rate_limiter: Optional[RateLimiter]):
+    """
+    Replaces the shared rate limiter. Pass None to disable rate limiting.
+
+    :param rate_limiter: rate limiter to use for all stats requests
+    """
+    global _rate_limiter
+    _rate_limiter = rate_limiter
+
+
+def configure_rate_limiter(rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST):
+    """
+    Replaces the shared rate limiter with a new one
+
+    :param rate: requests per second
+    :param burst: max number of requests that can be made at once after being idle
+    """
+    set_rate_limiter(RateLimiter(rate, burst))
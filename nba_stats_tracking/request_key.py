@@ -0,0 +1,47 @@
+"""Module containing functions for identifying equivalent requests"""
+
+import hashlib
+import json
+from datetime import date
+from enum import Enum
+from typing import Dict, List, Tuple
+from urllib.parse import urlsplit
+
+
+def canonicalize_param_value(value) -> str:
+    """
+    Converts a query string parameter value to the string that is sent in the request
+    """
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def canonicalize_params(params: Dict) -> List[Tuple[str, str]]:
+    """
+    Converts query string parameters to a list of (key, value) pairs sorted by key.
+    Parameters with a value of None are not sent in the request so they are dropped.
+    """
+    return sorted(
+        (key, canonicalize_param_value(value))
+        for key, value in params.items()
+        if value is not None
+    )
+
+
+def get_endpoint(url: str) -> str:
+    """
+    Gets endpoint name from url
+    ex leaguedashptstats for https://stats.nba.com/stats/leaguedashptstats
+    """
+    return urlsplit(url).path.rstrip("/").split("/")[-1]
+
+
+def get_request_key(url: str, params: Dict) -> str:
+    """
+    Gets a key that is the same for all requests to the same url with equivalent params
+    """
+    canonical_request = json.dumps([url, canonicalize_params(params)])
+    return hashlib.sha256(canonical_request.encode("utf-8")).hexdigest()
@@ -0,0 +1,292 @@
+"""Module containing retry and circuit breaker settings shared by all requests"""
+
+import asyncio
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import requests
+
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 2.0  # seconds
+DEFAULT_MAX_BACKOFF = 60.0  # seconds
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_TIMEOUT = 60.0  # seconds
+
+RETRY_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+
+
+def is_upstream_failure(exception: Exception) -> bool:
+    """
+    Checks if a request failed because of a timeout, a connection error, rate limiting
+    or a server error. These are worth retrying, other errors (ex 400) are not.
+    """
+    if isinstance(exception, (requests.Timeout, requests.ConnectionError)):
+        return True
+    if isinstance(exception, requests.HTTPError) and exception.response is not None:
+        return exception.response.status_code in RETRY_STATUS_CODES
+    return False
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter. Wait before retry n (starting from 0) is a
+    random number of seconds between 0 and min(max_backoff, backoff_factor * 2 ** n).
+
+    :param max_retries: max number of times to retry a request
+    :param backoff_factor: base wait in seconds
+    :param max_backoff: max wait in seconds
+    :param jitter: randomize waits so workers that failed together don't retry together
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        max_backoff: float = DEFAULT_MAX_BACKOFF,
+        jitter: bool = True,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+
+    def get_backoff(self, attempt: int) -> float:
+        """
+        Gets number of seconds to wait before retrying a request that has failed attempt + 1 times
+        """
+        backoff = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            return random.uniform(0, backoff)
+        return backoff
+
+
+class CircuitBreaker:
+    """
+    Stops all requests for `reset_timeout` seconds after `failure_threshold` consecutive
+    upstream failures. Once the timeout has passed requests are let through again. If the
+    next request fails the circuit opens again right away, if it succeeds it closes.
+
+    :param failure_threshold: consecutive failures that open the circuit
+    :param reset_timeout: seconds to pause requests for when circuit opens
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.get_wait_time() > 0
+
+    def get_wait_time(self) -> float:
+        """
+        Gets number of seconds until requests can be made
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return 0
+            return max(0, self._opened_at + self.reset_timeout - time.monotonic())
+
+    def wait_until_closed(self):
+        """
+        Blocks while the circuit is open
+        """
+        wait_time = self.get_wait_time()
+        while wait_time > 0:
+            time.sleep(wait_time)
+            wait_time = self.get_wait_time()
+
+    async def async_wait_until_closed(self):
+        """
+        Waits without blocking the event loop while the circuit is open
+        """
+        wait_time = self.get_wait_time()
+        while wait_time > 0:
+            await asyncio.sleep(wait_time)
+            wait_time = self.get_wait_time()
+
+    def record_success(self):
+        with self._lock:
+            self._consecutive_failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> bool:
+        """
+        Records an upstream failure. Returns True if this failure opened the circuit.
+        """
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._consecutive_failures < self.failure_threshold:
+                return False
+            now = time.monotonic()
+            if (
+                self._opened_at is not None
+                and now < self._opened_at + self.reset_timeout
+            ):
+                # already open
+                return False
+            self._opened_at = now
+            return True
+
+
+class RequestStats:
+    """
+    Thread safe counters for tuning throughput
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.requests = 0
+        self.failures = 0
+        self.retries = 0
+        self.trips = 0
+
+    def increment(self, counter: str):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def to_dict(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "failures": self.failures,
+                "retries": self.retries,
+                "trips": self.trips,
+            }
+
+
+_retry_policy = RetryPolicy()
+_circuit_breaker = CircuitBreaker()
+_stats = RequestStats()
+
+
+def get_retry_policy() -> Optional[RetryPolicy]:
+    """
+    Gets the retry policy shared by all requests. None if retries are disabled.
+    """
+    return _retry_policy
+
+
+def set_retry_policy(retry_policy: Optional[RetryPolicy]):
+    """
+    Replaces the shared retry policy. Pass None to disable retries.
+    """
+    global _retry_policy
+    _retry_policy = retry_policy
+
+
+def configure_retries(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+    max_backoff: float = DEFAULT_MAX_BACKOFF,
+    jitter: bool = True,
+):
+    """
+    Replaces the shared retry policy with a new one
+
+    :param max_retries: max number of times to retry a request
+    :param backoff_factor: base wait in seconds
+    :param max_backoff: max wait in seconds
+    :param jitter: randomize waits so workers that failed together don't retry together
+    """
+    set_retry_policy(RetryPolicy(max_retries, backoff_factor, max_backoff, jitter))
+
+
+def get_circuit_breaker() -> Optional[CircuitBreaker]:
+    """
+    Gets the circuit breaker shared by all requests. None if it is disabled.
+    """
+    return _circuit_breaker
+
+
+def set_circuit_breaker(circuit_breaker: Optional[CircuitBreaker]):
+    """
+    Replaces the shared circuit breaker. Pass None to disable it.
+    """
+    global _circuit_breaker
+    _circuit_breaker = circuit_breaker
+
+
+def configure_circuit_breaker(
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+    reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+):
+    """
+    Replaces the shared circuit breaker with a new one
+
+    :param failure_threshold: consecutive failures that open the circuit
+    :param reset_timeout: seconds to pause requests for when circuit opens
+    """
+    set_circuit_breaker(CircuitBreaker(failure_threshold, reset_timeout))
+
+
+def get_stats() -> Dict[str, int]:
+    """
+    Gets number of requests, failed requests, retries and circuit breaker trips
+    since the last call to :func:`reset_stats`
+    """
+    return _stats.to_dict()
+
+
+def reset_stats():
+    """
+    Resets request, failure, retry and trip counters to 0
+    """
+    _stats.reset()
+
+
+def record_success():
+    """
+    Records a successful request
+    """
+    _stats.increment("requests")
+    if _circuit_breaker is not None:
+        _circuit_breaker.record_success()
+
+
+def record_failure(exception: Exception, attempt: int) -> Optional[float]:
+    """
+    Records a failed request. Returns number of seconds to wait before retrying,
+    or None if the request should not be retried.
+
+    :param exception: exception raised by the request
+    :param attempt: number of times the request has been retried already
+    """
+    _stats.increment("requests")
+    _stats.increment("failures")
+    if not is_upstream_failure(exception):
+        return None
+    if _circuit_breaker is not None and _circuit_breaker.record_failure():
+        _stats.increment("trips")
+    if _retry_policy is None or attempt >= _retry_policy.max_retries:
+        return None
+    _stats.increment("retries")
+    return _retry_policy.get_backoff(attempt)
+
+
+def wait_until_closed():
+    """
+    Blocks while the shared circuit breaker is open
+    """
+    if _circuit_breaker is not None:
+        _circuit_breaker.wait_until_closed()
+
+
+async def async_wait_until_closed():
+    """
+    Waits without blocking the event loop while the shared circuit breaker is open
+    """
+    if _circuit_breaker is not None:
+        await _circuit_breaker.async_wait_until_closed()
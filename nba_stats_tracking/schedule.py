@@ -0,0 +1,254 @@
+"""
+Module containing the optional season schedule index.
+
+When enabled, the schedule for a season is requested once from the ``scheduleleaguev2``
+endpoint and scoreboards for dates in the season are read from it instead of requesting
+``scoreboardV3`` for each date, so dates without games don't need any requests.
+
+Schedules are kept in memory and, if a directory is set, stored on disk. Schedules for
+completed seasons never expire. Schedules for seasons that aren't complete are requested
+again after `ttl_hours`, and dates after the last scheduled date of a season that isn't
+complete (ex playoff games that aren't scheduled yet) fall back to requesting the scoreboard.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional
+
+from dateutil.rrule import DAILY, rrule
+
+from nba_stats_tracking.cache import DEFAULT_TTL_HOURS, is_season_final
+from nba_stats_tracking.models.schedule import ScheduleResults
+from nba_stats_tracking.models.scoreboard import GameItem, ScoreboardResults
+
+
+def get_season(start_year: int) -> str:
+    """
+    Gets season that starts in a year, ex 2019-20 for 2019
+    """
+    return f"{start_year}-{str(start_year + 1)[-2:]}"
+
+
+def get_seasons_for_date(game_date: date) -> List[str]:
+    """
+    Gets seasons that can have games on a date. Seasons have ended by July in most years but
+    not all (ex the 2019-20 season ended in October 2020), so dates from July on can be in
+    the season that started the year before or the season starting that year.
+    """
+    seasons = [get_season(game_date.year - 1)]
+    if game_date.month >= 7:
+        seasons.append(get_season(game_date.year))
+    return seasons
+
+
+class SeasonSchedule:
+    """
+    Games in a season keyed by date
+
+    :param season: Format YYYY-YY ex 2019-20
+    :param games_by_date: dict mapping date to GameItem for games on the date
+    :param fetched_at: (optional) unix time schedule was requested. Defaults to now.
+    """
+
+    def __init__(
+        self,
+        season: str,
+        games_by_date: Dict[date, List[GameItem]],
+        fetched_at: Optional[float] = None,
+    ):
+        self.season = season
+        self.games_by_date = games_by_date
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self.last_date = max(games_by_date) if games_by_date else None
+
+    @classmethod
+    def from_response_json(cls, season: str, response_json: Dict) -> "SeasonSchedule":
+        """
+        Creates schedule from ``leagueSchedule`` of a scheduleleaguev2 response
+        """
+        results = ScheduleResults(**response_json)
+        games_by_date = {}
+        for game_date in results.game_dates:
+            if game_date.games:
+                games_by_date[game_date.game_date] = game_date.games
+        return cls(season, games_by_date)
+
+    def to_json(self) -> Dict:
+        return {
+            "season": self.season,
+            "fetched_at": self.fetched_at,
+            "games": {
+                game_date.isoformat(): [game.dict(by_alias=True) for game in games]
+                for game_date, games in self.games_by_date.items()
+            },
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict) -> "SeasonSchedule":
+        games_by_date = {
+            date.fromisoformat(game_date): [GameItem(**game) for game in games]
+            for game_date, games in data["games"].items()
+        }
+        return cls(data["season"], games_by_date, data["fetched_at"])
+
+    def get_scoreboard(self, game_date: date) -> ScoreboardResults:
+        """
+        Gets scoreboard with scheduled games on a date. No games if none are scheduled.
+        """
+        return ScoreboardResults(
+            gameDate=game_date, games=self.games_by_date.get(game_date, [])
+        )
+
+
+class ScheduleIndex:
+    """
+    Season schedules used to look up games on a date
+
+    :param directory: (optional) directory to store schedules in. Defaults to only keeping
+        them in memory.
+    :param ttl_hours: (optional) hours until schedules for seasons that aren't complete
+        are requested again
+    """
+
+    def __init__(
+        self, directory: Optional[str] = None, ttl_hours: float = DEFAULT_TTL_HOURS
+    ):
+        self.directory = directory
+        self.ttl_hours = ttl_hours
+        self._schedules: Dict[str, SeasonSchedule] = {}
+        self._lock = threading.Lock()
+
+    def _get_path(self, season: str) -> str:
+        return os.path.join(self.directory, f"{season}.json")
+
+    def _is_fresh(self, schedule: SeasonSchedule) -> bool:
+        if is_season_final(schedule.season, date.today()):
+            return True
+        return time.time() - schedule.fetched_at < self.ttl_hours * 3600
+
+    def _load(self, season: str) -> Optional[SeasonSchedule]:
+        if self.directory is None:
+            return None
+        try:
+            with open(self._get_path(season)) as f:
+                return SeasonSchedule.from_json(json.loads(f.read()))
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _save(self, schedule: SeasonSchedule):
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        # write to temp file and rename so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(json.dumps(schedule.to_json()))
+            os.replace(temp_path, self._get_path(schedule.season))
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+    def get_season_schedule(
+        self, season: str, fetch: Callable[[str], Dict]
+    ) -> SeasonSchedule:
+        """
+        Gets schedule for a season, requesting it if it isn't stored or has expired
+
+        :param season: Format YYYY-YY ex 2019-20
+        :param fetch: function that requests ``leagueSchedule`` for a season
+        """
+        with self._lock:
+            schedule = self._schedules.get(season)
+            if schedule is None or not self._is_fresh(schedule):
+                schedule = self._load(season)
+                if schedule is None or not self._is_fresh(schedule):
+                    schedule = SeasonSchedule.from_response_json(season, fetch(season))
+                    self._save(schedule)
+                self._schedules[season] = schedule
+            return schedule
+
+    def get_scoreboard_for_date(
+        self, game_date: date, fetch: Callable[[str], Dict]
+    ) -> Optional[ScoreboardResults]:
+        """
+        Gets scoreboard with scheduled games on a date.
+        None if the schedule might not have all games on the date yet.
+
+        :param game_date: date
+        :param fetch: function that requests ``leagueSchedule`` for a season
+        """
+        if isinstance(game_date, datetime):
+            game_date = game_date.date()
+        for season in get_seasons_for_date(game_date):
+            schedule = self.get_season_schedule(season, fetch)
+            if game_date in schedule.games_by_date:
+                return schedule.get_scoreboard(game_date)
+            if not is_season_final(season, date.today()) and (
+                schedule.last_date is None or game_date > schedule.last_date
+            ):
+                return None
+        return ScoreboardResults(gameDate=game_date, games=[])
+
+    def get_game_dates(
+        self, date_from: date, date_to: date, fetch: Callable[[str], Dict]
+    ) -> List[date]:
+        """
+        Gets dates with scheduled games between two dates. Dates that might have games that
+        aren't scheduled yet are included.
+
+        :param date_from: start date
+        :param date_to: end date
+        :param fetch: function that requests ``leagueSchedule`` for a season
+        """
+        game_dates = []
+        for dt in rrule(DAILY, dtstart=date_from, until=date_to):
+            scoreboard = self.get_scoreboard_for_date(dt.date(), fetch)
+            if scoreboard is None or scoreboard.games:
+                game_dates.append(dt.date())
+        return game_dates
+
+    def clear(self):
+        """
+        Removes schedules from memory. Stored schedules are kept.
+        """
+        with self._lock:
+            self._schedules.clear()
+
+
+_schedule_index = None
+
+
+def get_schedule_index() -> Optional[ScheduleIndex]:
+    """
+    Gets the schedule index used to look up games on a date. None if it is disabled.
+    """
+    return _schedule_index
+
+
+def set_schedule_index(schedule_index: Optional[ScheduleIndex]):
+    """
+    Replaces the schedule index. Pass None to request scoreboards for each date.
+
+    :param schedule_index: schedule index to use for looking up games on a date
+    """
+    global _schedule_index
+    _schedule_index = schedule_index
+
+
+def configure_schedule_index(
+    directory: Optional[str] = None, ttl_hours: float = DEFAULT_TTL_HOURS
+):
+    """
+    Enables looking up games on a date from season schedules
+
+    :param directory: (optional) directory to store schedules in. Defaults to only keeping
+        them in memory.
+    :param ttl_hours: (optional) hours until schedules for seasons that aren't complete
+        are requested again
+    """
+    set_schedule_index(ScheduleIndex(directory, ttl_hours))
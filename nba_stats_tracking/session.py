@@ -0,0 +1,94 @@
+"""Module containing the shared HTTP session used for all requests"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from nba_stats_tracking import HEADERS
+
+DEFAULT_POOL_SIZE = 10
+
+_lock = threading.Lock()
+_session = None
+# sessions passed to set_session belong to the caller and are never closed here
+_owns_session = False
+_pool_size = DEFAULT_POOL_SIZE
+
+
+def make_session(pool_size: int = DEFAULT_POOL_SIZE) -> requests.Session:
+    """
+    Creates a requests session with default headers and a connection pool
+    sized for `pool_size` concurrent connections per host
+
+    :param pool_size: Max number of pooled connections kept alive per host
+    """
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Gets the session shared by all endpoint helpers, creating it on first use
+    """
+    global _session, _owns_session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                _session = make_session(_pool_size)
+                _owns_session = True
+    return _session
+
+
+def get_pool_size() -> int:
+    """
+    Gets the configured connection pool size
+    """
+    return _pool_size
+
+
+def _replace_session(session: Optional[requests.Session], owned: bool):
+    global _session, _owns_session
+    with _lock:
+        previous = _session
+        owned_previous = _owns_session
+        _session = session
+        _owns_session = owned
+    if previous is not None and previous is not session and owned_previous:
+        previous.close()
+
+
+def set_session(session: Optional[requests.Session]):
+    """
+    Replaces the shared session. Use this to inject a custom session (ex with proxies
+    or extra adapters mounted). Passing None will close the current session if it was
+    created by this package and a new default one will be created on next use.
+    Sessions passed in aren't closed when they are replaced, the caller owns them.
+
+    :param session: session to use for all requests
+    """
+    _replace_session(session, False)
+
+
+def configure_session(pool_size: int = DEFAULT_POOL_SIZE):
+    """
+    Sets connection pool size and recreates the shared session
+
+    :param pool_size: Max number of pooled connections kept alive per host
+    """
+    global _pool_size
+    _pool_size = pool_size
+    _replace_session(make_session(pool_size), True)
+
+
+def close_session():
+    """
+    Closes the shared session and releases pooled connections.
+    Sessions passed to :func:`set_session` are only stopped being used, not closed.
+    """
+    set_session(None)
@@ -0,0 +1,387 @@
+"""
+Module for answering tracking shot queries from a local cube of stats, requires NumPy.
+
+A cube holds shot totals for every player/team in every combination of closest defender,
+shot clock, touch time, dribble and period ranges for a season and season type, or a single
+date. It is requested once with :func:`build_tracking_shot_cube` (4 x 7 x 3 x 5 x 5 = 2100
+requests) and saved to a compressed ``.npz`` file. Any combination of ranges can then be
+queried with :meth:`TrackingShotCube.query` by summing cells, without making requests.
+
+Overtime periods are one ``OT`` period range, derived as the stats for all periods minus
+periods 1 to 4, so the period ranges add up to all shots. Games played can't be summed over
+ranges, so it isn't stored and is 0 in query results.
+"""
+
+import asyncio
+import itertools
+import json
+import math
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from nba_stats_tracking import helpers, tracking_shots
+from nba_stats_tracking.models import fields
+from nba_stats_tracking.models.request import ResultFormat, SeasonType
+from nba_stats_tracking.models.tracking_shots import (
+    CloseDefDist,
+    Dribbles,
+    ShotClock,
+    TouchTime,
+    TrackingShotItem,
+)
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+OVERTIME = "OT"
+
+# request parameter and ranges for each cube dimension, in cube axis order
+DIMENSIONS = [
+    ("CloseDefDistRange", [value.value for value in CloseDefDist if value.value]),
+    ("ShotClockRange", [value.value for value in ShotClock if value.value]),
+    ("TouchTimeRange", [value.value for value in TouchTime if value.value]),
+    ("DribbleRange", [value.value for value in Dribbles if value.value]),
+    ("Period", ["1", "2", "3", "4", OVERTIME]),
+]
+
+# summed stats stored for each cell, games played can't be summed over ranges
+STAT_HEADERS = ["FGM", "FGA", "FG2M", "FG2A", "FG3M", "FG3A"]
+
+CUBE_REQUEST_COUNT = math.prod(len(ranges) for _, ranges in DIMENSIONS)
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError(
+            "NumPy is required for tracking shot cubes. "
+            "Install it with pip install nba_stats_tracking[numpy]"
+        )
+
+
+def _get_entity_header(entity_type: tracking_shots.EntityType) -> str:
+    return "PLAYER_ID" if entity_type == "player" else "TEAM_ID"
+
+
+def _get_info_headers(headers: List[str], entity_header: str) -> List[str]:
+    # ids and names, ex PLAYER_NAME, kept from the first row for each player/team
+    field_map = {
+        model_field.alias: model_field
+        for model_field in TrackingShotItem.__fields__.values()
+    }
+    return [
+        header
+        for header in headers
+        if header in field_map
+        and header != entity_header
+        and fields.get_field_aggregation(field_map[header]) is None
+    ]
+
+
+def get_cube_requests(game_date: Optional[date] = None) -> List[Tuple[Tuple, Dict]]:
+    """
+    Gets (cell index, request parameters) for each request needed for a cube.
+    The overtime cell index is requested for all periods.
+
+    :param game_date: (optional) only get stats for a date. Defaults to the full season.
+    """
+    date_string = game_date.strftime("%m/%d/%Y") if game_date is not None else ""
+    requests = []
+    for cell in itertools.product(*[range(len(values)) for _, values in DIMENSIONS]):
+        request_parameters = {
+            name: values[index] for (name, values), index in zip(DIMENSIONS, cell)
+        }
+        if request_parameters["Period"] == OVERTIME:
+            request_parameters["Period"] = ""
+        request_parameters["DateFrom"] = date_string
+        request_parameters["DateTo"] = date_string
+        requests.append((cell, request_parameters))
+    return requests
+
+
+class TrackingShotCube:
+    """
+    Shot totals for each player/team in every combination of cube dimension ranges
+
+    :param entity_type: player, team or opponent
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: season type
+    :param entity_ids: player/team id for each row of cells
+    :param info_headers: response headers for ids and names, ex PLAYER_NAME
+    :param info_rows: ids and names for each player/team
+    :param cells: shot totals with shape (players/teams, 4, 7, 3, 5, 5, 6), with axes in
+        the order of :data:`DIMENSIONS` and stats in the order of :data:`STAT_HEADERS`
+    :param game_date: (optional) date if the cube only has stats for a date
+    """
+
+    def __init__(
+        self,
+        entity_type: tracking_shots.EntityType,
+        season: str,
+        season_type: SeasonType,
+        entity_ids: Sequence[int],
+        info_headers: List[str],
+        info_rows: List[List],
+        cells: "np.ndarray",
+        game_date: Optional[date] = None,
+    ):
+        _require_numpy()
+        self.entity_type = tracking_shots.EntityType(entity_type)
+        self.season = season
+        self.season_type = SeasonType(season_type)
+        self.entity_ids = np.asarray(entity_ids, dtype=np.int64)
+        self.info_headers = info_headers
+        self.info_rows = info_rows
+        self.cells = cells
+        self.game_date = game_date
+        self._overall = None
+
+    @classmethod
+    def from_result_sets(
+        cls,
+        entity_type: tracking_shots.EntityType,
+        season: str,
+        season_type: SeasonType,
+        cell_results: Sequence[Tuple[Tuple, Dict]],
+        game_date: Optional[date] = None,
+    ) -> "TrackingShotCube":
+        """
+        Creates cube from response results for each cell index from :func:`get_cube_requests`
+        Raises ValueError if stats for periods 1 to 4 add up to more than stats for all
+        periods, which means responses are inconsistent or some are missing.
+        """
+        _require_numpy()
+        entity_header = _get_entity_header(entity_type)
+        entity_indexes = {}
+        info_headers = None
+        info_rows = []
+        values = []
+        for cell, results in cell_results:
+            headers = results.get("headers", [])
+            if not results.get("rowSet"):
+                continue
+            if info_headers is None:
+                info_headers = _get_info_headers(headers, entity_header)
+            entity_index = headers.index(entity_header)
+            info_indexes = [headers.index(header) for header in info_headers]
+            stat_indexes = [headers.index(header) for header in STAT_HEADERS]
+            for row in results["rowSet"]:
+                index = entity_indexes.get(row[entity_index])
+                if index is None:
+                    index = entity_indexes[row[entity_index]] = len(info_rows)
+                    info_rows.append([row[i] for i in info_indexes])
+                values.append(
+                    (index,) + cell + tuple(row[i] or 0 for i in stat_indexes)
+                )
+
+        shape = [len(info_rows)] + [len(ranges) for _, ranges in DIMENSIONS]
+        cells = np.zeros(shape + [len(STAT_HEADERS)], dtype=np.int32)
+        if values:
+            values = np.array(values, dtype=np.int64)
+            cell_count = len(DIMENSIONS) + 1
+            cells[tuple(values[:, :cell_count].T)] = values[:, cell_count:]
+        # overtime cells have stats for all periods until periods 1 to 4 are subtracted
+        cells[..., -1, :] -= cells[..., :-1, :].sum(axis=-2, dtype=np.int32)
+        if (cells[..., -1, :] < 0).any():
+            entity_index, *cell = np.argwhere(cells[..., -1, :] < 0)[0][:-1]
+            ranges = [ranges[index] for (_, ranges), index in zip(DIMENSIONS, cell)]
+            raise ValueError(
+                "Stats for periods 1 to 4 are more than stats for all periods for "
+                f"{entity_header} {list(entity_indexes)[entity_index]} in {ranges}, "
+                "responses are inconsistent or incomplete"
+            )
+        return cls(
+            entity_type,
+            season,
+            season_type,
+            list(entity_indexes),
+            info_headers or [],
+            info_rows,
+            cells,
+            game_date,
+        )
+
+    def save(self, path: str):
+        """
+        Saves cube to a compressed ``.npz`` file
+        """
+        metadata = {
+            "entity_type": self.entity_type.value,
+            "season": self.season,
+            "season_type": self.season_type.value,
+            "game_date": self.game_date.isoformat() if self.game_date else None,
+            "info_headers": self.info_headers,
+            "info_rows": self.info_rows,
+        }
+        np.savez_compressed(
+            path,
+            metadata=np.array(json.dumps(metadata)),
+            entity_ids=self.entity_ids,
+            cells=self.cells,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "TrackingShotCube":
+        """
+        Loads cube saved with :meth:`save`
+        """
+        _require_numpy()
+        with np.load(path) as data:
+            metadata = json.loads(str(data["metadata"]))
+            entity_ids = data["entity_ids"]
+            cells = data["cells"]
+        game_date = metadata["game_date"]
+        return cls(
+            metadata["entity_type"],
+            metadata["season"],
+            metadata["season_type"],
+            entity_ids,
+            metadata["info_headers"],
+            metadata["info_rows"],
+            cells,
+            date.fromisoformat(game_date) if game_date else None,
+        )
+
+    def _get_range_indexes(self, name: str, values: Optional[Sequence]) -> List[int]:
+        ranges = dict(DIMENSIONS)[name]
+        if values is None:
+            return list(range(len(ranges)))
+        indexes = []
+        for value in values:
+            value = str(getattr(value, "value", value))
+            if value == "":
+                # range for all shots
+                return list(range(len(ranges)))
+            if value not in ranges:
+                raise ValueError(f"Unknown {name} {value}, options are {ranges}")
+            if ranges.index(value) not in indexes:
+                indexes.append(ranges.index(value))
+        return indexes
+
+    def get_totals(self, **kwargs) -> "np.ndarray":
+        """
+        Sums cells for ranges. Returns shot totals with shape (players/teams, 6), with stats
+        in the order of :data:`STAT_HEADERS`. See :meth:`query` for params.
+        """
+        unknown = set(kwargs) - set(dict(DIMENSIONS))
+        if unknown:
+            raise ValueError(f"Filters {sorted(unknown)} aren't in the cube")
+        selection = np.ix_(
+            range(len(self.entity_ids)),
+            *[
+                self._get_range_indexes(name, kwargs.get(name))
+                for name, _ in DIMENSIONS
+            ],
+            range(len(STAT_HEADERS)),
+        )
+        return self.cells[selection].sum(
+            axis=tuple(range(1, len(DIMENSIONS) + 1)), dtype=np.int64
+        )
+
+    def _get_result_set(self, totals: "np.ndarray") -> Dict:
+        # only players/teams with shots, like responses
+        rows = [
+            [int(entity_id)] + info_row + entity_totals.tolist()
+            for entity_id, info_row, entity_totals in zip(
+                self.entity_ids, self.info_rows, totals
+            )
+            if entity_totals.any()
+        ]
+        return {
+            "headers": [_get_entity_header(self.entity_type)]
+            + self.info_headers
+            + STAT_HEADERS,
+            "rowSet": rows,
+        }
+
+    def query(
+        self, result_format: ResultFormat = ResultFormat.model, **kwargs
+    ) -> List[TrackingShotItem]:
+        """
+        Gets tracking shot stats for every combination of ranges, summed from the cube
+        Returns list of TrackingShotItem with stats for each player/team, like
+        :func:`~nba_stats_tracking.tracking_shots.get_tracking_shot_stats`
+
+        :param result_format: (optional) return pydantic models, lightweight slotted items or
+            lazy results that only build models for rows that are used. Defaults to pydantic models.
+        :param list[CloseDefDist] CloseDefDistRange: (optional) Defaults to all ranges.
+        :param list[ShotClock] ShotClockRange: (optional) Defaults to all ranges.
+        :param list[TouchTime] TouchTimeRange: (optional) Defaults to all ranges.
+        :param list[Dribbles] DribbleRange: (optional) Defaults to all ranges.
+        :param list Period: (optional) 1 to 4 or ``OT``. Defaults to all periods.
+        """
+        stats = tracking_shots.parse_tracking_shot_results(
+            self._get_result_set(self.get_totals(**kwargs)), result_format
+        )
+        if self._overall is None:
+            self._overall = self._get_result_set(self.get_totals())
+        tracking_shots.set_overall_shot_totals(
+            self.entity_type, stats, self._overall, self.season, self.season_type
+        )
+        return stats
+
+
+def build_tracking_shot_cube(
+    entity_type: tracking_shots.EntityType,
+    season: str,
+    season_type: SeasonType,
+    game_date: Optional[date] = None,
+) -> TrackingShotCube:
+    """
+    Requests stats for every cell of a cube. Makes :data:`CUBE_REQUEST_COUNT` requests.
+
+    :param entity_type: Get stats for player, team or opponent
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: Season type to get stats for
+    :param game_date: (optional) only get stats for a date. Defaults to the full season.
+    """
+    _require_numpy()
+    cell_results = [
+        (
+            cell,
+            tracking_shots.get_tracking_shots_response_results_for_filter(
+                entity_type, season, season_type, **request_parameters
+            ),
+        )
+        for cell, request_parameters in get_cube_requests(game_date)
+    ]
+    return TrackingShotCube.from_result_sets(
+        entity_type, season, season_type, cell_results, game_date
+    )
+
+
+async def async_build_tracking_shot_cube(
+    entity_type: tracking_shots.EntityType,
+    season: str,
+    season_type: SeasonType,
+    game_date: Optional[date] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> TrackingShotCube:
+    """
+    Async version of :func:`build_tracking_shot_cube`
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    _require_numpy()
+    semaphore = helpers.get_semaphore(semaphore)
+    requests = get_cube_requests(game_date)
+    results = await asyncio.gather(
+        *[
+            tracking_shots.async_get_tracking_shots_response_results_for_filter(
+                entity_type,
+                season,
+                season_type,
+                semaphore=semaphore,
+                **request_parameters,
+            )
+            for _, request_parameters in requests
+        ]
+    )
+    return TrackingShotCube.from_result_sets(
+        entity_type,
+        season,
+        season_type,
+        [(cell, result) for (cell, _), result in zip(requests, results)],
+        game_date,
+    )
@@ -0,0 +1,116 @@
+"""Module for coalescing identical requests that are in flight at the same time"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+
+class _LeaderStopped(Exception):
+    # set on a call's future when the caller making it stops without a result
+    pass
+
+
+class SingleFlight:
+    """
+    Makes concurrent callers asking for the same key share a single call and its result.
+
+    The first caller for a key runs the call, callers that arrive while it is in flight
+    wait for it and get the same result (or exception). Keys are released as soon as the
+    call finishes, so later callers make a new call. Works across threads and async tasks.
+
+    Results are shared between callers and must not be modified.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def _claim(self, key: str) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            future = Future()
+            self._calls[key] = future
+            return future, True
+
+    def _release(self, key: str):
+        with self._lock:
+            self._calls.pop(key, None)
+
+    def _run(self, key: str, future: Future, call: Callable) -> Any:
+        try:
+            result = call()
+        except Exception as e:
+            self._release(key)
+            future.set_exception(e)
+            raise
+        else:
+            self._release(key)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                # leader was cancelled or interrupted, waiting callers make the call
+                self._release(key)
+                future.set_exception(_LeaderStopped())
+
+    def do(self, key: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Calls fn(*args, **kwargs) unless a call for key is already in flight,
+        in which case waits for that call's result
+        """
+        while True:
+            future, is_leader = self._claim(key)
+            if is_leader:
+                return self._run(key, future, lambda: fn(*args, **kwargs))
+            try:
+                return future.result()
+            except _LeaderStopped:
+                continue
+
+    async def async_do(self, key: str, fn: Callable, *args, **kwargs) -> Any:
+        """
+        Async version of :meth:`do`. fn must be a coroutine function.
+        When the caller making the call is cancelled, one of the callers waiting for it
+        makes the call instead.
+        """
+        while True:
+            future, is_leader = self._claim(key)
+            if is_leader:
+                break
+            try:
+                # shielded so cancelling a waiting caller doesn't cancel the shared call
+                return await asyncio.shield(asyncio.wrap_future(future))
+            except _LeaderStopped:
+                continue
+        try:
+            result = await fn(*args, **kwargs)
+        except Exception as e:
+            self._release(key)
+            future.set_exception(e)
+            raise
+        else:
+            self._release(key)
+            future.set_result(result)
+            return result
+        finally:
+            if not future.done():
+                self._release(key)
+                future.set_exception(_LeaderStopped())
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """
+    Gets the single flight group shared by all requests
+    """
+    return _single_flight
@@ -1,11 +1,22 @@
-import time
+import asyncio
+import functools
+import itertools
 from datetime import date
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, Union
 
 from dateutil.rrule import DAILY, rrule
 
-from nba_stats_tracking import helpers
-from nba_stats_tracking.models.request import PerMode, SeasonType
+from nba_stats_tracking import ASYNC_CONCURRENCY, aggregation, helpers, worker_pool
+from nba_stats_tracking.accumulator import TotalsAccumulator
+from nba_stats_tracking.columnar import ColumnarResults
+from nba_stats_tracking.models.lazy import LazyResults, concat_results
+from nba_stats_tracking.models.request import (
+    PerMode,
+    ResultFormat,
+    SeasonType,
+    WorkerType,
+)
+from nba_stats_tracking.models.slotted import get_slotted_item_class
 from nba_stats_tracking.models.tracking import (
     CatchAndShootItem,
     CatchAndShootResults,
@@ -100,7 +111,7 @@ def get_tracking_results_for_stat_measure(
     )
 
     response_json = helpers.get_json_response(
-        url, parameters.dict(by_alias=True, exclude_none=True)
+        url, parameters.dict(by_alias=True, exclude_none=True), rate_limited=True
     )
 
     # stats will be contained in first item of resultSets
@@ -112,6 +123,7 @@ def get_tracking_stats(
     seasons: List[str],
     season_types: List[SeasonType],
     player_or_team: PlayerOrTeam,
+    result_format: ResultFormat = ResultFormat.model,
     **kwargs,
 ) -> List[Any]:
     """
@@ -122,6 +134,8 @@ def get_tracking_stats(
     :param seasons: List of seasons. Format YYYY-YY ex 2019-20
     :param season_types: List of season types.
     :param player_or_team: get stats for player or team
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
     :param str DateFrom: (optional) Format - MM/DD/YYYY
     :param str DateTo: (optional) Format - MM/DD/YYYY
     :param str OpponentTeamID: (optional) nba.com team id
@@ -130,16 +144,103 @@ def get_tracking_stats(
     all_season_stats = []
     for season in seasons:
         for season_type in season_types:
-            # Making too many requests in a short period can result in timeouts. Add a delay between requests
-            time.sleep(2)
             results = get_tracking_results_for_stat_measure(
                 measure_type, season, season_type, player_or_team, **kwargs
             )
-            stats = RESPONSE_MODEL_MAP[measure_type](**results)
-            for stat in stats.results:
-                stat.season = f"{season} {season_type}"
-            all_season_stats += stats.results
-    return all_season_stats
+            all_season_stats.append(
+                parse_tracking_results(
+                    measure_type, results, season, season_type, result_format
+                )
+            )
+    return concat_results(all_season_stats)
+
+
+def parse_tracking_results(
+    measure_type: TrackingMeasureType,
+    results: Dict,
+    season: str,
+    season_type: SeasonType,
+    result_format: ResultFormat = ResultFormat.model,
+) -> List[Any]:
+    """
+    Parses response results into list of ResultItem and sets season on each item
+
+    :param measure_type: Stat measure type of the response
+    :param results: response results from :func:`get_tracking_results_for_stat_measure`
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: Season type of the response
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+    """
+    if result_format == ResultFormat.lazy:
+        return LazyResults.from_result_set(
+            DATA_ITEM_MAP[measure_type],
+            results,
+            extra={"season": f"{season} {season_type}"},
+        )
+    if result_format == ResultFormat.slotted:
+        stats = get_slotted_item_class(DATA_ITEM_MAP[measure_type]).from_rows(
+            results.get("headers", []), results.get("rowSet", [])
+        )
+    else:
+        stats = RESPONSE_MODEL_MAP[measure_type](**results).results
+    for stat in stats:
+        stat.season = f"{season} {season_type}"
+    return stats
+
+
+def get_tracking_columns(
+    measure_type: TrackingMeasureType,
+    season: str,
+    season_type: SeasonType,
+    player_or_team: PlayerOrTeam,
+    **kwargs,
+) -> ColumnarResults:
+    """
+    Gets stat measure tracking stats for a season as typed columns, without building a
+    ResultItem for each player/team. See :class:`~nba_stats_tracking.columnar.ColumnarResults`
+
+    :param measure_type: Stat measure type to get stats for
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: Season type to get stats for
+    :param player_or_team: get stats for player or team
+    :param str DateFrom: (optional) Format - MM/DD/YYYY
+    :param str DateTo: (optional) Format - MM/DD/YYYY
+    :param str OpponentTeamID: (optional) nba.com team id
+    :param `~nba_stats_tracking.models.request.PerMode` PerMode: (optional) Defaults to totals.
+    """
+    results = get_tracking_results_for_stat_measure(
+        measure_type, season, season_type, player_or_team, **kwargs
+    )
+    return ColumnarResults.from_result_set(DATA_ITEM_MAP[measure_type], results)
+
+
+def aggregate_full_season_tracking_columns_for_seasons(
+    measure_type: TrackingMeasureType,
+    seasons: List[str],
+    season_types: List[SeasonType],
+    player_or_team: PlayerOrTeam,
+    **kwargs,
+) -> Tuple[ColumnarResults, ColumnarResults]:
+    """
+    Vectorized version of :func:`aggregate_full_season_tracking_stats_for_seasons`, requires NumPy.
+    Returns columns with stats for each team/player and columns with league totals.
+    See :mod:`~nba_stats_tracking.aggregation`
+
+    :param measure_type: Stat measure type to get stats for
+    :param seasons: List of seasons. Format YYYY-YY ex 2019-20
+    :param season_types: List of season types.
+    :param player_or_team: get stats for player or team
+    :param str OpponentTeamID: (optional) nba.com team id
+    """
+    results = [
+        get_tracking_columns(
+            measure_type, season, season_type, player_or_team, **kwargs
+        )
+        for season in seasons
+        for season_type in season_types
+    ]
+    return aggregation.aggregate_full_season(results, player_or_team)
 
 
 def aggregate_full_season_tracking_stats_for_seasons(
@@ -147,6 +248,7 @@ def aggregate_full_season_tracking_stats_for_seasons(
     seasons: List[str],
     season_types: List[SeasonType],
     player_or_team: PlayerOrTeam,
+    result_format: ResultFormat = ResultFormat.model,
     **kwargs,
 ) -> Tuple[List[Any], Any]:
     """
@@ -157,10 +259,12 @@ def aggregate_full_season_tracking_stats_for_seasons(
     :param seasons: List of seasons. Format YYYY-YY ex 2019-20
     :param season_types: List of season types.
     :param player_or_team: get stats for player or team
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
     :param str OpponentTeamID: (optional) nba.com team id
     """
     stats_by_season = get_tracking_stats(
-        measure_type, seasons, season_types, player_or_team, **kwargs
+        measure_type, seasons, season_types, player_or_team, result_format, **kwargs
     )
 
     stats = sum_tracking_totals(player_or_team, measure_type, stats_by_season)
@@ -173,70 +277,154 @@ def generate_tracking_game_logs(
     player_or_team: PlayerOrTeam,
     date_from: date,
     date_to: date,
+    result_format: ResultFormat = ResultFormat.model,
+    workers: Optional[int] = None,
+    worker_type: WorkerType = WorkerType.thread,
     **kwargs,
 ) -> List[Any]:
     """
     Generates game logs for all games between two dates for desired filters
     Returns list of game log ResultItem
+    Use :func:`iter_tracking_game_logs` to get game logs for each date as soon as they are ready.
 
     :param measure_type: Stat measure type to get stats for
     :param player_or_team: get stats for player or team
     :param date_from: start date
     :param date_to: end date
-    :param dict team_id_game_id_map: (optional) dict mapping team id to game id. When
-        getting game logs for multiple separate filters for the same date it is recommended
-        that you pass this in to avoid making the same request multiple times
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+    :param workers: (optional) number of worker threads or processes to process dates
+        concurrently on, sharing the request rate limit. Game logs are still in date order.
+        Defaults to processing dates one at a time.
+    :param worker_type: (optional) thread or process workers. Defaults to threads.
+    :param dict team_id_game_id_map: (optional) dict mapping team id to game id.
     :param dict team_id_opponent_team_id_map: (optional) dict mapping team id to opponent team id.
-        When getting game logs for multiple separate filters for the same date it is recommended
-        that you pass this in to avoid making the same request multiple times
-    :param dict player_id_team_id_map: (optional) dict mapping player id to team id. When
-        getting game logs for multiple separate filters for the same date it is recommended
-        that you pass this in to avoid making the same request multiple times
+    :param dict player_id_team_id_map: (optional) dict mapping player id to team id.
+        Maps are memoized by date, so getting game logs for multiple separate filters for the same
+        date only requests them once. Use :func:`~nba_stats_tracking.helpers.clear_date_maps`
+        to clear them.
+    """
+    game_logs = []
+    for _, date_game_logs in iter_tracking_game_logs(
+        measure_type,
+        player_or_team,
+        date_from,
+        date_to,
+        result_format,
+        workers,
+        worker_type,
+        **kwargs,
+    ):
+        game_logs += date_game_logs
+    return game_logs
+
+
+def iter_tracking_game_logs(
+    measure_type: TrackingMeasureType,
+    player_or_team: PlayerOrTeam,
+    date_from: date,
+    date_to: date,
+    result_format: ResultFormat = ResultFormat.model,
+    workers: Optional[int] = None,
+    worker_type: WorkerType = WorkerType.thread,
+    **kwargs,
+) -> Iterator[Tuple[date, List[Any]]]:
+    """
+    Generator version of :func:`generate_tracking_game_logs`
+    Yields (date, game logs) for each date between the two dates as soon as the date's
+    game logs are ready, so only one date's game logs are held in memory at a time.
+    Game logs are empty for dates without games.
+    """
+    dates = [dt.date() for dt in rrule(DAILY, dtstart=date_from, until=date_to)]
+    get_game_logs = functools.partial(
+        get_tracking_game_logs_for_date,
+        measure_type,
+        player_or_team,
+        result_format=result_format,
+        **kwargs,
+    )
+    if workers is None:
+        game_logs_by_date = map(get_game_logs, dates)
+    else:
+        game_logs_by_date = worker_pool.map_dates(
+            get_game_logs, dates, workers, worker_type
+        )
+    yield from zip(dates, game_logs_by_date)
+
+
+def get_tracking_game_logs_for_date(
+    measure_type: TrackingMeasureType,
+    player_or_team: PlayerOrTeam,
+    dt: date,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> List[Any]:
+    """
+    Gets game logs for all games on a date. Empty list if there are no games.
+    See :func:`generate_tracking_game_logs` for params.
     """
     team_id_game_id_map = kwargs.get("team_id_game_id_map")
     team_id_opponent_team_id_map = kwargs.get("team_id_opponent_team_id_map")
     player_id_team_id_map = kwargs.get("player_id_team_id_map")
-    get_player_id_team_id_map = player_id_team_id_map is None
-    get_team_id_maps = (
-        team_id_game_id_map is None or team_id_opponent_team_id_map is None
+    if team_id_game_id_map is None or team_id_opponent_team_id_map is None:
+        (
+            team_id_game_id_map,
+            team_id_opponent_team_id_map,
+        ) = helpers.get_team_id_maps_for_date(dt)
+    if len(team_id_game_id_map.values()) == 0:
+        return []
+    if player_id_team_id_map is None:
+        player_id_team_id_map = helpers.get_memoized_player_team_map_for_date(dt)
+    date_game_id = list(team_id_game_id_map.values())[0]
+
+    season = helpers.get_season_from_game_id(date_game_id)
+    season_type = helpers.get_season_type_from_game_id(date_game_id)
+
+    tracking_game_logs = get_tracking_stats(
+        measure_type,
+        [season],
+        [season_type],
+        player_or_team,
+        result_format,
+        # User per game here because it gives results to more decimal places
+        PerMode=PerMode.per_game,  # camel case to match request param key
+        DateFrom=dt.strftime("%m/%d/%Y"),
+        DateTo=dt.strftime("%m/%d/%Y"),
     )
-    game_logs = []
-    for dt in rrule(DAILY, dtstart=date_from, until=date_to):
-        if get_team_id_maps:
-            (
-                team_id_game_id_map,
-                team_id_opponent_team_id_map,
-            ) = helpers.get_team_id_maps_for_date(dt)
-        if len(team_id_game_id_map.values()) != 0:
-            if get_player_id_team_id_map:
-                player_id_team_id_map = helpers.get_player_team_map_for_date(dt)
-            date_game_id = list(team_id_game_id_map.values())[0]
-
-            season = helpers.get_season_from_game_id(date_game_id)
-            season_type = helpers.get_season_type_from_game_id(date_game_id)
-
-            tracking_game_logs = get_tracking_stats(
-                measure_type,
-                [season],
-                [season_type],
-                player_or_team,
-                # User per game here because it gives results to more decimal places
-                PerMode=PerMode.per_game,  # camel case to match request param key
-                DateFrom=dt.strftime("%m/%d/%Y"),
-                DateTo=dt.strftime("%m/%d/%Y"),
-            )
-            if player_or_team == PlayerOrTeam.player:
-                # need to add team id for player because results only have last team id,
-                # which may not be the team for which they played the game
-                for game_log in tracking_game_logs:
-                    game_log.team_id = player_id_team_id_map[game_log.player_id]
-            for game_log in tracking_game_logs:
-                game_log.game_id = team_id_game_id_map[game_log.team_id]
-                game_log.opponent_team_id = team_id_opponent_team_id_map[
-                    game_log.team_id
-                ]
-            game_logs += tracking_game_logs
-    return game_logs
+    set_game_log_ids(
+        tracking_game_logs,
+        player_or_team,
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+        player_id_team_id_map,
+    )
+    return tracking_game_logs
+
+
+def set_game_log_ids(
+    game_logs: List[Any],
+    player_or_team: PlayerOrTeam,
+    team_id_game_id_map: Dict,
+    team_id_opponent_team_id_map: Dict,
+    player_id_team_id_map: Dict,
+):
+    """
+    Sets team id (for players), game id and opponent team id on game log ResultItem
+
+    :param game_logs: game log ResultItem for a single date
+    :param player_or_team: player or team game logs
+    :param team_id_game_id_map: dict mapping team id to game id
+    :param team_id_opponent_team_id_map: dict mapping team id to opponent team id
+    :param player_id_team_id_map: dict mapping player id to team id
+    """
+    if player_or_team == PlayerOrTeam.player:
+        # need to add team id for player because results only have last team id,
+        # which may not be the team for which they played the game
+        for game_log in game_logs:
+            game_log.team_id = player_id_team_id_map[game_log.player_id]
+    for game_log in game_logs:
+        game_log.game_id = team_id_game_id_map[game_log.team_id]
+        game_log.opponent_team_id = team_id_opponent_team_id_map[game_log.team_id]
 
 
 def sum_tracking_totals(
@@ -255,20 +443,236 @@ def sum_tracking_totals(
     elif entity_type == PlayerOrTeam.team:
         entity_key = "team_id"
     elif entity_type == "league":
-        totals = DATA_ITEM_MAP[measure_type](TEAM_ID="00", TEAM_ABBREVIATION="LEAGUE")
-        for items in args:
-            for item in items:
-                totals += item
+        items = list(itertools.chain.from_iterable(args))
+        # league totals are the same type as the items, ie model or slotted item
+        item_class = type(items[0]) if items else DATA_ITEM_MAP[measure_type]
+        totals = item_class(TEAM_ID="00", TEAM_ABBREVIATION="LEAGUE")
+        for item in items:
+            totals += item
         return totals
     else:
         return []
-    totals = {}
-    for items in args:
-        for item in items:
-            entity_id = item[entity_key]
-            if entity_id not in totals.keys():
-                totals[entity_id] = item
-            else:
-                totals[entity_id] += item
+    # totals are copies, so items in args aren't changed
+    totals = TotalsAccumulator(entity_key)
+    totals.update(itertools.chain.from_iterable(args))
+    return totals.results()
+
 
-    return list(totals.values())
+async def async_get_tracking_results_for_stat_measure(
+    measure_type: TrackingMeasureType,
+    season: str,
+    season_type: SeasonType,
+    player_or_team: PlayerOrTeam,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    **kwargs,
+) -> Dict:
+    """
+    Async version of :func:`get_tracking_results_for_stat_measure`
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    url = "https://stats.nba.com/stats/leaguedashptstats"
+
+    parameters = TrackingRequestParameters(
+        PtMeasureType=measure_type,
+        Season=season,
+        SeasonType=season_type,
+        PlayerOrTeam=player_or_team,
+        **kwargs,
+    )
+
+    response_json = await helpers.async_get_json_response(
+        url,
+        parameters.dict(by_alias=True, exclude_none=True),
+        semaphore=semaphore,
+        rate_limited=True,
+    )
+
+    # stats will be contained in first item of resultSets
+    return response_json["resultSets"][0]
+
+
+async def async_get_tracking_stats(
+    measure_type: TrackingMeasureType,
+    seasons: List[str],
+    season_types: List[SeasonType],
+    player_or_team: PlayerOrTeam,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> List[Any]:
+    """
+    Async version of :func:`get_tracking_stats`
+    Requests for all seasons and season types are made concurrently
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    season_filters = list(itertools.product(seasons, season_types))
+    all_results = await asyncio.gather(
+        *[
+            async_get_tracking_results_for_stat_measure(
+                measure_type,
+                season,
+                season_type,
+                player_or_team,
+                semaphore=semaphore,
+                **kwargs,
+            )
+            for season, season_type in season_filters
+        ]
+    )
+    return concat_results(
+        [
+            parse_tracking_results(
+                measure_type, results, season, season_type, result_format
+            )
+            for (season, season_type), results in zip(season_filters, all_results)
+        ]
+    )
+
+
+async def async_aggregate_full_season_tracking_stats_for_seasons(
+    measure_type: TrackingMeasureType,
+    seasons: List[str],
+    season_types: List[SeasonType],
+    player_or_team: PlayerOrTeam,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> Tuple[List[Any], Any]:
+    """
+    Async version of :func:`aggregate_full_season_tracking_stats_for_seasons`
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    stats_by_season = await async_get_tracking_stats(
+        measure_type,
+        seasons,
+        season_types,
+        player_or_team,
+        semaphore=semaphore,
+        result_format=result_format,
+        **kwargs,
+    )
+
+    stats = sum_tracking_totals(player_or_team, measure_type, stats_by_season)
+    league_totals = sum_tracking_totals("league", measure_type, stats)
+    return stats, league_totals
+
+
+async def async_generate_tracking_game_logs(
+    measure_type: TrackingMeasureType,
+    player_or_team: PlayerOrTeam,
+    date_from: date,
+    date_to: date,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> List[Any]:
+    """
+    Async version of :func:`generate_tracking_game_logs`
+    All dates are processed concurrently. Game logs are returned in date order.
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    game_logs_by_date = await asyncio.gather(
+        *[
+            _async_get_tracking_game_logs_for_date(
+                measure_type, player_or_team, dt, semaphore, result_format, **kwargs
+            )
+            for dt in rrule(DAILY, dtstart=date_from, until=date_to)
+        ]
+    )
+    return list(itertools.chain.from_iterable(game_logs_by_date))
+
+
+async def async_iter_tracking_game_logs(
+    measure_type: TrackingMeasureType,
+    player_or_team: PlayerOrTeam,
+    date_from: date,
+    date_to: date,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    dates_ahead: int = ASYNC_CONCURRENCY,
+    **kwargs,
+) -> AsyncIterator[Tuple[date, List[Any]]]:
+    """
+    Async generator version of :func:`iter_tracking_game_logs`
+    Up to ``dates_ahead`` dates are processed concurrently. (date, game logs) are yielded
+    in date order as soon as each date and all dates before it are ready.
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    :param dates_ahead: (optional) max number of dates processed at once.
+        Defaults to ASYNC_CONCURRENCY.
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    dates = [dt.date() for dt in rrule(DAILY, dtstart=date_from, until=date_to)]
+    game_logs_by_date = helpers.async_iter_in_order(
+        (
+            _async_get_tracking_game_logs_for_date(
+                measure_type, player_or_team, dt, semaphore, result_format, **kwargs
+            )
+            for dt in dates
+        ),
+        dates_ahead,
+    )
+    dates = iter(dates)
+    try:
+        async for date_game_logs in game_logs_by_date:
+            yield next(dates), date_game_logs
+    finally:
+        # cancel dates in flight if the consumer stops early
+        await game_logs_by_date.aclose()
+
+
+async def _async_get_tracking_game_logs_for_date(
+    measure_type: TrackingMeasureType,
+    player_or_team: PlayerOrTeam,
+    dt: date,
+    semaphore: asyncio.Semaphore,
+    result_format: ResultFormat,
+    **kwargs,
+) -> List[Any]:
+    team_id_game_id_map = kwargs.get("team_id_game_id_map")
+    team_id_opponent_team_id_map = kwargs.get("team_id_opponent_team_id_map")
+    player_id_team_id_map = kwargs.get("player_id_team_id_map")
+    if team_id_game_id_map is None or team_id_opponent_team_id_map is None:
+        (
+            team_id_game_id_map,
+            team_id_opponent_team_id_map,
+        ) = await helpers.async_get_team_id_maps_for_date(dt, semaphore=semaphore)
+    if len(team_id_game_id_map.values()) == 0:
+        return []
+    if player_id_team_id_map is None:
+        player_id_team_id_map = (
+            await helpers.async_get_memoized_player_team_map_for_date(
+                dt, semaphore=semaphore
+            )
+        )
+    date_game_id = list(team_id_game_id_map.values())[0]
+
+    season = helpers.get_season_from_game_id(date_game_id)
+    season_type = helpers.get_season_type_from_game_id(date_game_id)
+
+    tracking_game_logs = await async_get_tracking_stats(
+        measure_type,
+        [season],
+        [season_type],
+        player_or_team,
+        semaphore=semaphore,
+        result_format=result_format,
+        # User per game here because it gives results to more decimal places
+        PerMode=PerMode.per_game,  # camel case to match request param key
+        DateFrom=dt.strftime("%m/%d/%Y"),
+        DateTo=dt.strftime("%m/%d/%Y"),
+    )
+    set_game_log_ids(
+        tracking_game_logs,
+        player_or_team,
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+        player_id_team_id_map,
+    )
+    return tracking_game_logs
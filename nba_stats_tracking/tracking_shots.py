@@ -1,15 +1,35 @@
 """Module containing functions for accessing tracking shot stats"""
 
+import asyncio
+import functools
 import itertools
-import time
 from datetime import date
 from enum import Enum
-from typing import Dict, List, Tuple, TypedDict, Union
+from typing import (
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from dateutil.rrule import DAILY, rrule
 
-from nba_stats_tracking import helpers
-from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking import (
+    ASYNC_CONCURRENCY,
+    aggregation,
+    helpers,
+    query_planner,
+    worker_pool,
+)
+from nba_stats_tracking.accumulator import TotalsAccumulator
+from nba_stats_tracking.columnar import ColumnarResults
+from nba_stats_tracking.models.lazy import LazyResults
+from nba_stats_tracking.models.request import ResultFormat, SeasonType, WorkerType
+from nba_stats_tracking.models.slotted import get_slotted_item_class
 from nba_stats_tracking.models.tracking_shots import (
     CloseDefDist,
     Dribbles,
@@ -49,6 +69,18 @@ def get_tracking_shots_response_results_for_filter(
     :param int Period: (optional) Only get stats for specific period
     :param str Location: (optional) - Options: 'Home' or 'Road'
     """
+    url, parameters = _get_url_and_parameters(
+        entity_type, season, season_type, **kwargs
+    )
+    response_json = helpers.get_json_response(url, parameters, rate_limited=True)
+
+    # stats will be contained in first item of resultSets
+    return response_json["resultSets"][0]
+
+
+def _get_url_and_parameters(
+    entity_type: EntityType, season: str, season_type: SeasonType, **kwargs
+) -> Tuple[str, Dict]:
     if entity_type == EntityType.team:
         url = "https://stats.nba.com/stats/leaguedashteamptshot"
     elif entity_type == EntityType.player:
@@ -61,28 +93,58 @@ def get_tracking_shots_response_results_for_filter(
         SeasonType=season_type,
         **kwargs,
     )
+    return url, parameters.dict(by_alias=True, exclude_none=True)
 
-    response_json = helpers.get_json_response(
-        url, parameters.dict(by_alias=True, exclude_none=True)
-    )
 
-    # stats will be contained in first item of resultSets
-    return response_json["resultSets"][0]
+def get_tracking_shot_columns(
+    entity_type: EntityType, season: str, season_type: SeasonType, **kwargs
+) -> ColumnarResults:
+    """
+    Gets tracking shot stats for a single filter as typed columns, without building a
+    TrackingShotItem for each player/team. See :class:`~nba_stats_tracking.columnar.ColumnarResults`
+
+    :param entity_type: Get results for player, team or opponent
+    :param str season: Format YYYY-YY ex 2019-20
+    :param season_type: Season type to get stats for
+    :param str DateFrom: (optional) Format - MM/DD/YYYY
+    :param str DateTo: (optional) Format - MM/DD/YYYY
+    :param CloseDefDist CloseDefDistRange: (optional) Defaults to "".
+    :param ShotClock ShotClockRange: (optional) - Defaults to "".
+    :param ShotDist ShotDistRange: (optional) - Defaults to "".
+    :param TouchTime TouchTimeRange: (optional) - Defaults to "".
+    :param Dribbles DribbleRange: (optional) - Defaults to "".
+    :param GeneralRange GeneralRange: (optional) - Defaults to "Overall".
+    :param int Period: (optional) Only get stats for specific period
+    :param str Location: (optional) - Options: 'Home' or 'Road'
+    """
+    results = get_tracking_shots_response_results_for_filter(
+        entity_type, season, season_type, **kwargs
+    )
+    return ColumnarResults.from_result_set(TrackingShotItem, results)
 
 
 def get_tracking_shot_stats(
     entity_type: EntityType,
     seasons: List[str],
     season_types: List[SeasonType],
+    result_format: ResultFormat = ResultFormat.model,
+    derive: bool = False,
     **kwargs,
 ) -> List[TrackingShotItem]:
     """
     Gets tracking shot stats for filters
     Returns list of TrackingShotItem with stats for each player/team
 
+    Requests are planned with :func:`~nba_stats_tracking.query_planner.plan_tracking_shot_queries`,
+    which can be used to get the number of requests before making them.
+
     :param entity_type: Get results for player, team or opponent
     :param seasons: Seasons to get stats for. Format YYYY-YY ex 2019-20
     :param season_types: Season types to get stats for
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+    :param derive: (optional) derive closest defender and dribble ranges from the stats
+        without the filter when it takes fewer requests. Defaults to False.
     :param str DateFrom: (optional) Format - MM/DD/YYYY
     :param str DateTo: (optional) Format - MM/DD/YYYY
     :param list[CloseDefDist] CloseDefDistRange: (optional)
@@ -94,6 +156,63 @@ def get_tracking_shot_stats(
     :param list[int] Period: (optional) Only get stats for specific period
     :param str Location: (optional) - Options: 'Home' or 'Road'
     """
+    plan = query_planner.plan_tracking_shot_queries(derive, **kwargs)
+
+    all_season_stats = []
+    for season in seasons:
+        for season_type in season_types:
+            results, overall_results = plan.combine(
+                entity_type,
+                [
+                    get_tracking_shots_response_results_for_filter(
+                        entity_type, season, season_type, **request_parameters
+                    )
+                    for request_parameters in plan.requests
+                ],
+            )
+            stats = parse_tracking_shot_results(results, result_format)
+            # overall FGA, FG2A and FG3A are used to compute frequencies
+            set_overall_shot_totals(
+                entity_type, stats, overall_results, season, season_type
+            )
+            all_season_stats += stats
+    return all_season_stats
+
+
+def parse_tracking_shot_results(
+    results: Dict, result_format: ResultFormat = ResultFormat.model
+) -> List[TrackingShotItem]:
+    """
+    Parses response results into list of TrackingShotItem
+
+    :param results: response results from :func:`get_tracking_shots_response_results_for_filter`
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+    """
+    if result_format == ResultFormat.lazy:
+        return LazyResults.from_result_set(TrackingShotItem, results)
+    if result_format == ResultFormat.slotted:
+        return get_slotted_item_class(TrackingShotItem).from_rows(
+            results.get("headers", []), results.get("rowSet", [])
+        )
+    return TrackingShotResults(**results).results
+
+
+def get_tracking_shot_filters(**kwargs) -> List[Dict]:
+    """
+    Gets request parameters for every combination of filters
+
+    :param list[CloseDefDist] CloseDefDistRange: (optional)
+    :param list[ShotClock] ShotClockRange: (optional)
+    :param list[ShotDist] ShotDistRange: (optional)
+    :param list[TouchTime] TouchTimeRange: (optional)
+    :param list[Dribbles] DribbleRange: (optional)
+    :param list[General] GeneralRange: (optional)
+    :param list[int] Period: (optional) Only get stats for specific period
+    :param str DateFrom: (optional) Format - MM/DD/YYYY
+    :param str DateTo: (optional) Format - MM/DD/YYYY
+    :param str Location: (optional) - Options: 'Home' or 'Road'
+    """
     close_def_dists = kwargs.get("CloseDefDistRange", [CloseDefDist.all])
     shot_clocks = kwargs.get("ShotClockRange", [ShotClock.all])
     shot_dists = kwargs.get("ShotDistRange", [ShotDist.all])
@@ -101,8 +220,20 @@ def get_tracking_shot_stats(
     dribble_ranges = kwargs.get("DribbleRange", [Dribbles.all])
     general_ranges = kwargs.get("GeneralRange", [GeneralRange.overall])
     periods = kwargs.get("Period", [""])
-    filters = list(
-        itertools.product(
+    return [
+        {
+            "CloseDefDistRange": close_def,  # camel case to match request param key
+            "ShotClockRange": clock,
+            "ShotDistRange": dist,
+            "TouchTimeRange": touch,
+            "DribbleRange": dribbles,
+            "GeneralRange": general,
+            "DateFrom": kwargs.get("DateFrom", ""),
+            "DateTo": kwargs.get("DateTo", ""),
+            "Period": str(period),
+            "Location": kwargs.get("Location", ""),
+        }
+        for close_def, clock, dist, touch, dribbles, general, period in itertools.product(
             close_def_dists,
             shot_clocks,
             shot_dists,
@@ -111,67 +242,49 @@ def get_tracking_shot_stats(
             general_ranges,
             periods,
         )
-    )
+    ]
 
-    all_season_stats = []
-    for season in seasons:
-        for season_type in season_types:
-            season_stats = []
-            for close_def, clock, dist, touch, dribbles, general, period in filters:
-                # Making too many requests in a short period can result in timeouts. Add a delay between requests
-                time.sleep(2)
-                results = get_tracking_shots_response_results_for_filter(
-                    entity_type,
-                    season,
-                    season_type,
-                    CloseDefDistRange=close_def,  # camel case to match request param key
-                    ShotClockRange=clock,
-                    ShotDistRange=dist,
-                    TouchTimeRange=touch,
-                    DribbleRange=dribbles,
-                    GeneralRange=general,
-                    DateFrom=kwargs.get("DateFrom", ""),
-                    DateTo=kwargs.get("DateTo", ""),
-                    Period=str(period),
-                    Location=kwargs.get("Location", ""),
-                )
-                filter_stats = TrackingShotResults(**results)
-                season_stats.append(filter_stats.results)
-            stats = sum_tracking_shot_totals(entity_type, *season_stats)
-            # Get overall FGA, FG2A and FG3A to compute frequencies
-            overall_results = get_tracking_shots_response_results_for_filter(
-                entity_type,
-                season,
-                season_type,
-                GeneralRange=GeneralRange.overall,
-                DateFrom=kwargs.get("DateFrom", ""),
-                DateTo=kwargs.get("DateTo", ""),
-            )
-            overall_stats = TrackingShotResults(**overall_results)
-            entity_id_key = "player_id" if entity_type == "player" else "team_id"
-            overall_stats_by_entity = {
-                stat[entity_id_key]: {
-                    "fga": stat.fga,
-                    "fg2a": stat.fg2a,
-                    "fg3a": stat.fg3a,
-                }
-                for stat in overall_stats.results
-            }
-            for stat in stats:
-                entity_id = stat[entity_id_key]
-                stat.season = f"{season} {season_type}"
-                stat.overall_fga = overall_stats_by_entity[entity_id]["fga"]
-                stat.overall_fg2a = overall_stats_by_entity[entity_id]["fg2a"]
-                stat.overall_fg3a = overall_stats_by_entity[entity_id]["fg3a"]
 
-            all_season_stats += stats
-    return all_season_stats
+def set_overall_shot_totals(
+    entity_type: EntityType,
+    stats: List[TrackingShotItem],
+    overall_results: Dict,
+    season: str,
+    season_type: SeasonType,
+):
+    """
+    Sets season and overall FGA, FG2A and FG3A, used to compute frequencies, on TrackingShotItem
+
+    :param entity_type: player, team or opponent
+    :param stats: TrackingShotItem to update
+    :param overall_results: response results for overall filter
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: Season type of the stats
+    """
+    # only read to get overall totals, so parse into lightweight items
+    overall_stats = parse_tracking_shot_results(overall_results, ResultFormat.slotted)
+    entity_id_key = "player_id" if entity_type == "player" else "team_id"
+    overall_stats_by_entity = {
+        stat[entity_id_key]: {
+            "fga": stat.fga,
+            "fg2a": stat.fg2a,
+            "fg3a": stat.fg3a,
+        }
+        for stat in overall_stats
+    }
+    for stat in stats:
+        entity_id = stat[entity_id_key]
+        stat.season = f"{season} {season_type}"
+        stat.overall_fga = overall_stats_by_entity[entity_id]["fga"]
+        stat.overall_fg2a = overall_stats_by_entity[entity_id]["fg2a"]
+        stat.overall_fg3a = overall_stats_by_entity[entity_id]["fg3a"]
 
 
 def aggregate_full_season_tracking_shot_stats_for_seasons(
     entity_type: EntityType,
     seasons: List[str],
     season_types: List[SeasonType],
+    result_format: ResultFormat = ResultFormat.model,
     **kwargs,
 ) -> Tuple[List[TrackingShotItem], TrackingShotItem]:
     """
@@ -181,6 +294,9 @@ def aggregate_full_season_tracking_shot_stats_for_seasons(
     :param entity_type: Get results for player, team or opponent
     :param seasons: List of seasons.Format YYYY-YY ex 2019-20
     :param season_types: Season types to get stats for
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+        Results for filters are summed, which builds models for all rows of lazy results.
     :param list[CloseDefDist] CloseDefDistRange: (optional)
     :param list[ShotClock] ShotClockRange: (optional)
     :param list[ShotDist] ShotDistRange: (optional)
@@ -191,7 +307,7 @@ def aggregate_full_season_tracking_shot_stats_for_seasons(
     :param str Location: (optional) - Options: 'Home' or 'Road'
     """
     stats_by_season = get_tracking_shot_stats(
-        entity_type, seasons, season_types, **kwargs
+        entity_type, seasons, season_types, result_format, **kwargs
     )
 
     stats = sum_tracking_shot_totals(entity_type, stats_by_season)
@@ -199,25 +315,90 @@ def aggregate_full_season_tracking_shot_stats_for_seasons(
     return stats, league_totals
 
 
+def aggregate_full_season_tracking_shot_columns_for_seasons(
+    entity_type: EntityType,
+    seasons: List[str],
+    season_types: List[SeasonType],
+    derive: bool = False,
+    **kwargs,
+) -> Tuple[ColumnarResults, ColumnarResults]:
+    """
+    Vectorized version of :func:`aggregate_full_season_tracking_shot_stats_for_seasons`, requires NumPy.
+    Returns columns with stats for each team/player and columns with league totals.
+    See :mod:`~nba_stats_tracking.aggregation`
+
+    :param entity_type: Get results for player, team or opponent
+    :param seasons: List of seasons.Format YYYY-YY ex 2019-20
+    :param season_types: Season types to get stats for
+    :param derive: (optional) derive closest defender and dribble ranges from the stats
+        without the filter when it takes fewer requests. Defaults to False.
+    :param list[CloseDefDist] CloseDefDistRange: (optional)
+    :param list[ShotClock] ShotClockRange: (optional)
+    :param list[ShotDist] ShotDistRange: (optional)
+    :param list[TouchTime] TouchTimeRange: (optional)
+    :param list[Dribbles] DribbleRange: (optional)
+    :param list[GeneralRange] GeneralRange: (optional)
+    :param list[int] Period: (optional) Only get stats for specific period
+    :param str Location: (optional) - Options: 'Home' or 'Road'
+    """
+    plan = query_planner.plan_tracking_shot_queries(derive, **kwargs)
+    entity_key = aggregation.get_entity_key(entity_type)
+    season_totals = []
+    for season in seasons:
+        for season_type in season_types:
+            results, overall_results = plan.combine(
+                entity_type,
+                [
+                    get_tracking_shots_response_results_for_filter(
+                        entity_type, season, season_type, **request_parameters
+                    )
+                    for request_parameters in plan.requests
+                ],
+            )
+            season_stats = aggregation.aggregate(
+                ColumnarResults.from_result_set(TrackingShotItem, results),
+                entity_type,
+            )
+            # overall FGA, FG2A and FG3A are used to compute frequencies
+            overall = ColumnarResults.from_result_set(TrackingShotItem, overall_results)
+            for name in ["fga", "fg2a", "fg3a"]:
+                season_stats.columns[f"overall_{name}"] = aggregation.lookup(
+                    season_stats[entity_key], overall[entity_key], overall[name]
+                )
+            season_totals.append(season_stats)
+    return aggregation.aggregate_full_season(season_totals, entity_type)
+
+
 def generate_tracking_shot_game_logs(
-    entity_type: EntityType, date_from: date, date_to: date, **kwargs
+    entity_type: EntityType,
+    date_from: date,
+    date_to: date,
+    result_format: ResultFormat = ResultFormat.model,
+    workers: Optional[int] = None,
+    worker_type: WorkerType = WorkerType.thread,
+    **kwargs,
 ) -> List[TrackingShotItem]:
     """
     Generates game logs for all games between two dates for desired filters
     Returns list of TrackingShotItem
+    Use :func:`iter_tracking_shot_game_logs` to get game logs for each date as soon as they are ready.
 
     :param entity_type: Get results for player, team or opponent
     :param date_from: start date
     :param date_to: end date
-    :param dict team_id_game_id_map: (optional) dict mapping team id to game id. When
-        getting game logs for multiple separate filters for the same date it is recommended
-        that you pass this in to avoid making the same request multiple times
+    :param result_format: (optional) return pydantic models, lightweight slotted items or
+        lazy results that only build models for rows that are used. Defaults to pydantic models.
+        Results for filters are summed, which builds models for all rows of lazy results.
+    :param workers: (optional) number of worker threads or processes to process dates
+        concurrently on, sharing the request rate limit. Game logs are still in date order.
+        Defaults to processing dates one at a time.
+    :param worker_type: (optional) thread or process workers. Defaults to threads.
+    :param dict team_id_game_id_map: (optional) dict mapping team id to game id.
     :param dict team_id_opponent_team_id_map: (optional) dict mapping team id to opponent team id.
-        When getting game logs for multiple separate filters for the same date it is recommended
-        that you pass this in to avoid making the same request multiple times
-    :param dict player_id_team_id_map: (optional) dict mapping player id to team id. When
-        getting game logs for multiple separate filters for the same date it is recommended
-        that you pass this in to avoid making the same request multiple times
+    :param dict player_id_team_id_map: (optional) dict mapping player id to team id.
+        Maps are memoized by date, so getting game logs for multiple separate filters for the same
+        date only requests them once. Use :func:`~nba_stats_tracking.helpers.clear_date_maps`
+        to clear them.
     :param CloseDefDist CloseDefDistRange: (optional) Defaults to "".
     :param ShotClock ShotClockRange: (optional) - Defaults to "".
     :param ShotDist ShotDistRange: (optional) - Defaults to "".
@@ -227,53 +408,126 @@ def generate_tracking_shot_game_logs(
     :param int Period: (optional) Only get stats for specific period
     :param str Location: (optional) - Options: 'Home' or 'Road'
     """
+    game_logs = []
+    for _, date_game_logs in iter_tracking_shot_game_logs(
+        entity_type,
+        date_from,
+        date_to,
+        result_format,
+        workers,
+        worker_type,
+        **kwargs,
+    ):
+        game_logs += date_game_logs
+    return game_logs
+
+
+def iter_tracking_shot_game_logs(
+    entity_type: EntityType,
+    date_from: date,
+    date_to: date,
+    result_format: ResultFormat = ResultFormat.model,
+    workers: Optional[int] = None,
+    worker_type: WorkerType = WorkerType.thread,
+    **kwargs,
+) -> Iterator[Tuple[date, List[TrackingShotItem]]]:
+    """
+    Generator version of :func:`generate_tracking_shot_game_logs`
+    Yields (date, game logs) for each date between the two dates as soon as the date's
+    game logs are ready, so only one date's game logs are held in memory at a time.
+    Game logs are empty for dates without games.
+    """
+    dates = [dt.date() for dt in rrule(DAILY, dtstart=date_from, until=date_to)]
+    get_game_logs = functools.partial(
+        get_tracking_shot_game_logs_for_date,
+        entity_type,
+        result_format=result_format,
+        **kwargs,
+    )
+    if workers is None:
+        game_logs_by_date = map(get_game_logs, dates)
+    else:
+        game_logs_by_date = worker_pool.map_dates(
+            get_game_logs, dates, workers, worker_type
+        )
+    yield from zip(dates, game_logs_by_date)
+
+
+def get_tracking_shot_game_logs_for_date(
+    entity_type: EntityType,
+    dt: date,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> List[TrackingShotItem]:
+    """
+    Gets game logs for all games on a date. Empty list if there are no games.
+    See :func:`generate_tracking_shot_game_logs` for params.
+    """
     team_id_game_id_map = kwargs.get("team_id_game_id_map")
     team_id_opponent_team_id_map = kwargs.get("team_id_opponent_team_id_map")
     player_id_team_id_map = kwargs.get("player_id_team_id_map")
-    get_player_id_team_id_map = player_id_team_id_map is None
-    get_team_id_maps = (
-        team_id_game_id_map is None or team_id_opponent_team_id_map is None
+    if team_id_game_id_map is None or team_id_opponent_team_id_map is None:
+        (
+            team_id_game_id_map,
+            team_id_opponent_team_id_map,
+        ) = helpers.get_team_id_maps_for_date(dt)
+    if len(team_id_game_id_map.values()) == 0:
+        return []
+    if player_id_team_id_map is None:
+        player_id_team_id_map = helpers.get_memoized_player_team_map_for_date(dt)
+    date_game_id = list(team_id_game_id_map.values())[0]
+
+    season = helpers.get_season_from_game_id(date_game_id)
+    season_type = helpers.get_season_type_from_game_id(date_game_id)
+
+    tracking_shots_data = get_tracking_shot_stats(
+        entity_type,
+        [season],
+        [season_type],
+        result_format,
+        DateFrom=dt.strftime("%m/%d/%Y"),
+        DateTo=dt.strftime("%m/%d/%Y"),
+        **kwargs,
     )
-    game_logs = []
-    for dt in rrule(DAILY, dtstart=date_from, until=date_to):
-        if get_team_id_maps:
-            (
-                team_id_game_id_map,
-                team_id_opponent_team_id_map,
-            ) = helpers.get_team_id_maps_for_date(dt)
-        if len(team_id_game_id_map.values()) != 0:
-            if get_player_id_team_id_map:
-                player_id_team_id_map = helpers.get_player_team_map_for_date(dt)
-            date_game_id = list(team_id_game_id_map.values())[0]
-
-            season = helpers.get_season_from_game_id(date_game_id)
-            season_type = helpers.get_season_type_from_game_id(date_game_id)
-
-            tracking_shots_data = get_tracking_shot_stats(
-                entity_type,
-                [season],
-                [season_type],
-                DateFrom=dt.strftime("%m/%d/%Y"),
-                DateTo=dt.strftime("%m/%d/%Y"),
-                **kwargs,
-            )
-            tracking_shots_game_logs = sum_tracking_shot_totals(
-                entity_type, tracking_shots_data
-            )
-            if entity_type == "player":
-                # need to add team id for player because results only have PLAYER_LAST_TEAM_ID,
-                # which may not be the team for which they played the game
-                for game_log in tracking_shots_game_logs:
-                    if game_log.player_id in player_id_team_id_map.keys():
-                        game_log.team_id = player_id_team_id_map[game_log.player_id]
-            for game_log in tracking_shots_game_logs:
-                if game_log.team_id is not None:
-                    game_log.game_id = team_id_game_id_map[game_log.team_id]
-                    game_log.opponent_team_id = team_id_opponent_team_id_map[
-                        game_log.team_id
-                    ]
-            game_logs += tracking_shots_game_logs
-    return game_logs
+    tracking_shots_game_logs = sum_tracking_shot_totals(
+        entity_type, tracking_shots_data
+    )
+    set_game_log_ids(
+        tracking_shots_game_logs,
+        entity_type,
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+        player_id_team_id_map,
+    )
+    return tracking_shots_game_logs
+
+
+def set_game_log_ids(
+    game_logs: List[TrackingShotItem],
+    entity_type: EntityType,
+    team_id_game_id_map: Dict,
+    team_id_opponent_team_id_map: Dict,
+    player_id_team_id_map: Dict,
+):
+    """
+    Sets team id (for players), game id and opponent team id on game log TrackingShotItem
+
+    :param game_logs: game log TrackingShotItem for a single date
+    :param entity_type: player, team or opponent
+    :param team_id_game_id_map: dict mapping team id to game id
+    :param team_id_opponent_team_id_map: dict mapping team id to opponent team id
+    :param player_id_team_id_map: dict mapping player id to team id
+    """
+    if entity_type == "player":
+        # need to add team id for player because results only have PLAYER_LAST_TEAM_ID,
+        # which may not be the team for which they played the game
+        for game_log in game_logs:
+            if game_log.player_id in player_id_team_id_map.keys():
+                game_log.team_id = player_id_team_id_map[game_log.player_id]
+    for game_log in game_logs:
+        if game_log.team_id is not None:
+            game_log.game_id = team_id_game_id_map[game_log.team_id]
+            game_log.opponent_team_id = team_id_opponent_team_id_map[game_log.team_id]
 
 
 def sum_tracking_shot_totals(
@@ -291,20 +545,247 @@ def sum_tracking_shot_totals(
     elif entity_type == "team" or entity_type == "opponent":
         entity_key = "team_id"
     elif entity_type == "league":
-        totals = TrackingShotItem(TEAM_ID=0, TEAM_ABBREVIATION="LEAGUE")
-        for items in args:
-            for item in items:
-                totals += item
+        items = list(itertools.chain.from_iterable(args))
+        # league totals are the same type as the items, ie model or slotted item
+        item_class = type(items[0]) if items else TrackingShotItem
+        totals = item_class(TEAM_ID=0, TEAM_ABBREVIATION="LEAGUE")
+        for item in items:
+            totals += item
         return totals
     else:
         return []
-    totals = {}
-    for item in args:
-        for result in item:
-            entity_id = result[entity_key]
-            if entity_id not in totals.keys():
-                totals[entity_id] = result
-            else:
-                totals[entity_id] += result
-
-    return list(totals.values())
+    # totals are copies, so items in args aren't changed
+    totals = TotalsAccumulator(entity_key)
+    totals.update(itertools.chain.from_iterable(args))
+    return totals.results()
+
+
+async def async_get_tracking_shots_response_results_for_filter(
+    entity_type: EntityType,
+    season: str,
+    season_type: SeasonType,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    **kwargs,
+) -> Dict:
+    """
+    Async version of :func:`get_tracking_shots_response_results_for_filter`
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    url, parameters = _get_url_and_parameters(
+        entity_type, season, season_type, **kwargs
+    )
+    response_json = await helpers.async_get_json_response(
+        url, parameters, semaphore=semaphore, rate_limited=True
+    )
+
+    # stats will be contained in first item of resultSets
+    return response_json["resultSets"][0]
+
+
+async def async_get_tracking_shot_stats(
+    entity_type: EntityType,
+    seasons: List[str],
+    season_types: List[SeasonType],
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    derive: bool = False,
+    **kwargs,
+) -> List[TrackingShotItem]:
+    """
+    Async version of :func:`get_tracking_shot_stats`
+    Requests for all filters, seasons and season types are made concurrently
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    plan = query_planner.plan_tracking_shot_queries(derive, **kwargs)
+    season_filters = list(itertools.product(seasons, season_types))
+    all_season_stats = []
+    season_results = await asyncio.gather(
+        *[
+            _async_get_tracking_shot_stats_for_season(
+                entity_type,
+                season,
+                season_type,
+                plan,
+                semaphore,
+                result_format,
+            )
+            for season, season_type in season_filters
+        ]
+    )
+    for stats in season_results:
+        all_season_stats += stats
+    return all_season_stats
+
+
+async def _async_get_tracking_shot_stats_for_season(
+    entity_type: EntityType,
+    season: str,
+    season_type: SeasonType,
+    plan: query_planner.ShotQueryPlan,
+    semaphore: asyncio.Semaphore,
+    result_format: ResultFormat,
+) -> List[TrackingShotItem]:
+    results, overall_results = plan.combine(
+        entity_type,
+        await asyncio.gather(
+            *[
+                async_get_tracking_shots_response_results_for_filter(
+                    entity_type,
+                    season,
+                    season_type,
+                    semaphore=semaphore,
+                    **request_parameters,
+                )
+                for request_parameters in plan.requests
+            ]
+        ),
+    )
+    stats = parse_tracking_shot_results(results, result_format)
+    # overall FGA, FG2A and FG3A are used to compute frequencies
+    set_overall_shot_totals(entity_type, stats, overall_results, season, season_type)
+    return stats
+
+
+async def async_aggregate_full_season_tracking_shot_stats_for_seasons(
+    entity_type: EntityType,
+    seasons: List[str],
+    season_types: List[SeasonType],
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> Tuple[List[TrackingShotItem], TrackingShotItem]:
+    """
+    Async version of :func:`aggregate_full_season_tracking_shot_stats_for_seasons`
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    stats_by_season = await async_get_tracking_shot_stats(
+        entity_type,
+        seasons,
+        season_types,
+        semaphore=semaphore,
+        result_format=result_format,
+        **kwargs,
+    )
+
+    stats = sum_tracking_shot_totals(entity_type, stats_by_season)
+    league_totals = sum_tracking_shot_totals("league", stats_by_season)
+    return stats, league_totals
+
+
+async def async_generate_tracking_shot_game_logs(
+    entity_type: EntityType,
+    date_from: date,
+    date_to: date,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    **kwargs,
+) -> List[TrackingShotItem]:
+    """
+    Async version of :func:`generate_tracking_shot_game_logs`
+    All dates are processed concurrently. Game logs are returned in date order.
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    game_logs_by_date = await asyncio.gather(
+        *[
+            _async_get_tracking_shot_game_logs_for_date(
+                entity_type, dt, semaphore, result_format, **kwargs
+            )
+            for dt in rrule(DAILY, dtstart=date_from, until=date_to)
+        ]
+    )
+    return list(itertools.chain.from_iterable(game_logs_by_date))
+
+
+async def async_iter_tracking_shot_game_logs(
+    entity_type: EntityType,
+    date_from: date,
+    date_to: date,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    result_format: ResultFormat = ResultFormat.model,
+    dates_ahead: int = ASYNC_CONCURRENCY,
+    **kwargs,
+) -> AsyncIterator[Tuple[date, List[TrackingShotItem]]]:
+    """
+    Async generator version of :func:`iter_tracking_shot_game_logs`
+    Up to ``dates_ahead`` dates are processed concurrently. (date, game logs) are yielded
+    in date order as soon as each date and all dates before it are ready.
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    :param dates_ahead: (optional) max number of dates processed at once.
+        Defaults to ASYNC_CONCURRENCY.
+    """
+    semaphore = helpers.get_semaphore(semaphore)
+    dates = [dt.date() for dt in rrule(DAILY, dtstart=date_from, until=date_to)]
+    game_logs_by_date = helpers.async_iter_in_order(
+        (
+            _async_get_tracking_shot_game_logs_for_date(
+                entity_type, dt, semaphore, result_format, **kwargs
+            )
+            for dt in dates
+        ),
+        dates_ahead,
+    )
+    dates = iter(dates)
+    try:
+        async for date_game_logs in game_logs_by_date:
+            yield next(dates), date_game_logs
+    finally:
+        # cancel dates in flight if the consumer stops early
+        await game_logs_by_date.aclose()
+
+
+async def _async_get_tracking_shot_game_logs_for_date(
+    entity_type: EntityType,
+    dt: date,
+    semaphore: asyncio.Semaphore,
+    result_format: ResultFormat,
+    **kwargs,
+) -> List[TrackingShotItem]:
+    team_id_game_id_map = kwargs.get("team_id_game_id_map")
+    team_id_opponent_team_id_map = kwargs.get("team_id_opponent_team_id_map")
+    player_id_team_id_map = kwargs.get("player_id_team_id_map")
+    if team_id_game_id_map is None or team_id_opponent_team_id_map is None:
+        (
+            team_id_game_id_map,
+            team_id_opponent_team_id_map,
+        ) = await helpers.async_get_team_id_maps_for_date(dt, semaphore=semaphore)
+    if len(team_id_game_id_map.values()) == 0:
+        return []
+    if player_id_team_id_map is None:
+        player_id_team_id_map = (
+            await helpers.async_get_memoized_player_team_map_for_date(
+                dt, semaphore=semaphore
+            )
+        )
+    date_game_id = list(team_id_game_id_map.values())[0]
+
+    season = helpers.get_season_from_game_id(date_game_id)
+    season_type = helpers.get_season_type_from_game_id(date_game_id)
+
+    tracking_shots_data = await async_get_tracking_shot_stats(
+        entity_type,
+        [season],
+        [season_type],
+        semaphore=semaphore,
+        result_format=result_format,
+        DateFrom=dt.strftime("%m/%d/%Y"),
+        DateTo=dt.strftime("%m/%d/%Y"),
+        **kwargs,
+    )
+    tracking_shots_game_logs = sum_tracking_shot_totals(
+        entity_type, tracking_shots_data
+    )
+    set_game_log_ids(
+        tracking_shots_game_logs,
+        entity_type,
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+        player_id_team_id_map,
+    )
+    return tracking_shots_game_logs
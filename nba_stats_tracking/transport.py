@@ -0,0 +1,159 @@
+"""
+Module containing transports that stats requests are sent through.
+
+By default requests go to stats.nba.com using the shared session. A :class:`ReplayTransport`
+serves responses from files on disk instead, so everything can run without a network.
+"""
+
+import json
+import os
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+import requests
+
+from nba_stats_tracking import HEADERS, REQUEST_TIMEOUT, session
+from nba_stats_tracking.request_key import canonicalize_params, get_endpoint
+
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+class MissingResponseError(LookupError):
+    """
+    Raised when a replay transport has no response for a request
+    """
+
+
+class Transport(ABC):
+    """
+    Base class for transports. Subclasses implement :meth:`get_json`.
+
+    `rate_limited` is False for transports that don't talk to stats.nba.com,
+    so requests through them don't wait for the shared rate limiter.
+    """
+
+    rate_limited = True
+
+    @abstractmethod
+    def get_json(self, url: str, params: Dict) -> Optional[Dict]:
+        """
+        Makes a single request and returns the json response
+
+        :param url: endpoint url
+        :param params: query string parameters
+        """
+
+
+class RequestsTransport(Transport):
+    """
+    Sends requests to stats.nba.com with a requests session
+
+    :param http_session: (optional) session to make requests with. Defaults to the
+        shared session from :mod:`nba_stats_tracking.session`
+    """
+
+    def __init__(self, http_session: Optional[requests.Session] = None):
+        self.http_session = http_session
+
+    def get_json(self, url: str, params: Dict) -> Optional[Dict]:
+        http_session = self.http_session
+        if http_session is None:
+            http_session = session.get_session()
+        response = http_session.get(
+            url, params=params, headers=HEADERS, timeout=REQUEST_TIMEOUT
+        )
+        if response.status_code == 200:
+            return response.json()
+        else:
+            response.raise_for_status()
+
+
+def get_replay_key(url: str, params: Dict) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+    """
+    Gets key replayed responses are matched on - endpoint name (case insensitive) and
+    canonicalized params. The host is ignored.
+    """
+    return get_endpoint(url).lower(), tuple(canonicalize_params(params))
+
+
+class ReplayTransport(Transport):
+    """
+    Serves responses from json files in a directory, ex one laid out like tests/data.
+
+    The directory must contain a manifest.json file with a list of entries like::
+
+        {
+            "endpoint": "leaguedashptstats",
+            "params": {"PtMeasureType": "CatchShoot", "Season": "2019-20", ...},
+            "path": "tracking/2019-20/team-playoffs/CatchShoot.json"
+        }
+
+    Requests are matched on endpoint and canonicalized params, `path` is relative to the
+    directory. Requests without a matching entry raise :class:`MissingResponseError`.
+
+    :param directory: directory with manifest.json and response files
+    """
+
+    rate_limited = False
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._paths = {}
+        for entry in self.load_manifest(directory):
+            key = get_replay_key(entry["endpoint"], entry["params"])
+            self._paths[key] = entry["path"]
+
+    @staticmethod
+    def load_manifest(directory: str) -> List[Dict]:
+        manifest_path = os.path.join(directory, MANIFEST_FILE_NAME)
+        if not os.path.exists(manifest_path):
+            return []
+        with open(manifest_path) as f:
+            return json.load(f)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __contains__(self, request: Tuple[str, Dict]) -> bool:
+        url, params = request
+        return get_replay_key(url, params) in self._paths
+
+    def get_json(self, url: str, params: Dict) -> Optional[Dict]:
+        key = get_replay_key(url, params)
+        path = self._paths.get(key)
+        if path is None:
+            raise MissingResponseError(
+                f"No replay response for {key[0]} {dict(key[1])}"
+            )
+        with open(os.path.join(self.directory, path)) as f:
+            return json.load(f)
+
+
+_transport = RequestsTransport()
+
+
+def get_transport() -> Transport:
+    """
+    Gets the transport used by all requests
+    """
+    return _transport
+
+
+def set_transport(transport: Optional[Transport]):
+    """
+    Replaces the transport used by all requests. Pass None to go back to
+    sending requests to stats.nba.com with the shared session.
+
+    :param transport: transport to use for all requests
+    """
+    global _transport
+    _transport = transport if transport is not None else RequestsTransport()
+
+
+def configure_replay(directory: str):
+    """
+    Serves all responses from files in a directory instead of stats.nba.com
+
+    :param directory: directory with manifest.json and response files
+    """
+    set_transport(ReplayTransport(directory))
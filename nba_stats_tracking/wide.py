@@ -0,0 +1,257 @@
+"""
+Module for joining stats for multiple tracking measure types into one wide table with a row
+for each player/team, season and game.
+
+Stat columns are prefixed with the measure type name, ex ``drives_points`` or
+``catch_and_shoot_fg3pct``. Ids, names, season and game are not prefixed, and columns that
+are in every measure type (``games_played``, ``wins``, ``losses`` and ``minutes``) are only
+included once, from the first measure type with stats for the row. Players/teams that
+aren't in the results for a measure type have None for its columns.
+"""
+
+import asyncio
+import itertools
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from nba_stats_tracking import aggregation, helpers, tracking
+from nba_stats_tracking.columnar import get_alias_field_map
+from nba_stats_tracking.models import fields
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+
+KEY_FIELDS = [
+    "player_id",
+    "player_name",
+    "team_id",
+    "team_abbreviation",
+    "team_name",
+    "season",
+    "game_id",
+    "opponent_team_id",
+]
+
+# in every measure type, only included once
+SHARED_FIELDS = ["games_played", "wins", "losses", "minutes"]
+
+
+def get_column_prefix(measure_type: TrackingMeasureType) -> str:
+    """
+    Gets prefix for columns of a measure type, ex ``catch_and_shoot`` for CatchShoot
+    """
+    return TrackingMeasureType(measure_type).name
+
+
+def get_measure_columns(measure_type: TrackingMeasureType) -> List[Tuple[str, str]]:
+    """
+    Gets (field or ratio name, column name) for the stat columns of a measure type
+
+    :param measure_type: Stat measure type
+    """
+    item_class = tracking.DATA_ITEM_MAP[measure_type]
+    prefix = get_column_prefix(measure_type)
+    names = [
+        field.name
+        for field in item_class.__fields__.values()
+        if fields.get_field_aggregation(field) is not None
+        and field.name not in SHARED_FIELDS
+    ]
+    names += list(fields.get_ratios(item_class))
+    return [(name, f"{prefix}_{name}") for name in names]
+
+
+def join_records(
+    records_by_measure: Dict[TrackingMeasureType, Iterable[Dict[str, Any]]],
+    player_or_team: PlayerOrTeam,
+) -> List[Dict[str, Any]]:
+    """
+    Hash joins stats for multiple measure types on player/team id, season and game id.
+    Rows are in order of first appearance.
+
+    :param records_by_measure: dict mapping measure type to stats as dicts keyed by field name
+    :param player_or_team: player or team stats
+    """
+    entity_key = aggregation.get_entity_key(player_or_team)
+    columns_by_measure = {
+        measure_type: get_measure_columns(measure_type)
+        for measure_type in records_by_measure
+    }
+    empty_row = {name: None for name in KEY_FIELDS + SHARED_FIELDS}
+    for columns in columns_by_measure.values():
+        empty_row.update((column, None) for _, column in columns)
+
+    rows = {}
+    for measure_type, records in records_by_measure.items():
+        ratios = fields.get_ratios(tracking.DATA_ITEM_MAP[measure_type])
+        columns = columns_by_measure[measure_type]
+        for record in records:
+            key = (record[entity_key], record.get("season"), record.get("game_id"))
+            row = rows.get(key)
+            if row is None:
+                row = dict(empty_row)
+                rows[key] = row
+            for name in KEY_FIELDS + SHARED_FIELDS:
+                if row[name] is None:
+                    row[name] = record.get(name)
+            for name, column in columns:
+                ratio = ratios.get(name)
+                if ratio is None:
+                    row[column] = record[name]
+                else:
+                    row[column] = ratio.get_value(record)
+    return list(rows.values())
+
+
+def join_tracking_stats(
+    stats_by_measure: Dict[TrackingMeasureType, Iterable[Any]],
+    player_or_team: PlayerOrTeam,
+) -> List[Dict[str, Any]]:
+    """
+    Joins parsed stats (ex from :func:`~nba_stats_tracking.tracking.get_tracking_stats` or
+    :func:`~nba_stats_tracking.tracking.generate_tracking_game_logs`) for multiple measure
+    types into wide rows
+
+    :param stats_by_measure: dict mapping measure type to list of ResultItem
+    :param player_or_team: player or team stats
+    """
+    return join_records(
+        {
+            measure_type: (stat.dict() for stat in stats)
+            for measure_type, stats in stats_by_measure.items()
+        },
+        player_or_team,
+    )
+
+
+def get_records(
+    measure_type: TrackingMeasureType, results: Dict, season: str
+) -> Iterable[Dict[str, Any]]:
+    """
+    Gets rows of response results as dicts keyed by field name, without building items.
+    Missing stat values are 0, like on the item models.
+
+    :param measure_type: Stat measure type of the response
+    :param results: response results from
+        :func:`~nba_stats_tracking.tracking.get_tracking_results_for_stat_measure`
+    :param season: season to set on rows, ex ``2019-20 Regular Season``
+    """
+    alias_field_map = get_alias_field_map(tracking.DATA_ITEM_MAP[measure_type])
+    header_fields = [alias_field_map.get(header) for header in results["headers"]]
+    stat_fields = [
+        field
+        for field in alias_field_map.values()
+        if fields.get_field_aggregation(field) is not None
+    ]
+    for row in results["rowSet"]:
+        record = {field.name: field.default for field in stat_fields}
+        for field, value in zip(header_fields, row):
+            if field is None:
+                continue
+            if value is None and fields.get_field_aggregation(field) is not None:
+                value = 0
+            record[field.name] = value
+        record["season"] = season
+        yield record
+
+
+def join_tracking_results(
+    results_by_measure: Dict[TrackingMeasureType, Dict],
+    player_or_team: PlayerOrTeam,
+    season: str,
+    season_type: SeasonType,
+) -> List[Dict[str, Any]]:
+    """
+    Joins response results (ex cached responses) for multiple measure types into wide rows
+    without building any items
+
+    :param results_by_measure: dict mapping measure type to response results from
+        :func:`~nba_stats_tracking.tracking.get_tracking_results_for_stat_measure`
+    :param player_or_team: player or team stats
+    :param season: Format YYYY-YY ex 2019-20
+    :param season_type: Season type of the responses
+    """
+    season = f"{season} {season_type}"
+    return join_records(
+        {
+            measure_type: get_records(measure_type, results, season)
+            for measure_type, results in results_by_measure.items()
+        },
+        player_or_team,
+    )
+
+
+def get_wide_tracking_stats(
+    seasons: List[str],
+    season_types: List[SeasonType],
+    player_or_team: PlayerOrTeam,
+    measure_types: Optional[List[TrackingMeasureType]] = None,
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """
+    Gets stats for multiple measure types joined into one row for each player/team and season.
+    Use :func:`async_get_wide_tracking_stats` to make requests concurrently.
+
+    :param seasons: List of seasons. Format YYYY-YY ex 2019-20
+    :param season_types: List of season types.
+    :param player_or_team: get stats for player or team
+    :param measure_types: (optional) measure types to join. Defaults to all measure types.
+    :param str DateFrom: (optional) Format - MM/DD/YYYY
+    :param str DateTo: (optional) Format - MM/DD/YYYY
+    :param str OpponentTeamID: (optional) nba.com team id
+    :param `~nba_stats_tracking.models.request.PerMode` PerMode: (optional) Defaults to totals.
+    """
+    measure_types = measure_types or list(TrackingMeasureType)
+    rows = []
+    for season, season_type in itertools.product(seasons, season_types):
+        results_by_measure = {
+            measure_type: tracking.get_tracking_results_for_stat_measure(
+                measure_type, season, season_type, player_or_team, **kwargs
+            )
+            for measure_type in measure_types
+        }
+        rows += join_tracking_results(
+            results_by_measure, player_or_team, season, season_type
+        )
+    return rows
+
+
+async def async_get_wide_tracking_stats(
+    seasons: List[str],
+    season_types: List[SeasonType],
+    player_or_team: PlayerOrTeam,
+    measure_types: Optional[List[TrackingMeasureType]] = None,
+    semaphore: Optional[asyncio.Semaphore] = None,
+    **kwargs,
+) -> List[Dict[str, Any]]:
+    """
+    Async version of :func:`get_wide_tracking_stats`
+    Requests for all measure types, seasons and season types are made concurrently
+
+    :param semaphore: (optional) semaphore bounding the number of concurrent requests
+    """
+    measure_types = measure_types or list(TrackingMeasureType)
+    semaphore = helpers.get_semaphore(semaphore)
+    season_filters = list(itertools.product(seasons, season_types))
+    requests = list(itertools.product(season_filters, measure_types))
+    all_results = await asyncio.gather(
+        *[
+            tracking.async_get_tracking_results_for_stat_measure(
+                measure_type,
+                season,
+                season_type,
+                player_or_team,
+                semaphore=semaphore,
+                **kwargs,
+            )
+            for (season, season_type), measure_type in requests
+        ]
+    )
+    results_by_season = {season_filter: {} for season_filter in season_filters}
+    for (season_filter, measure_type), results in zip(requests, all_results):
+        results_by_season[season_filter][measure_type] = results
+
+    rows = []
+    for (season, season_type), results_by_measure in results_by_season.items():
+        rows += join_tracking_results(
+            results_by_measure, player_or_team, season, season_type
+        )
+    return rows
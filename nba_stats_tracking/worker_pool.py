@@ -0,0 +1,93 @@
+"""
+Module for processing dates concurrently on a pool of worker threads or processes.
+
+All workers share the stats request rate limit. Worker processes are given a
+:class:`~nba_stats_tracking.rate_limit.ProcessRateLimiter` with the same rate and burst as
+the rate limiter of the process that starts them. Other settings (cache, transport, retry)
+are inherited when processes are forked, which is the default on Linux, and are the defaults
+in processes that are spawned.
+"""
+
+import itertools
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from nba_stats_tracking import rate_limit
+from nba_stats_tracking.models.request import WorkerType
+
+
+def _init_process_worker(rate_limiter: Optional[rate_limit.RateLimiter]):
+    rate_limit.set_rate_limiter(rate_limiter)
+
+
+def get_executor(workers: int, worker_type: WorkerType = WorkerType.thread) -> Executor:
+    """
+    Creates a pool of worker threads or processes sharing the stats request rate limit
+
+    :param workers: number of workers
+    :param worker_type: (optional) thread or process workers. Defaults to threads.
+    """
+    if WorkerType(worker_type) == WorkerType.thread:
+        return ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="nba_stats_tracking_worker"
+        )
+    rate_limiter = rate_limit.get_rate_limiter()
+    if rate_limiter is not None:
+        rate_limiter = rate_limit.ProcessRateLimiter(
+            rate_limiter.rate, rate_limiter.burst
+        )
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_process_worker,
+        initargs=(rate_limiter,),
+    )
+
+
+def map_in_order(
+    executor: Executor, func: Callable, iterable: Iterable, ahead: int
+) -> Iterator[Any]:
+    """
+    Yields ``func`` applied to each value on the executor, in order. Up to ``ahead`` values
+    are submitted at once, and more are only submitted as earlier results are consumed.
+    Values that haven't started are cancelled if the consumer stops early.
+
+    :param executor: thread or process pool
+    :param func: function to apply, must be picklable for process pools
+    :param iterable: values to apply the function to
+    :param ahead: max number of values submitted at once
+    """
+    values = iter(iterable)
+    pending = deque(
+        executor.submit(func, value) for value in itertools.islice(values, ahead)
+    )
+    try:
+        while pending:
+            result = pending.popleft().result()
+            pending.extend(
+                executor.submit(func, value) for value in itertools.islice(values, 1)
+            )
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def map_dates(
+    func: Callable,
+    dates: Iterable,
+    workers: int,
+    worker_type: WorkerType = WorkerType.thread,
+) -> Iterator[Any]:
+    """
+    Yields ``func`` applied to each date on a new pool of workers, in date order.
+    Twice as many dates as workers are in flight at once, so workers are never idle waiting
+    for the consumer and results that haven't been consumed don't pile up in memory.
+
+    :param func: function called with a date, must be picklable for process workers
+    :param dates: dates
+    :param workers: number of workers
+    :param worker_type: (optional) thread or process workers. Defaults to threads.
+    """
+    with get_executor(workers, worker_type) as executor:
+        yield from map_in_order(executor, func, dates, 2 * workers)
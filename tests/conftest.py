@@ -0,0 +1,64 @@
+import pytest
+
+from nba_stats_tracking import (
+    cache,
+    helpers,
+    player_team_index,
+    rate_limit,
+    retry,
+    schedule,
+    transport,
+)
+
+
+@pytest.fixture(autouse=True)
+def disable_rate_limit():
+    rate_limit.set_rate_limiter(None)
+    yield
+    rate_limit.configure_rate_limiter()
+
+
+@pytest.fixture(autouse=True)
+def disable_cache():
+    cache.set_cache(None)
+    yield
+    cache.set_cache(None)
+
+
+@pytest.fixture(autouse=True)
+def clear_date_maps():
+    helpers.clear_date_maps()
+    yield
+    helpers.clear_date_maps()
+
+
+@pytest.fixture(autouse=True)
+def reset_retry():
+    retry.configure_retries(backoff_factor=0)
+    retry.configure_circuit_breaker()
+    retry.reset_stats()
+    yield
+    retry.configure_retries()
+    retry.configure_circuit_breaker()
+    retry.reset_stats()
+
+
+@pytest.fixture(autouse=True)
+def reset_transport():
+    transport.set_transport(None)
+    yield
+    transport.set_transport(None)
+
+
+@pytest.fixture(autouse=True)
+def disable_schedule_index():
+    schedule.set_schedule_index(None)
+    yield
+    schedule.set_schedule_index(None)
+
+
+@pytest.fixture(autouse=True)
+def disable_player_team_index():
+    player_team_index.set_player_team_index(None)
+    yield
+    player_team_index.set_player_team_index(None)
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from nba_stats_tracking import tracking
+from nba_stats_tracking.accumulator import TotalsAccumulator
+from nba_stats_tracking.models.slotted import get_slotted_item_class
+from nba_stats_tracking.models.tracking import (
+    PassingResults,
+    PlayerOrTeam,
+    PossessionsItem,
+    PossessionsResults,
+    TrackingMeasureType,
+)
+
+
+def load_result_set(path):
+    with open(path) as f:
+        return json.loads(f.read())["resultSets"][0]
+
+
+def test_add_does_not_change_items():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/Passing.json"
+    )
+    first, second = PassingResults(**result_set).results[:2]
+    first_values = first.dict()
+
+    total = first + second
+
+    assert first.dict() == first_values
+    assert total is not first
+    assert total.passes_made == first.passes_made + second.passes_made
+    assert total.secondary_assists == first.secondary_assists + second.secondary_assists
+    assert total.assist_pts == first.assist_pts + second.assist_pts
+
+
+def test_sum_tracking_totals_does_not_change_items():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/Passing.json"
+    )
+    items = PassingResults(**result_set).results
+    values = [item.dict() for item in items]
+
+    first_totals = tracking.sum_tracking_totals(
+        PlayerOrTeam.player, TrackingMeasureType.passing, items, items
+    )
+    second_totals = tracking.sum_tracking_totals(
+        PlayerOrTeam.player, TrackingMeasureType.passing, items, items
+    )
+
+    assert [item.dict() for item in items] == values
+    assert first_totals == second_totals
+    assert first_totals[0].potential_assists == 2 * items[0].potential_assists
+
+
+@pytest.mark.parametrize("slotted", [False, True])
+def test_merged_totals_are_the_same_in_any_order(slotted):
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/Possessions.json"
+    )
+    item_class = PossessionsItem
+    if slotted:
+        item_class = get_slotted_item_class(PossessionsItem)
+    headers = result_set["headers"]
+    items = [item_class(**dict(zip(headers, row))) for row in result_set["rowSet"]]
+    parts = [TotalsAccumulator("team_id").update(items[start::3]) for start in range(3)]
+
+    forward = (parts[0] + parts[1]) + parts[2]
+    backward = parts[2] + (parts[1] + parts[0])
+
+    assert len(forward) == len(backward) == 30
+    backward_totals = {total.team_id: total for total in backward.results()}
+    for total in forward.results():
+        other = backward_totals[total.team_id]
+        assert total.touches == other.touches
+        assert total.points == other.points
+        assert total.seconds_per_touch == pytest.approx(other.seconds_per_touch)
+
+    team_items = [item for item in items if item.team_id == 1610612749]
+    touches = sum(item.touches for item in team_items)
+    seconds_per_touch = (
+        sum(item.seconds_per_touch * item.touches for item in team_items) / touches
+    )
+    bucks = backward_totals[1610612749]
+    assert bucks.touches == touches
+    assert bucks.seconds_per_touch == pytest.approx(seconds_per_touch)
+
+
+def test_merge_requires_same_entity_key():
+    with pytest.raises(ValueError):
+        TotalsAccumulator("team_id") + TotalsAccumulator("player_id")
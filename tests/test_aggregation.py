@@ -0,0 +1,171 @@
+import json
+
+import pytest
+import responses
+from furl import furl
+
+from nba_stats_tracking import aggregation, tracking, tracking_shots, transport
+from nba_stats_tracking.columnar import ColumnarResults
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking import (
+    CatchAndShootItem,
+    PlayerOrTeam,
+    SpeedDistanceItem,
+    TrackingMeasureType,
+)
+from nba_stats_tracking.models.tracking_shots import CloseDefDist, GeneralRange
+
+np = pytest.importorskip("numpy")
+
+
+def load_result_set(path):
+    with open(path) as f:
+        return json.loads(f.read())["resultSets"][0]
+
+
+def test_aggregate_full_season_tracking_columns_matches_items():
+    transport.configure_replay("tests/data")
+    args = (
+        TrackingMeasureType.catch_and_shoot,
+        ["2018-19", "2019-20"],
+        [SeasonType.regular_season],
+        PlayerOrTeam.team,
+    )
+    stats, league_totals = tracking.aggregate_full_season_tracking_columns_for_seasons(
+        *args
+    )
+    items, league_item = tracking.aggregate_full_season_tracking_stats_for_seasons(
+        *args
+    )
+
+    assert len(stats) == 30
+    # item totals keep the season of the first item, columns don't have a season
+    assert [item.dict(exclude={"season"}) for item in stats.to_items()] == [
+        item.dict(exclude={"season"}) for item in items
+    ]
+    assert len(league_totals) == 1
+    league = league_totals.get_item(0)
+    assert league.team_id == 0
+    assert league.team_abbreviation == "LEAGUE"
+    assert league.minutes == 1106520.0
+    assert league.fga == 117893
+    assert league.fg3a == 105039
+    assert league.fg3pct == league_item.fg3pct
+
+
+def test_averages_are_weighted():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/SpeedDistance.json"
+    )
+    results = ColumnarResults.from_result_set(SpeedDistanceItem, result_set)
+    league = aggregation.aggregate(results, "league")
+
+    minutes = np.asarray(results["minutes"])
+    expected = (np.asarray(results["avg_speed"]) * minutes).sum() / minutes.sum()
+    assert league["avg_speed"][0] == pytest.approx(expected)
+    assert league["dist_miles"][0] == pytest.approx(results["dist_miles"].sum())
+    assert "player_name" not in league
+
+
+def test_group_by_keeps_order_of_first_appearance():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/SpeedDistance.json"
+    )
+    results = ColumnarResults.from_result_set(SpeedDistanceItem, result_set)
+    totals = aggregation.group_by([results, results], "player_id")
+
+    assert totals["player_id"].tolist() == results["player_id"].tolist()
+    assert totals["player_name"] == results["player_name"]
+    assert totals["dist_miles"].tolist() == pytest.approx(
+        (results["dist_miles"] * 2).tolist()
+    )
+    assert totals["avg_speed"].tolist() == pytest.approx(results["avg_speed"].tolist())
+
+
+def test_lookup():
+    values = aggregation.lookup([3, 1, 4], [1, 2, 3], [10, 20, 30])
+    assert values.tolist() == [30, 10, 0]
+
+
+def add_shot_response(close_def_dist, general_range, path):
+    with open(path) as f:
+        response_json = json.loads(f.read())
+    query_params = {
+        "Season": "2019-20",
+        "SeasonType": SeasonType.regular_season,
+        "DateFrom": "",
+        "DateTo": "",
+        "CloseDefDistRange": close_def_dist,
+        "ShotClockRange": "",
+        "ShotDistRange": "",
+        "TouchTimeRange": "",
+        "DribbleRange": "",
+        "GeneralRange": general_range,
+        "PerMode": "Totals",
+        "LeagueID": "00",
+    }
+    url = furl("https://stats.nba.com/stats/leaguedashplayerptshot").add(query_params)
+    responses.add(responses.GET, url.url, json=response_json, status=200)
+
+
+@responses.activate
+def test_aggregate_full_season_tracking_shot_columns_matches_items():
+    def_distances = [CloseDefDist.range_6_plus_ft, CloseDefDist.range_4_6_ft]
+    add_shot_response(
+        def_distances[0],
+        GeneralRange.catch_and_shoot,
+        "tests/data/tracking_shots/player_wide_open_catch_and_shoot_response.json",
+    )
+    add_shot_response(
+        def_distances[1],
+        GeneralRange.catch_and_shoot,
+        "tests/data/tracking_shots/player_open_catch_and_shoot_response.json",
+    )
+    add_shot_response(
+        "", "Overall", "tests/data/tracking_shots/player_overall_response.json"
+    )
+
+    args = (tracking_shots.EntityType.player, ["2019-20"], [SeasonType.regular_season])
+    kwargs = {
+        "CloseDefDistRange": def_distances,
+        "GeneralRange": [GeneralRange.catch_and_shoot],
+    }
+    (
+        stats,
+        league_totals,
+    ) = tracking_shots.aggregate_full_season_tracking_shot_columns_for_seasons(
+        *args, **kwargs
+    )
+    (
+        items,
+        league_item,
+    ) = tracking_shots.aggregate_full_season_tracking_shot_stats_for_seasons(
+        *args, **kwargs
+    )
+
+    assert len(stats) == len(items) == 486
+    index = stats["player_id"].tolist().index(203507)
+    stat = stats.get_item(index)
+    assert stat.fga == 409
+    assert stat.overall_fga == 939
+    assert stat.efg == (114 + 1.5 * 72) / 409
+    assert stat.fga_frequency == 409 / 939
+
+    league = league_totals.get_item(0)
+    assert league.fga == league_item.fga == 68638
+    assert league.overall_fga == league_item.overall_fga == 139860
+    assert league.frequency_of_fg3a == 44439 / 53065
+
+
+def test_ratio_columns_match_items():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/team-playoffs/CatchShoot.json"
+    )
+    results = ColumnarResults.from_result_set(CatchAndShootItem, result_set)
+    league = aggregation.aggregate(results, "league")
+    ratios = aggregation.get_ratio_columns(league)
+    league_item = league.get_item(0)
+
+    assert set(ratios) == {"fg3pct", "efg"}
+    assert ratios["efg"][0] == pytest.approx(league_item.efg)
+    assert ratios["fg3pct"][0] == pytest.approx(league_item.fg3pct)
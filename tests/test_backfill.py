@@ -0,0 +1,149 @@
+import json
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from nba_stats_tracking import backfill, transport
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+from nba_stats_tracking.request_key import get_endpoint
+
+GAME_ID = "0021900740"
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.loads(f.read())
+
+
+class GameDateTransport(transport.Transport):
+    # only has a game on 2020-02-02, the CHI @ TOR game
+    rate_limited = False
+
+    def __init__(self):
+        self.requests = Counter()
+
+    def get_json(self, url, params):
+        endpoint = get_endpoint(url)
+        self.requests[endpoint] += 1
+        if endpoint == "scoreboardV3":
+            response = load_json("tests/data/scoreboard/response.json")
+            response["scoreboard"]["games"] = [
+                game
+                for game in response["scoreboard"]["games"]
+                if game["gameId"] == GAME_ID and str(params["GameDate"]) == "2020-02-02"
+            ]
+            return response
+        if endpoint == "boxscoretraditionalv3":
+            return load_json(f"tests/data/game/boxscore/{GAME_ID}.json")
+        return load_json(
+            "tests/data/tracking/2019-20/player-regular-season/CatchShootByDate.json"
+        )
+
+
+@pytest.fixture
+def game_date_transport():
+    game_date_transport = GameDateTransport()
+    transport.set_transport(game_date_transport)
+    return game_date_transport
+
+
+def backfill_catch_and_shoot(journal, write, **kwargs):
+    return backfill.backfill_tracking_game_logs(
+        journal,
+        TrackingMeasureType.catch_and_shoot,
+        PlayerOrTeam.player,
+        date(2020, 2, 1),
+        write,
+        **kwargs,
+    )
+
+
+def test_backfill_resumes_after_failure(tmp_path, game_date_transport):
+    path = str(tmp_path / "journal.jsonl")
+    written = {}
+
+    def fail_on_game_date(dt, game_logs):
+        if game_logs:
+            raise RuntimeError("write failed")
+        written[dt] = game_logs
+
+    with backfill.CheckpointJournal(path) as journal:
+        with pytest.raises(RuntimeError):
+            backfill_catch_and_shoot(
+                journal, fail_on_game_date, date_to=date(2020, 2, 3)
+            )
+
+    with backfill.CheckpointJournal(path) as journal:
+        assert len(journal) == 1
+        dates = backfill_catch_and_shoot(
+            journal, written.__setitem__, date_to=date(2020, 2, 3)
+        )
+        assert dates == [date(2020, 2, 2), date(2020, 2, 3)]
+        assert len(journal) == 3
+
+    assert len(written[date(2020, 2, 2)]) == 24
+    assert written[date(2020, 2, 2)][0].game_id == GAME_ID
+    assert written[date(2020, 2, 3)] == []
+    # date maps are memoized, stats for the failed date are requested again
+    assert game_date_transport.requests["scoreboardV3"] == 3
+    assert game_date_transport.requests["leaguedashptstats"] == 2
+
+    with backfill.CheckpointJournal(path) as journal:
+        dates = backfill_catch_and_shoot(
+            journal, written.__setitem__, date_to=date(2020, 2, 3)
+        )
+    assert dates == []
+
+
+def test_incremental_backfill_only_gets_dates_after_last_checkpoint(tmp_path):
+    path = str(tmp_path / "journal.jsonl")
+    with backfill.CheckpointJournal(path) as journal:
+        journal.record(
+            TrackingMeasureType.catch_and_shoot, PlayerOrTeam.player, date(2020, 2, 2)
+        )
+        args = (
+            journal,
+            TrackingMeasureType.catch_and_shoot,
+            PlayerOrTeam.player,
+            date(2020, 1, 31),
+            date(2020, 2, 3),
+        )
+        assert backfill.get_pending_dates(*args) == [
+            date(2020, 1, 31),
+            date(2020, 2, 1),
+            date(2020, 2, 3),
+        ]
+        assert backfill.get_pending_dates(*args, incremental=True) == [date(2020, 2, 3)]
+        assert journal.get_last_date("CatchShoot", "Player") == date(2020, 2, 2)
+        assert journal.get_last_date("CatchShoot", "Team") is None
+
+
+def test_dates_that_arent_final_are_not_recorded(tmp_path, game_date_transport):
+    today = date.today()
+    with backfill.CheckpointJournal(str(tmp_path / "journal.jsonl")) as journal:
+        dates = backfill.backfill_tracking_game_logs(
+            journal,
+            TrackingMeasureType.catch_and_shoot,
+            PlayerOrTeam.team,
+            today,
+            lambda dt, game_logs: None,
+        )
+        assert dates == [today]
+        assert len(journal) == 0
+
+
+def test_journal_ignores_torn_last_line(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    path.write_text(
+        '{"unit": "Drives", "entity": "Team", "date": "2020-02-01"}\n{"unit": "Dri'
+    )
+    with backfill.CheckpointJournal(str(path)) as journal:
+        assert len(journal) == 1
+        journal.record(TrackingMeasureType.drives, PlayerOrTeam.team, date(2020, 2, 2))
+
+    with backfill.CheckpointJournal(str(path)) as journal:
+        assert journal.get_last_date(TrackingMeasureType.drives, "Team") == date(
+            2020, 2, 2
+        )
+        assert len(journal) == 2
@@ -0,0 +1,122 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import responses
+
+from nba_stats_tracking import cache, helpers
+
+URL = "https://stats.nba.com/stats/leaguedashptstats"
+
+
+def test_set_and_get_response(tmp_path):
+    response_cache = cache.ResponseCache(str(tmp_path))
+    params = {"Season": "2019-20", "PerMode": "Totals"}
+    response_cache.set(URL, params, {"resultSets": [1]})
+
+    # param order doesn't matter
+    assert response_cache.get(URL, {"PerMode": "Totals", "Season": "2019-20"}) == {
+        "resultSets": [1]
+    }
+    assert response_cache.get(URL, {"Season": "2018-19"}) is None
+    assert response_cache.hits == 1
+    assert response_cache.misses == 1
+
+    # index is loaded from disk
+    assert len(cache.ResponseCache(str(tmp_path))) == 1
+
+
+def test_get_ttl(tmp_path):
+    response_cache = cache.ResponseCache(str(tmp_path), ttl_hours=2)
+    today = datetime.now(timezone.utc).date()
+    current_season_start = today.year if today.month >= 11 else today.year - 1
+    current_season = f"{current_season_start}-{str(current_season_start + 1)[2:]}"
+
+    assert response_cache.get_ttl({"Season": "2019-20"}) is None
+    assert response_cache.get_ttl({"GameID": "0021900740"}) is None
+    assert response_cache.get_ttl({"GameDate": date(2020, 2, 2)}) is None
+    assert response_cache.get_ttl({"GameDate": today}) == 7200
+    assert response_cache.get_ttl({"Season": current_season}) == 7200
+    assert (
+        response_cache.get_ttl(
+            {"Season": current_season, "DateTo": today.strftime("%m/%d/%Y")}
+        )
+        == 7200
+    )
+    # late games on the previous date may not have finished yet
+    yesterday = today - timedelta(days=1)
+    assert (
+        response_cache.get_ttl(
+            {"Season": current_season, "DateTo": yesterday.strftime("%m/%d/%Y")}
+        )
+        == 7200
+    )
+    two_days_ago = today - timedelta(days=2)
+    assert (
+        response_cache.get_ttl(
+            {"Season": current_season, "DateTo": two_days_ago.strftime("%m/%d/%Y")}
+        )
+        is None
+    )
+
+
+def test_games_on_cached_final_scoreboard_are_final(tmp_path):
+    response_cache = cache.ResponseCache(str(tmp_path), ttl_hours=2)
+    today = datetime.now(timezone.utc).date()
+    current_season_start = today.year if today.month >= 11 else today.year - 1
+    game_id = f"002{str(current_season_start)[2:]}00001"
+    in_progress_game_id = f"002{str(current_season_start)[2:]}00002"
+    scoreboard = {
+        "scoreboard": {
+            "games": [
+                {"gameId": game_id, "gameStatus": 3},
+                {"gameId": in_progress_game_id, "gameStatus": 2},
+            ]
+        }
+    }
+    assert response_cache.get_ttl({"GameID": game_id}) == 7200
+
+    response_cache.set(URL, {"GameDate": today}, scoreboard)
+    assert response_cache.get_ttl({"GameID": game_id}) is None
+    assert response_cache.get_ttl({"GameID": in_progress_game_id}) == 7200
+
+    # final games are picked up from scoreboards already on disk
+    response_cache = cache.ResponseCache(str(tmp_path), ttl_hours=2)
+    assert response_cache.get(URL, {"GameDate": today}) == scoreboard
+    assert response_cache.get_ttl({"GameID": game_id}) is None
+
+
+def test_expired_response_is_not_returned(tmp_path):
+    response_cache = cache.ResponseCache(str(tmp_path), ttl_hours=0)
+    params = {"GameDate": date.today()}
+    response_cache.set(URL, params, {"scoreboard": {}})
+    time.sleep(0.01)
+    assert response_cache.get(URL, params) is None
+    assert len(response_cache) == 0
+
+
+def test_least_recently_used_responses_are_evicted(tmp_path):
+    response_cache = cache.ResponseCache(str(tmp_path))
+    for season in ["2017-18", "2018-19", "2019-20"]:
+        response_cache.set(URL, {"Season": season}, {"data": "x" * 1000})
+    # room for 3 responses
+    response_cache.max_bytes = response_cache.total_bytes + 10
+    # use 2017-18 so 2018-19 is least recently used
+    response_cache.get(URL, {"Season": "2017-18"})
+    response_cache.set(URL, {"Season": "2020-21"}, {"data": "x" * 1000})
+
+    assert len(response_cache) == 3
+    assert response_cache.total_bytes <= response_cache.max_bytes
+    assert response_cache.get(URL, {"Season": "2018-19"}) is None
+    assert response_cache.get(URL, {"Season": "2017-18"}) is not None
+    assert len(list(tmp_path.glob("*/*.json.gz"))) == 3
+
+
+@responses.activate
+def test_get_json_response_uses_cache(tmp_path):
+    responses.add(responses.GET, URL, json={"resultSets": []}, status=200)
+    cache.configure_cache(str(tmp_path))
+    params = {"Season": "2019-20"}
+
+    assert helpers.get_json_response(URL, params) == {"resultSets": []}
+    assert helpers.get_json_response(URL, params) == {"resultSets": []}
+    assert len(responses.calls) == 1
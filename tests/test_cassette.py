@@ -0,0 +1,77 @@
+import time
+from datetime import date
+
+import pytest
+
+from nba_stats_tracking import cassette, helpers, tracking, transport
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+
+
+def get_catch_shoot_stats():
+    return tracking.aggregate_full_season_tracking_stats_for_seasons(
+        TrackingMeasureType.catch_and_shoot,
+        ["2019-20"],
+        [SeasonType.playoffs],
+        PlayerOrTeam.team,
+    )
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    transport.configure_replay("tests/data")
+    path = str(tmp_path / "cassette.jsonl.gz")
+    cassette.start_recording(path)
+    get_catch_shoot_stats()
+    helpers.get_game_ids_for_date(date(2020, 2, 2))
+    cassette.stop_recording()
+    assert isinstance(transport.get_transport(), transport.ReplayTransport)
+    transport.set_transport(None)
+    return path
+
+
+def test_record_and_replay(cassette_path):
+    assert len(list(cassette.read_cassette(cassette_path))) == 2
+
+    cassette.configure_cassette_replay(cassette_path)
+    stats, league_totals = get_catch_shoot_stats()
+    assert len(stats) == 16
+    assert league_totals.fga == 4477
+    assert helpers.get_game_ids_for_date(date(2020, 2, 2)) == [
+        "0021900737",
+        "0021900738",
+        "0021900739",
+        "0021900740",
+    ]
+    with pytest.raises(transport.MissingResponseError):
+        helpers.get_game_ids_for_date(date(2020, 2, 3))
+
+
+def test_replayed_responses_are_copies(cassette_path):
+    entries = list(cassette.read_cassette(cassette_path))
+    replay = cassette.CassetteTransport(cassette_path)
+    url = "https://stats.nba.com/stats/scoreboardV3"
+
+    response = replay.get_json(url, entries[1]["params"])
+    response["scoreboard"]["games"].clear()
+    assert replay.get_json(url, entries[1]["params"]) == entries[1]["response"]
+
+
+def test_replay_simulates_latency(cassette_path):
+    entries = list(cassette.read_cassette(cassette_path))
+    replay = cassette.CassetteTransport(cassette_path, simulate_latency=True)
+    for entry in replay._entries.values():
+        entry["elapsed"] = 0.1
+
+    start = time.monotonic()
+    replay.get_json("https://stats.nba.com/stats/scoreboardV3", entries[1]["params"])
+    assert time.monotonic() - start >= 0.1
+
+
+def test_export_cassette(cassette_path, tmp_path):
+    directory = str(tmp_path / "replay")
+    assert cassette.export_cassette(cassette_path, directory) == 2
+
+    transport.configure_replay(directory)
+    stats, league_totals = get_catch_shoot_stats()
+    assert league_totals.fga == 4477
@@ -0,0 +1,89 @@
+import json
+from array import array
+
+import pytest
+
+from nba_stats_tracking import columnar, tracking, transport
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking import (
+    PlayerOrTeam,
+    SpeedDistanceItem,
+    TrackingMeasureType,
+)
+from nba_stats_tracking.models.tracking_shots import TrackingShotItem
+
+
+def load_result_set(path):
+    with open(path) as f:
+        return json.loads(f.read())["resultSets"][0]
+
+
+def test_columns_match_items():
+    np = pytest.importorskip("numpy")
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/SpeedDistance.json"
+    )
+    results = columnar.ColumnarResults.from_result_set(SpeedDistanceItem, result_set)
+    items = results.to_items()
+
+    assert len(results) == len(items)
+    assert results["player_id"].dtype == np.int64
+    assert results["dist_feet"].dtype == np.float64
+    assert results["player_name"] == [item.player_name for item in items]
+    assert results["dist_feet"].tolist() == [item.dist_feet for item in items]
+    assert results["minutes"].sum() == pytest.approx(
+        sum(item.minutes for item in items)
+    )
+    assert "season" not in results
+
+
+def test_missing_values_are_filled():
+    result_set = load_result_set(
+        "tests/data/tracking_shots/player_late_clock_response.json"
+    )
+    result_set["rowSet"][0][result_set["headers"].index("FG3A")] = None
+    results = columnar.ColumnarResults.from_result_set(TrackingShotItem, result_set)
+    assert results["fg3a"][0] == 0
+    assert results.get_item(0).fg3a == 0
+
+
+def test_array_fallback_without_numpy(monkeypatch):
+    monkeypatch.setattr(columnar, "np", None)
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/team-playoffs/Drives.json"
+    )
+    results = columnar.ColumnarResults.from_result_set(
+        tracking.DATA_ITEM_MAP[TrackingMeasureType.drives], result_set
+    )
+    assert isinstance(results["team_id"], array)
+    assert results["team_id"].typecode == "q"
+    assert isinstance(results["drives"], array)
+    assert results["drives"].typecode == "d"
+
+
+def test_get_tracking_columns():
+    transport.configure_replay("tests/data")
+    results = tracking.get_tracking_columns(
+        TrackingMeasureType.catch_and_shoot,
+        "2019-20",
+        SeasonType.playoffs,
+        PlayerOrTeam.team,
+    )
+    assert len(results) == 16
+    assert sum(results["fga"]) == 4477
+
+
+def test_array_fallback_with_float_ints(monkeypatch):
+    monkeypatch.setattr(columnar, "np", None)
+    result_set = load_result_set(
+        "tests/data/tracking_shots/player_late_clock_response.json"
+    )
+    age_index = result_set["headers"].index("AGE")
+    result_set["rowSet"][0][age_index] = 24.0
+    result_set["rowSet"][0][result_set["headers"].index("FG3A")] = None
+    results = columnar.ColumnarResults.from_result_set(TrackingShotItem, result_set)
+    assert results["age"].typecode == "q"
+    assert results["age"][0] == 24
+    assert results["fg3a"][0] == 0
+
+    assert columnar.make_column([24, 24.5], int, 0).typecode == "d"
@@ -0,0 +1,94 @@
+import pytest
+
+from nba_stats_tracking.models import fields
+from nba_stats_tracking.models.slotted import get_slotted_item_class
+from nba_stats_tracking.models.tracking import (
+    CatchAndShootItem,
+    DefenseItem,
+    DrivesItem,
+    EfficiencyItem,
+    ElbowTouchesItem,
+    PaintTouchesItem,
+    PassingItem,
+    PossessionsItem,
+    PostTouchesItem,
+    PullUpItem,
+    ReboundingItem,
+    SpeedDistanceItem,
+)
+from nba_stats_tracking.models.tracking_shots import TrackingShotItem
+
+ITEM_CLASSES = [
+    CatchAndShootItem,
+    DefenseItem,
+    DrivesItem,
+    EfficiencyItem,
+    ElbowTouchesItem,
+    PaintTouchesItem,
+    PassingItem,
+    PossessionsItem,
+    PostTouchesItem,
+    PullUpItem,
+    ReboundingItem,
+    SpeedDistanceItem,
+    TrackingShotItem,
+]
+
+
+def get_stat_fields(item_class):
+    return [
+        field
+        for field in item_class.__fields__.values()
+        if fields.get_field_aggregation(field) is not None
+    ]
+
+
+@pytest.mark.parametrize("slotted", [False, True])
+@pytest.mark.parametrize("item_class", ITEM_CLASSES)
+def test_add_sums_additive_fields_and_weights_averages(item_class, slotted):
+    stat_fields = get_stat_fields(item_class)
+    if slotted:
+        item_class = get_slotted_item_class(item_class)
+    first, second = [
+        item_class(
+            TEAM_ID=1,
+            TEAM_ABBREVIATION="MIL",
+            **{field.alias: value for field in stat_fields},
+        )
+        for value in [1, 3]
+    ]
+    total = first + second
+
+    for field in stat_fields:
+        if fields.get_field_aggregation(field) == fields.ADDITIVE:
+            assert getattr(total, field.name) == 4
+        else:
+            # (1 * 1 + 3 * 3) / (1 + 3)
+            assert getattr(total, field.name) == 2.5
+    assert getattr(first, stat_fields[0].name) == 1
+
+
+def test_missing_stats_are_zero():
+    item = SpeedDistanceItem(
+        TEAM_ID=1, TEAM_ABBREVIATION="MIL", DIST_FEET=None, AVG_SPEED=None
+    )
+    assert item.dist_feet == 0
+    assert item.avg_speed == 0
+    assert item.player_id is None
+
+
+def test_ratio():
+    item = TrackingShotItem(FGM=4, FGA=10, FG3M=2, FG3A=0)
+    assert item.efg == (4 + 0.5 * 2) / 10
+    assert item.fg3pct == 0
+    assert TrackingShotItem.efg.numerator == {"fgm": 1, "fg3m": 0.5}
+    assert set(fields.get_ratios(TrackingShotItem)) == {
+        "fg2pct",
+        "fg3pct",
+        "efg",
+        "fga_frequency",
+        "fg2a_frequency",
+        "fg3a_frequency",
+        "frequency_of_fg2a",
+        "frequency_of_fg3a",
+    }
@@ -0,0 +1,144 @@
+import asyncio
+import json
+import threading
+from collections import Counter
+from datetime import date
+
+import pytest
+
+from nba_stats_tracking import game_logs, transport
+from nba_stats_tracking.models.request import ResultFormat
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+from nba_stats_tracking.models.tracking_shots import CloseDefDist
+from nba_stats_tracking.request_key import get_endpoint
+
+GAME_ID = "0021900740"
+GAME_DATE = date(2020, 2, 2)
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.loads(f.read())
+
+
+class GameDateTransport(transport.Transport):
+    # serves saved responses for the CHI @ TOR game on 2020-02-02
+    rate_limited = False
+
+    def __init__(self):
+        self.requests = Counter()
+        self.stats_thread_names = set()
+
+    def get_json(self, url, params):
+        endpoint = get_endpoint(url)
+        self.requests[endpoint] += 1
+        if endpoint not in ("scoreboardV3", "boxscoretraditionalv3"):
+            self.stats_thread_names.add(threading.current_thread().name)
+        if endpoint == "scoreboardV3":
+            response = load_json("tests/data/scoreboard/response.json")
+            response["scoreboard"]["games"] = [
+                game
+                for game in response["scoreboard"]["games"]
+                if game["gameId"] == GAME_ID
+            ]
+            return response
+        if endpoint == "boxscoretraditionalv3":
+            return load_json(f"tests/data/game/boxscore/{GAME_ID}.json")
+        if endpoint == "leaguedashptstats":
+            assert params["PtMeasureType"] == TrackingMeasureType.catch_and_shoot
+            return load_json(
+                "tests/data/tracking/2019-20/player-regular-season/CatchShootByDate.json"
+            )
+        if params["CloseDefDistRange"] == CloseDefDist.range_6_plus_ft:
+            return load_json(
+                "tests/data/tracking_shots/player_wide_open_single_date_response.json"
+            )
+        return load_json(
+            "tests/data/tracking_shots/player_overall_response_for_date.json"
+        )
+
+
+def check_game_logs(logs):
+    assert list(logs) == [TrackingMeasureType.catch_and_shoot, "wide_open"]
+    assert len(logs[TrackingMeasureType.catch_and_shoot]) == 24
+    catch_and_shoot = next(
+        game_log
+        for game_log in logs[TrackingMeasureType.catch_and_shoot]
+        if game_log.player_id == 1627832
+    )
+    assert catch_and_shoot.fg3a == 5
+    assert catch_and_shoot.game_id == GAME_ID
+    assert catch_and_shoot.opponent_team_id == 1610612741
+    wide_open = next(
+        game_log for game_log in logs["wide_open"] if game_log.player_id == 1627832
+    )
+    assert wide_open.fg3a == 6
+    assert wide_open.overall_fga == 11
+    assert wide_open.team_id == 1610612761
+    assert wide_open.game_id == GAME_ID
+
+
+def test_generate_game_logs():
+    game_date_transport = GameDateTransport()
+    transport.set_transport(game_date_transport)
+    logs = game_logs.generate_game_logs(
+        PlayerOrTeam.player,
+        GAME_DATE,
+        GAME_DATE,
+        [TrackingMeasureType.catch_and_shoot],
+        shot_filters={
+            "wide_open": {"CloseDefDistRange": [CloseDefDist.range_6_plus_ft]}
+        },
+    )
+
+    check_game_logs(logs)
+    assert game_date_transport.requests["scoreboardV3"] == 1
+    assert game_date_transport.requests["boxscoretraditionalv3"] == 1
+    # measure types and shot filters are requested on the game log thread pool
+    assert game_date_transport.stats_thread_names
+    assert all(
+        name.startswith("nba_stats_tracking_game_logs")
+        for name in game_date_transport.stats_thread_names
+    )
+
+
+def test_async_generate_game_logs():
+    transport.set_transport(GameDateTransport())
+    logs = asyncio.run(
+        game_logs.async_generate_game_logs(
+            PlayerOrTeam.player,
+            GAME_DATE,
+            GAME_DATE,
+            [TrackingMeasureType.catch_and_shoot],
+            shot_filters={
+                "wide_open": {"CloseDefDistRange": [CloseDefDist.range_6_plus_ft]}
+            },
+            result_format=ResultFormat.slotted,
+        )
+    )
+
+    check_game_logs(logs)
+
+
+def test_team_game_logs_dont_request_boxscores():
+    game_date_transport = GameDateTransport()
+    transport.set_transport(game_date_transport)
+    game_logs.generate_game_logs(PlayerOrTeam.team, GAME_DATE, GAME_DATE, [])
+
+    assert game_date_transport.requests["scoreboardV3"] == 1
+    assert game_date_transport.requests["boxscoretraditionalv3"] == 0
+
+
+def test_shot_filters_with_dates_raise():
+    transport.set_transport(GameDateTransport())
+    shot_filters = {"wide_open": {"DateFrom": "02/01/2020"}}
+    with pytest.raises(ValueError, match="wide_open"):
+        game_logs.generate_game_logs(
+            PlayerOrTeam.player, GAME_DATE, GAME_DATE, [], shot_filters
+        )
+    with pytest.raises(ValueError, match="DateFrom"):
+        asyncio.run(
+            game_logs.async_generate_game_logs(
+                PlayerOrTeam.player, GAME_DATE, GAME_DATE, [], shot_filters
+            )
+        )
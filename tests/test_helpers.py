@@ -1,5 +1,6 @@
+import asyncio
 import json
-from datetime import date
+from datetime import date, datetime
 
 import pytest
 import requests
@@ -87,6 +88,42 @@ def test_get_team_id_maps_for_date():
     }
 
 
+@responses.activate
+def test_scoreboard_is_memoized_by_date():
+    with open("tests/data/scoreboard/response.json") as f:
+        scoreboard_response = json.loads(f.read())
+
+    scoreboard_response_url = (
+        "https://stats.nba.com/stats/scoreboardV3?LeagueID=00&GameDate=2020-02-02"
+    )
+    responses.add(
+        responses.GET, scoreboard_response_url, json=scoreboard_response, status=200
+    )
+
+    team_id_game_id_map, _ = helpers.get_team_id_maps_for_date(date(2020, 2, 2))
+    # rrule yields datetimes
+    game_ids = helpers.get_game_ids_for_date(datetime(2020, 2, 2))
+    assert sorted(set(team_id_game_id_map.values())) == game_ids
+    assert len(responses.calls) == 1
+
+    helpers.clear_date_maps(date(2020, 2, 2))
+    helpers.get_game_ids_for_date(date(2020, 2, 2))
+    assert len(responses.calls) == 2
+
+
+def test_date_memo_evicts_least_recently_used_date():
+    memo = helpers.DateMemo(maxsize=2)
+    memo.set(date(2020, 2, 1), 1)
+    memo.set(date(2020, 2, 2), 2)
+    assert memo.get(date(2020, 2, 1)) == 1
+    memo.set(date(2020, 2, 3), 3)
+    assert len(memo) == 2
+    assert memo.get(date(2020, 2, 2)) is None
+    assert memo.get(date(2020, 2, 1)) == 1
+    memo.invalidate()
+    assert len(memo) == 0
+
+
 @responses.activate
 def test_get_player_team_map_for_date():
     with open("tests/data/scoreboard/response.json") as f:
@@ -269,3 +306,41 @@ def test_get_player_team_map_for_date():
         1628778: 1610612761,
         1626259: 1610612761,
     }
+
+    # boxscores are only requested once per date
+    player_team_map[1628990] = 0
+    assert helpers.get_player_team_map_for_date(game_date)[1628990] == 1610612741
+    assert len(responses.calls) == 2
+
+
+def test_async_iter_in_order_bounds_started_awaitables():
+    started = []
+    finished = []
+
+    async def delayed(i):
+        # later awaitables finish first
+        await asyncio.sleep(0.01 * (5 - i))
+        finished.append(i)
+        return i
+
+    def awaitables():
+        for i in range(5):
+            started.append(i)
+            yield delayed(i)
+
+    async def take_two():
+        results = helpers.async_iter_in_order(awaitables(), ahead=2)
+        taken = []
+        async for result in results:
+            taken.append(result)
+            if len(taken) == 2:
+                break
+        await results.aclose()
+        await asyncio.sleep(0.05)
+        return taken
+
+    assert asyncio.run(take_two()) == [0, 1]
+    # one more is started as each result is yielded, the rest are never started
+    assert started == [0, 1, 2, 3]
+    # unfinished ones are cancelled when the consumer stops
+    assert finished == [1, 0]
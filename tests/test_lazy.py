@@ -0,0 +1,87 @@
+import json
+
+from nba_stats_tracking import tracking, transport
+from nba_stats_tracking.models.lazy import LazyResults
+from nba_stats_tracking.models.request import ResultFormat, SeasonType
+from nba_stats_tracking.models.tracking import (
+    DrivesItem,
+    DrivesResults,
+    PlayerOrTeam,
+    TrackingMeasureType,
+)
+
+
+def load_result_set(path):
+    with open(path) as f:
+        return json.loads(f.read())["resultSets"][0]
+
+
+def test_items_are_built_on_access():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/player-regular-season/Drives.json"
+    )
+    eager = DrivesResults(**result_set).results
+    results = LazyResults.from_result_set(DrivesItem, result_set)
+
+    assert len(results) == len(eager)
+    assert results.built_count == 0
+    assert results[0] == eager[0]
+    assert results[-1] == eager[-1]
+    assert results.built_count == 2
+    # items are cached so changes are kept
+    results[0].game_id = "0021900001"
+    assert results[0].game_id == "0021900001"
+
+    assert results.column("player_id") == [item.player_id for item in eager]
+    assert results.column("game_id")[0] == "0021900001"
+    assert results.built_count == 2
+
+    player_id = eager[10].player_id
+    assert results.filter(player_id=player_id) == [eager[10]]
+    assert results.built_count == 3
+    assert results.filter(player_id=player_id, team_id=-1) == []
+
+    eager[0].game_id = "0021900001"
+    assert list(results) == eager
+    # no criteria matches every row
+    assert results.filter() == eager
+    assert results[1:3] == eager[1:3]
+
+
+def test_concatenated_results_keep_built_items():
+    result_set = load_result_set(
+        "tests/data/tracking/2019-20/team-playoffs/Drives.json"
+    )
+    first = LazyResults.from_result_set(DrivesItem, result_set, {"season": "a"})
+    second = LazyResults.from_result_set(DrivesItem, result_set, {"season": "b"})
+    second[0].drives = 0
+    combined = first + second
+
+    assert len(combined) == 2 * len(first)
+    assert combined.built_count == 1
+    assert combined[len(first)].drives == 0
+    assert combined[0].season == "a"
+    assert combined.column("season")[-1] == "b"
+
+
+def test_get_tracking_stats_lazy():
+    transport.configure_replay("tests/data")
+    stats = tracking.get_tracking_stats(
+        TrackingMeasureType.catch_and_shoot,
+        ["2019-20"],
+        [SeasonType.playoffs],
+        PlayerOrTeam.team,
+        result_format=ResultFormat.lazy,
+    )
+    assert isinstance(stats, LazyResults)
+    assert len(stats) == 16
+    assert stats.built_count == 0
+    boston = stats.filter(team_id=1610612738)[0]
+    assert boston.season == "2019-20 Playoffs"
+    assert boston.fga == 408
+    assert stats.built_count == 1
+
+    league_totals = tracking.sum_tracking_totals(
+        "league", TrackingMeasureType.catch_and_shoot, stats
+    )
+    assert league_totals.fga == 4477
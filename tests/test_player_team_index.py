@@ -0,0 +1,126 @@
+import asyncio
+import json
+from collections import Counter
+from datetime import date
+
+from nba_stats_tracking import helpers, player_team_index, tracking, transport
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+from nba_stats_tracking.request_key import get_endpoint
+
+GAME_ID = "0021900740"
+GAME_DATE = date(2020, 2, 2)
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.loads(f.read())
+
+
+class GameDateTransport(transport.Transport):
+    # serves saved responses for the CHI @ TOR game on 2020-02-02
+    rate_limited = False
+
+    def __init__(self):
+        self.requests = Counter()
+
+    def get_json(self, url, params):
+        endpoint = get_endpoint(url)
+        self.requests[endpoint] += 1
+        if endpoint == "scoreboardV3":
+            response = load_json("tests/data/scoreboard/response.json")
+            response["scoreboard"]["games"] = [
+                game
+                for game in response["scoreboard"]["games"]
+                if game["gameId"] == GAME_ID
+            ]
+            return response
+        if endpoint == "leaguegamelog":
+            assert params["Season"] == "2019-20"
+            assert params["SeasonType"] == SeasonType.regular_season
+            return load_json("tests/data/game_log/2019-20-regular-season-players.json")
+        if endpoint == "boxscoretraditionalv3":
+            return load_json(f"tests/data/game/boxscore/{GAME_ID}.json")
+        return load_json(
+            "tests/data/tracking/2019-20/player-regular-season/CatchShootByDate.json"
+        )
+
+
+def test_player_team_map_matches_boxscores(tmp_path):
+    transport.set_transport(GameDateTransport())
+    boxscore_map = helpers.get_player_team_map_for_date(GAME_DATE)
+
+    helpers.clear_date_maps()
+    game_date_transport = GameDateTransport()
+    transport.set_transport(game_date_transport)
+    player_team_index.configure_player_team_index(str(tmp_path))
+    index_map = helpers.get_player_team_map_for_date(GAME_DATE)
+
+    assert len(index_map) == 24
+    # boxscores also have players that didn't play
+    assert all(
+        boxscore_map[player_id] == team_id for player_id, team_id in index_map.items()
+    )
+    assert game_date_transport.requests["leaguegamelog"] == 1
+    assert game_date_transport.requests["boxscoretraditionalv3"] == 0
+
+    # stored index is used without requesting it again
+    helpers.clear_date_maps()
+    game_date_transport = GameDateTransport()
+    transport.set_transport(game_date_transport)
+    player_team_index.configure_player_team_index(str(tmp_path))
+    assert helpers.get_player_team_map_for_date(GAME_DATE) == index_map
+    assert game_date_transport.requests["leaguegamelog"] == 0
+
+
+def test_game_logs_use_player_team_index():
+    game_date_transport = GameDateTransport()
+    transport.set_transport(game_date_transport)
+    player_team_index.configure_player_team_index()
+
+    game_logs = tracking.generate_tracking_game_logs(
+        TrackingMeasureType.catch_and_shoot, PlayerOrTeam.player, GAME_DATE, GAME_DATE
+    )
+    async_game_logs = asyncio.run(
+        tracking.async_generate_tracking_game_logs(
+            TrackingMeasureType.catch_and_shoot,
+            PlayerOrTeam.player,
+            GAME_DATE,
+            GAME_DATE,
+        )
+    )
+
+    assert game_logs == async_game_logs
+    vanvleet = next(game_log for game_log in game_logs if game_log.player_id == 1627832)
+    assert vanvleet.team_id == 1610612761
+    assert vanvleet.opponent_team_id == 1610612741
+    assert vanvleet.game_id == GAME_ID
+    assert game_date_transport.requests["leaguegamelog"] == 1
+    assert game_date_transport.requests["boxscoretraditionalv3"] == 0
+
+
+def test_dates_missing_from_index_are_unknown():
+    def fetch(season, season_type):
+        return {
+            "headers": ["PLAYER_ID", "TEAM_ID", "GAME_DATE"],
+            "rowSet": [[1627832, 1610612761, "2099-01-10"]],
+        }
+
+    index = player_team_index.PlayerTeamIndex()
+    season_filters = [("2098-99", SeasonType.regular_season)]
+
+    assert index.get_player_team_map_for_date(
+        date(2099, 1, 10), season_filters, fetch
+    ) == {1627832: 1610612761}
+    assert (
+        index.get_player_team_map_for_date(date(2099, 1, 11), season_filters, fetch)
+        is None
+    )
+    # dates missing from final seasons fall back to boxscores too
+    final_season_filters = [("2019-20", SeasonType.regular_season)]
+    assert (
+        index.get_player_team_map_for_date(
+            date(2020, 2, 2), final_season_filters, fetch
+        )
+        is None
+    )
@@ -0,0 +1,68 @@
+import json
+import threading
+import time
+from datetime import date
+
+from nba_stats_tracking import helpers, transport
+from nba_stats_tracking.models.boxscore import BoxscoreResults
+from nba_stats_tracking.player_team_map import PlayerTeamMapBuilder
+from nba_stats_tracking.request_key import get_endpoint
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.loads(f.read())
+
+
+def test_builder_uses_last_team_for_repeated_players():
+    builder = PlayerTeamMapBuilder()
+    for player_id, team_id in [(3, 30), (1, 10), (2, 20), (1, 11)]:
+        builder.add(player_id, team_id)
+
+    # last team id is used for repeated player ids, like updating a dict
+    assert builder.build() == {3: 30, 1: 11, 2: 20}
+
+
+def test_builder_matches_dict_for_game():
+    results = load_json("tests/data/game/boxscore/0021900740.json")
+    boxscore_data = BoxscoreResults(**results["boxScoreTraditional"])
+    builder = PlayerTeamMapBuilder()
+    builder.add_boxscore(boxscore_data)
+
+    assert builder.build() == helpers.make_player_team_map_for_game(boxscore_data)
+
+
+class SlowBoxscoreTransport(transport.Transport):
+    # every game on 2020-02-02 gets the CHI @ TOR boxscore, records concurrent requests
+    rate_limited = False
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_json(self, url, params):
+        if get_endpoint(url) == "scoreboardV3":
+            return load_json("tests/data/scoreboard/response.json")
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.02)
+        with self._lock:
+            self.in_flight -= 1
+        return load_json("tests/data/game/boxscore/0021900740.json")
+
+
+def test_boxscores_for_date_are_requested_concurrently():
+    slow_transport = SlowBoxscoreTransport()
+    transport.set_transport(slow_transport)
+
+    player_team_map = helpers.get_memoized_player_team_map_for_date(date(2020, 2, 2))
+
+    assert isinstance(player_team_map, dict)
+    assert player_team_map[1627832] == 1610612761
+    assert slow_transport.max_in_flight > 1
+    # the memoized map is returned without copying it
+    memoized = helpers.get_memoized_player_team_map_for_date(date(2020, 2, 2))
+    assert memoized is player_team_map
+    assert helpers.get_player_team_map_for_date(date(2020, 2, 2)) == player_team_map
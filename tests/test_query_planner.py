@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from nba_stats_tracking import query_planner, tracking_shots, transport
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking_shots import (
+    CloseDefDist,
+    GeneralRange,
+    ShotClock,
+    TouchTime,
+)
+
+HEADERS = [
+    "PLAYER_ID",
+    "PLAYER_NAME",
+    "GP",
+    "FGM",
+    "FGA",
+    "FG2M",
+    "FG2A",
+    "FG3M",
+    "FG3A",
+]
+
+# FGM, FGA, FG2M, FG2A, FG3M, FG3A for each closest defender range by player
+RANGE_STATS = {
+    CloseDefDist.range_0_2_ft: {1: [2, 5, 2, 4, 0, 1], 2: [1, 1, 1, 1, 0, 0]},
+    CloseDefDist.range_2_4_ft: {1: [3, 6, 2, 3, 1, 3], 2: [0, 2, 0, 2, 0, 0]},
+    CloseDefDist.range_4_6_ft: {1: [1, 4, 0, 1, 1, 3]},
+    CloseDefDist.range_6_plus_ft: {1: [2, 3, 0, 0, 2, 3]},
+}
+
+
+def get_result_set(close_def_dists):
+    totals = {}
+    for close_def_dist in close_def_dists:
+        for player_id, stats in RANGE_STATS[close_def_dist].items():
+            player_totals = totals.setdefault(player_id, [0] * 6)
+            for index, value in enumerate(stats):
+                player_totals[index] += value
+    return {
+        "headers": HEADERS,
+        "rowSet": [
+            [player_id, f"Player {player_id}", 1] + stats
+            for player_id, stats in totals.items()
+        ],
+    }
+
+
+class CloseDefDistTransport(transport.Transport):
+    rate_limited = False
+
+    def __init__(self):
+        self.requests = []
+
+    def get_json(self, url, params):
+        self.requests.append(params)
+        close_def_dist = params["CloseDefDistRange"]
+        if close_def_dist == CloseDefDist.all:
+            result_set = get_result_set(RANGE_STATS)
+        else:
+            result_set = get_result_set([close_def_dist])
+        return {"resultSets": [result_set]}
+
+
+def test_plan_derives_missing_range():
+    plan = query_planner.plan_tracking_shot_queries(
+        derive=True,
+        CloseDefDistRange=[
+            CloseDefDist.range_2_4_ft,
+            CloseDefDist.range_4_6_ft,
+            CloseDefDist.range_6_plus_ft,
+        ],
+        GeneralRange=[GeneralRange.catch_and_shoot],
+    )
+    assert plan.naive_request_count == 4
+    assert plan.request_count == 3
+    assert [plan.requests[index]["CloseDefDistRange"] for _, index in plan.terms] == [
+        "",
+        CloseDefDist.range_0_2_ft.value,
+    ]
+    assert [coefficient for coefficient, _ in plan.terms] == [1, -1]
+    assert plan.games_played_terms == plan.terms[:1]
+    assert plan.get_request_count(season_count=2, season_type_count=2) == 12
+
+
+def test_plan_all_ranges_shares_overall_request():
+    plan = query_planner.plan_tracking_shot_queries(
+        derive=True,
+        CloseDefDistRange=list(query_planner.PARTITIONS["CloseDefDistRange"]),
+        DateFrom="02/02/2020",
+        DateTo="02/02/2020",
+    )
+    assert plan.naive_request_count == 5
+    assert plan.request_count == 1
+    assert plan.terms == [(1, plan.overall_index)]
+    assert plan.requests[0]["DateFrom"] == "02/02/2020"
+
+
+def test_plan_deduplicates_equivalent_filters():
+    plan = query_planner.plan_tracking_shot_queries(
+        CloseDefDistRange=[CloseDefDist.range_6_plus_ft, "6+ Feet - Wide Open"],
+        Period=[1, "1"],
+        Location="Home",
+    )
+    assert plan.naive_request_count == 5
+    assert plan.request_count == 2
+    assert plan.requests[plan.overall_index]["Location"] == ""
+    assert plan.requests[plan.overall_index]["Period"] == ""
+
+
+def test_plan_without_derive():
+    plan = query_planner.plan_tracking_shot_queries(
+        CloseDefDistRange=list(query_planner.PARTITIONS["CloseDefDistRange"]),
+    )
+    assert plan.request_count == 5
+    assert all(coefficient == 1 for coefficient, _ in plan.terms)
+    assert plan.games_played_terms == plan.terms
+
+
+def test_plan_only_derives_partitions():
+    plan = query_planner.plan_tracking_shot_queries(
+        derive=True,
+        ShotClockRange=[ShotClock.range_24_22, ShotClock.range_22_18],
+        TouchTimeRange=[TouchTime.under_2_seconds, TouchTime.two_to_six_seconds],
+    )
+    assert plan.request_count == 5
+    assert all(coefficient == 1 for coefficient, _ in plan.terms)
+
+
+def test_combine_result_sets_removes_players_without_shots():
+    all_ranges = get_result_set(RANGE_STATS)
+    combined = query_planner.combine_result_sets(
+        "player",
+        [
+            (1, all_ranges),
+            (-1, get_result_set([CloseDefDist.range_0_2_ft])),
+            (-1, get_result_set([CloseDefDist.range_2_4_ft])),
+        ],
+        [(1, all_ranges)],
+    )
+    # games played is from the stats without the filter, not subtracted
+    assert combined["rowSet"] == [[1, "Player 1", 1, 3, 7, 0, 1, 3, 6]]
+
+
+@pytest.mark.parametrize("derive", [True, False])
+def test_get_tracking_shot_stats_with_derived_range(derive):
+    test_transport = CloseDefDistTransport()
+    transport.set_transport(test_transport)
+    close_def_dists = [
+        CloseDefDist.range_2_4_ft,
+        CloseDefDist.range_4_6_ft,
+        CloseDefDist.range_6_plus_ft,
+    ]
+    stats = tracking_shots.get_tracking_shot_stats(
+        tracking_shots.EntityType.player,
+        ["2019-20"],
+        [SeasonType.regular_season],
+        derive=derive,
+        CloseDefDistRange=close_def_dists,
+    )
+    # all ranges and the 0-2 ft range, the overall request is the same as all ranges
+    assert len(test_transport.requests) == (2 if derive else 4)
+    assert [stat.player_id for stat in stats] == [1, 2]
+    assert stats[0].fga == 13
+    assert stats[0].fg3m == 4
+    assert stats[0].overall_fga == 18
+    assert stats[1].fga == 2
+    assert stats[1].fgm == 0
+    assert stats[1].overall_fga == 3
+    # games played is summed over requested ranges, or from all ranges when derived
+    assert [stat.games_played for stat in stats] == ([1, 1] if derive else [3, 1])
+
+
+def test_async_get_tracking_shot_stats_with_derived_range():
+    test_transport = CloseDefDistTransport()
+    transport.set_transport(test_transport)
+    stats = asyncio.run(
+        tracking_shots.async_get_tracking_shot_stats(
+            tracking_shots.EntityType.player,
+            ["2019-20"],
+            [SeasonType.regular_season],
+            derive=True,
+            CloseDefDistRange=list(query_planner.PARTITIONS["CloseDefDistRange"]),
+        )
+    )
+    assert len(test_transport.requests) == 1
+    assert [(stat.player_id, stat.fga, stat.overall_fga) for stat in stats] == [
+        (1, 18, 18),
+        (2, 3, 3),
+    ]
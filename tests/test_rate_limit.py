@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import pytest
+import responses
+
+from nba_stats_tracking import helpers, rate_limit
+
+
+def test_burst_requests_do_not_wait():
+    limiter = rate_limit.RateLimiter(rate=1, burst=3)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() == pytest.approx(1, abs=0.05)
+    # each queued caller waits for its own token
+    assert limiter.reserve() == pytest.approx(2, abs=0.05)
+
+
+def test_time_spent_in_flight_counts_towards_next_request():
+    limiter = rate_limit.RateLimiter(rate=20, burst=1)
+    limiter.acquire()
+    time.sleep(0.05)
+    assert limiter.reserve() == 0
+
+
+def test_async_acquire_limits_throughput():
+    limiter = rate_limit.RateLimiter(rate=20, burst=1)
+
+    async def acquire_all():
+        await asyncio.gather(*[limiter.async_acquire() for _ in range(4)])
+
+    start = time.monotonic()
+    asyncio.run(acquire_all())
+    assert time.monotonic() - start >= 0.14
+
+
+def test_invalid_rate_limiter_settings():
+    with pytest.raises(ValueError):
+        rate_limit.RateLimiter(rate=0)
+    with pytest.raises(ValueError):
+        rate_limit.RateLimiter(burst=0)
+
+
+@responses.activate
+def test_get_json_response_uses_shared_rate_limiter():
+    url = "https://stats.nba.com/stats/leaguedashptstats"
+    responses.add(responses.GET, url, json={"resultSets": []}, status=200)
+    limiter = rate_limit.RateLimiter(rate=1, burst=2)
+    rate_limit.set_rate_limiter(limiter)
+
+    helpers.get_json_response(url, {}, rate_limited=True)
+    helpers.get_json_response(url, {})
+    # only the rate limited request used a token
+    assert limiter.reserve() == 0
+    assert limiter.reserve() > 0
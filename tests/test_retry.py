@@ -0,0 +1,100 @@
+import asyncio
+import time
+
+import pytest
+import requests
+import responses
+
+from nba_stats_tracking import helpers, retry
+
+URL = "https://stats.nba.com/stats/test"
+
+
+@responses.activate
+def test_retries_server_errors_until_success():
+    responses.add(responses.GET, URL, status=503)
+    responses.add(responses.GET, URL, status=429)
+    responses.add(responses.GET, URL, json={"ok": True}, status=200)
+
+    assert helpers.get_json_response(URL, {}) == {"ok": True}
+    assert len(responses.calls) == 3
+    assert retry.get_stats() == {"requests": 3, "failures": 2, "retries": 2, "trips": 0}
+
+
+@responses.activate
+def test_retries_timeouts():
+    responses.add(responses.GET, URL, body=requests.Timeout())
+    responses.add(responses.GET, URL, json={"ok": True}, status=200)
+
+    assert helpers.get_json_response(URL, {}) == {"ok": True}
+    assert retry.get_stats()["retries"] == 1
+
+
+@responses.activate
+def test_raises_after_max_retries():
+    retry.configure_retries(max_retries=2, backoff_factor=0)
+    responses.add(responses.GET, URL, status=500)
+
+    with pytest.raises(requests.HTTPError):
+        helpers.get_json_response(URL, {})
+    assert len(responses.calls) == 3
+    assert retry.get_stats()["retries"] == 2
+
+
+@responses.activate
+def test_client_errors_are_not_retried():
+    responses.add(responses.GET, URL, status=400)
+
+    with pytest.raises(requests.HTTPError):
+        helpers.get_json_response(URL, {})
+    assert len(responses.calls) == 1
+    assert retry.get_stats()["retries"] == 0
+
+
+@responses.activate
+def test_async_retries_server_errors_until_success():
+    responses.add(responses.GET, URL, status=502)
+    responses.add(responses.GET, URL, json={"ok": True}, status=200)
+
+    assert asyncio.run(helpers.async_get_json_response(URL, {})) == {"ok": True}
+    assert retry.get_stats()["retries"] == 1
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = retry.RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+    assert [policy.get_backoff(attempt) for attempt in range(4)] == [1, 2, 4, 5]
+
+    jittered = retry.RetryPolicy(backoff_factor=1, max_backoff=5)
+    assert all(0 <= jittered.get_backoff(3) <= 5 for _ in range(20))
+
+
+def test_circuit_breaker_opens_after_consecutive_failures():
+    breaker = retry.CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    assert not breaker.record_failure()
+    assert breaker.record_failure()
+    assert breaker.is_open
+    # more failures while open don't count as another trip
+    assert not breaker.record_failure()
+
+    start = time.monotonic()
+    breaker.wait_until_closed()
+    assert time.monotonic() - start >= 0.09
+    assert not breaker.is_open
+
+    # first failure after reset timeout opens it again
+    assert breaker.record_failure()
+    breaker.record_success()
+    assert not breaker.is_open
+    assert not breaker.record_failure()
+
+
+@responses.activate
+def test_circuit_breaker_trips_are_counted():
+    retry.configure_circuit_breaker(failure_threshold=2, reset_timeout=0.01)
+    retry.configure_retries(max_retries=3, backoff_factor=0)
+    responses.add(responses.GET, URL, status=503)
+
+    with pytest.raises(requests.HTTPError):
+        helpers.get_json_response(URL, {})
+    # opens on 2nd failure, then again on each failure after waiting for it to reset
+    assert retry.get_stats()["trips"] == 3
@@ -0,0 +1,119 @@
+import asyncio
+import json
+from collections import Counter
+from datetime import date
+
+from nba_stats_tracking import helpers, schedule, transport
+from nba_stats_tracking.request_key import get_endpoint
+
+
+class ScheduleTransport(transport.Transport):
+    # only has games in the 2019-20 schedule
+    rate_limited = False
+
+    def __init__(self):
+        self.requests = Counter()
+
+    def get_json(self, url, params):
+        endpoint = get_endpoint(url)
+        self.requests[endpoint] += 1
+        assert endpoint == "scheduleleaguev2"
+        if params["Season"] == "2019-20":
+            with open("tests/data/schedule/2019-20.json") as f:
+                return json.loads(f.read())
+        return {
+            "leagueSchedule": {
+                "seasonYear": params["Season"],
+                "leagueId": "00",
+                "gameDates": [],
+            }
+        }
+
+
+def test_team_id_maps_are_read_from_schedule(tmp_path):
+    schedule_transport = ScheduleTransport()
+    transport.set_transport(schedule_transport)
+    schedule.configure_schedule_index(str(tmp_path))
+
+    (
+        team_id_game_id_map,
+        team_id_opponent_team_id_map,
+    ) = helpers.get_team_id_maps_for_date(date(2020, 2, 2))
+    assert len(team_id_game_id_map) == 8
+    assert team_id_game_id_map[1610612761] == "0021900740"
+    assert team_id_opponent_team_id_map[1610612761] == 1610612741
+    assert team_id_opponent_team_id_map[1610612741] == 1610612761
+    assert helpers.get_team_id_maps_for_date(date(2020, 2, 3)) == ({}, {})
+    assert helpers.get_game_ids_for_date(date(2019, 10, 22)) == ["0021900001"]
+    # 2019-20 once, and 2018-19 since October dates can be in either season
+    assert schedule_transport.requests == {"scheduleleaguev2": 2}
+
+    # stored schedules are used without requesting them again
+    transport.set_transport(ScheduleTransport())
+    helpers.clear_date_maps()
+    schedule.configure_schedule_index(str(tmp_path))
+    assert helpers.get_game_ids_for_date(date(2020, 2, 2)) == [
+        "0021900737",
+        "0021900738",
+        "0021900739",
+        "0021900740",
+    ]
+    assert transport.get_transport().requests == {}
+
+
+def test_async_team_id_maps_are_read_from_schedule():
+    schedule_transport = ScheduleTransport()
+    transport.set_transport(schedule_transport)
+    schedule.configure_schedule_index()
+
+    team_id_game_id_map, _ = asyncio.run(
+        helpers.async_get_team_id_maps_for_date(date(2020, 2, 2))
+    )
+    assert team_id_game_id_map[1610612741] == "0021900740"
+    assert schedule_transport.requests == {"scheduleleaguev2": 1}
+
+
+def test_get_game_dates():
+    schedule_index = schedule.ScheduleIndex()
+    fetch = helpers.get_schedule_response_json_for_season
+    transport.set_transport(ScheduleTransport())
+
+    assert schedule_index.get_game_dates(
+        date(2019, 10, 1), date(2020, 2, 5), fetch
+    ) == [
+        date(2019, 10, 22),
+        date(2020, 2, 2),
+    ]
+
+
+def test_dates_after_schedule_of_season_that_isnt_final_are_unknown():
+    def fetch(season):
+        return {
+            "seasonYear": season,
+            "leagueId": "00",
+            "gameDates": [
+                {
+                    "gameDate": "01/10/2099 00:00:00",
+                    "games": [
+                        {
+                            "gameId": "0029800001",
+                            "gameStatus": 1,
+                            "homeTeam": {"teamId": 1610612761},
+                            "awayTeam": {"teamId": 1610612741},
+                        }
+                    ],
+                }
+            ],
+        }
+
+    schedule_index = schedule.ScheduleIndex()
+
+    assert schedule_index.get_scoreboard_for_date(date(2099, 1, 10), fetch).games
+    assert schedule_index.get_scoreboard_for_date(date(2099, 1, 5), fetch).games == []
+    assert schedule_index.get_scoreboard_for_date(date(2099, 1, 11), fetch) is None
+
+
+def test_get_seasons_for_date():
+    assert schedule.get_seasons_for_date(date(2020, 2, 2)) == ["2019-20"]
+    assert schedule.get_seasons_for_date(date(2020, 8, 15)) == ["2019-20", "2020-21"]
+    assert schedule.get_seasons_for_date(date(1999, 12, 1)) == ["1998-99", "1999-00"]
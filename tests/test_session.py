@@ -0,0 +1,50 @@
+import requests
+import responses
+
+from nba_stats_tracking import HEADERS, helpers, session
+
+
+def test_get_session_is_shared():
+    session.close_session()
+    assert session.get_session() is session.get_session()
+
+
+def test_configure_session_sets_pool_size():
+    session.configure_session(pool_size=3)
+    adapter = session.get_session().get_adapter("https://stats.nba.com")
+    assert adapter._pool_maxsize == 3
+    session.configure_session()
+
+
+@responses.activate
+def test_set_session_is_used_for_requests():
+    url = "https://stats.nba.com/stats/scoreboardV3"
+    responses.add(responses.GET, url, json={"scoreboard": {}}, status=200)
+
+    custom_session = requests.Session()
+    session.set_session(custom_session)
+    assert session.get_session() is custom_session
+
+    assert helpers.get_json_response(url, {}) == {"scoreboard": {}}
+    # headers are sent even when the injected session doesn't have them set
+    assert responses.calls[0].request.headers["Referer"] == HEADERS["Referer"]
+    session.close_session()
+    assert session.get_session() is not custom_session
+
+
+def test_only_sessions_created_here_are_closed(monkeypatch):
+    closed = []
+    monkeypatch.setattr(requests.Session, "close", lambda self: closed.append(self))
+
+    session.configure_session()
+    closed.clear()
+    owned_session = session.get_session()
+    custom_session = requests.Session()
+    session.set_session(custom_session)
+    assert closed == [owned_session]
+
+    session.set_session(None)
+    assert closed == [owned_session]
+    created_session = session.get_session()
+    session.close_session()
+    assert closed == [owned_session, created_session]
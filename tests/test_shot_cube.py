@@ -0,0 +1,165 @@
+import asyncio
+from datetime import date
+
+import pytest
+
+from nba_stats_tracking import shot_cube, tracking_shots, transport
+from nba_stats_tracking.models.request import ResultFormat, SeasonType
+from nba_stats_tracking.models.tracking_shots import (
+    CloseDefDist,
+    Dribbles,
+    ShotClock,
+    TouchTime,
+)
+
+np = pytest.importorskip("numpy")
+
+HEADERS = [
+    "PLAYER_ID",
+    "PLAYER_NAME",
+    "PLAYER_LAST_TEAM_ID",
+    "PLAYER_LAST_TEAM_ABBREVIATION",
+    "GP",
+    "FGA_FREQUENCY",
+    "FGM",
+    "FGA",
+    "FG2M",
+    "FG2A",
+    "FG3M",
+    "FG3A",
+]
+
+
+def get_player_stats(params):
+    """
+    Player 1 misses a 2 in every cell in each of the first 4 periods and makes a 3 in
+    every wide open cell in overtime. Player 2 makes a 2 and misses a 3 on very tight,
+    very late, 0 dribble, under 2 second touch shots in the 4th period.
+    """
+    period = params["Period"]
+    stats = {}
+    player_1 = [0, 1, 0, 1, 0, 0]
+    if period == "":
+        player_1 = [0, 4, 0, 4, 0, 0]
+        if params["CloseDefDistRange"] == CloseDefDist.range_6_plus_ft:
+            player_1 = [1, 5, 0, 4, 1, 1]
+    stats[1] = player_1
+    if (
+        period in ("", "4")
+        and params["CloseDefDistRange"] == CloseDefDist.range_0_2_ft
+        and params["ShotClockRange"] == ShotClock.range_4_0
+        and params["TouchTimeRange"] == TouchTime.under_2_seconds
+        and params["DribbleRange"] == Dribbles.zero
+    ):
+        stats[2] = [1, 2, 1, 1, 0, 1]
+    return stats
+
+
+class CubeTransport(transport.Transport):
+    rate_limited = False
+
+    def __init__(self):
+        self.request_count = 0
+
+    def get_json(self, url, params):
+        self.request_count += 1
+        rows = [
+            [player_id, f"Player {player_id}", 1610612761, "TOR", 1, 0.5] + stats
+            for player_id, stats in get_player_stats(params).items()
+        ]
+        return {"resultSets": [{"headers": HEADERS, "rowSet": rows}]}
+
+
+class NoRequestsTransport(transport.Transport):
+    rate_limited = False
+
+    def get_json(self, url, params):
+        raise AssertionError("cube queries shouldn't make requests")
+
+
+def check_cube(cube):
+    transport.set_transport(NoRequestsTransport())
+    assert cube.cells.shape == (2, 4, 7, 3, 5, 5, 6)
+
+    stats = cube.query()
+    assert [(stat.player_id, stat.fga, stat.fgm) for stat in stats] == [
+        (1, 1785, 105),
+        (2, 2, 1),
+    ]
+    assert stats[0].player_name == "Player 1"
+    assert stats[0].overall_fga == 1785
+    assert stats[0].season == "2019-20 Regular Season"
+
+    wide_open = cube.query(
+        CloseDefDistRange=[CloseDefDist.range_6_plus_ft],
+        ShotClockRange=[ShotClock.range_4_0],
+        Period=["OT"],
+    )
+    assert [(stat.player_id, stat.fg3m, stat.fg3a) for stat in wide_open] == [
+        (1, 15, 15)
+    ]
+
+    tight = cube.query(
+        ResultFormat.slotted,
+        CloseDefDistRange=[CloseDefDist.range_0_2_ft, "0-2 Feet - Very Tight"],
+        DribbleRange=[Dribbles.zero],
+        Period=[4],
+    )
+    assert [(stat.player_id, stat.fga) for stat in tight] == [(1, 21), (2, 2)]
+    assert tight[1].fga_frequency == 1
+
+
+def test_build_tracking_shot_cube(tmp_path):
+    test_transport = CubeTransport()
+    transport.set_transport(test_transport)
+    cube = shot_cube.build_tracking_shot_cube(
+        tracking_shots.EntityType.player, "2019-20", SeasonType.regular_season
+    )
+    assert test_transport.request_count == shot_cube.CUBE_REQUEST_COUNT == 2100
+    check_cube(cube)
+
+    path = str(tmp_path / "2019-20.npz")
+    cube.save(path)
+    check_cube(shot_cube.TrackingShotCube.load(path))
+
+
+def test_async_build_tracking_shot_cube_for_date(tmp_path):
+    transport.set_transport(CubeTransport())
+    game_date = date(2020, 2, 2)
+    cube = asyncio.run(
+        shot_cube.async_build_tracking_shot_cube(
+            "player", "2019-20", SeasonType.regular_season, game_date
+        )
+    )
+    path = str(tmp_path / "2020-02-02.npz")
+    cube.save(path)
+    loaded = shot_cube.TrackingShotCube.load(path)
+    assert loaded.game_date == game_date
+    check_cube(loaded)
+
+
+def test_query_unknown_filters():
+    cube = shot_cube.TrackingShotCube.from_result_sets(
+        "player", "2019-20", SeasonType.regular_season, []
+    )
+    assert cube.query() == []
+    with pytest.raises(ValueError):
+        cube.query(GeneralRange=["Catch and Shoot"])
+    with pytest.raises(ValueError):
+        cube.query(Period=[5])
+
+
+def test_inconsistent_periods_raise():
+    requests = shot_cube.get_cube_requests()
+    cell_results = [
+        (cell, CubeTransport().get_json("", request_parameters)["resultSets"][0])
+        for cell, request_parameters in requests
+    ]
+    # all period response missing a player's shots
+    cell, results = cell_results[4]
+    assert requests[4][1]["Period"] == ""
+    cell_results[4] = (cell, dict(results, rowSet=[]))
+    with pytest.raises(ValueError, match="PLAYER_ID 1"):
+        shot_cube.TrackingShotCube.from_result_sets(
+            "player", "2019-20", SeasonType.regular_season, cell_results
+        )
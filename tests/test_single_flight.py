@@ -0,0 +1,123 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+import responses
+
+from nba_stats_tracking import helpers, single_flight
+
+URL = "https://stats.nba.com/stats/test"
+
+
+def slow_response(request):
+    time.sleep(0.1)
+    return (200, {}, '{"ok": true}')
+
+
+@responses.activate
+def test_concurrent_identical_requests_share_one_request():
+    responses.add_callback(responses.GET, URL, callback=slow_response)
+
+    with ThreadPoolExecutor(4) as executor:
+        results = list(
+            executor.map(
+                lambda _: helpers.get_json_response(URL, {"Season": "2019-20"}),
+                range(4),
+            )
+        )
+
+    assert len(responses.calls) == 1
+    assert all(result == {"ok": True} for result in results)
+    assert len(single_flight.get_single_flight()) == 0
+
+
+@responses.activate
+def test_async_identical_requests_share_one_request():
+    responses.add_callback(responses.GET, URL, callback=slow_response)
+
+    async def get_all():
+        return await asyncio.gather(
+            helpers.async_get_json_response(URL, {"Season": "2019-20", "A": None}),
+            helpers.async_get_json_response(URL, {"Season": "2019-20"}),
+        )
+
+    results = asyncio.run(get_all())
+    assert len(responses.calls) == 1
+    assert results[0] is results[1]
+
+
+@responses.activate
+def test_requests_with_own_session_are_not_shared():
+    responses.add_callback(responses.GET, URL, callback=slow_response)
+    http_session = requests.Session()
+
+    with ThreadPoolExecutor(2) as executor:
+        shared = executor.submit(helpers.get_json_response, URL, {})
+        time.sleep(0.02)
+        own_session = executor.submit(helpers.get_json_response, URL, {}, http_session)
+        assert shared.result() == own_session.result() == {"ok": True}
+
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_requests_are_not_shared_after_they_finish():
+    responses.add(responses.GET, URL, json={"ok": True}, status=200)
+
+    helpers.get_json_response(URL, {})
+    helpers.get_json_response(URL, {})
+    assert len(responses.calls) == 2
+
+
+def test_exceptions_are_shared():
+    group = single_flight.SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(1)
+        raise requests.HTTPError("failed")
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(group.do, "key", fail)
+        started.wait(1)
+        follower = executor.submit(group.do, "key", fail)
+        time.sleep(0.05)
+        release.set()
+        with pytest.raises(requests.HTTPError):
+            leader.result()
+        with pytest.raises(requests.HTTPError):
+            follower.result()
+    assert group.coalesced == 1
+
+
+def test_waiting_caller_makes_call_when_leader_is_cancelled():
+    group = single_flight.SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def run():
+        leader = asyncio.ensure_future(group.async_do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.async_do("key", fetch))
+        other_follower = asyncio.ensure_future(group.async_do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        # cancelling a waiting caller doesn't cancel the call for the others
+        other_follower.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        with pytest.raises(asyncio.CancelledError):
+            await other_follower
+        return await follower
+
+    assert asyncio.run(run()) == 2
+    assert len(group) == 0
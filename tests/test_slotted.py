@@ -0,0 +1,90 @@
+import json
+import pickle
+
+import pytest
+
+from nba_stats_tracking import tracking, tracking_shots, transport
+from nba_stats_tracking.models.request import ResultFormat, SeasonType
+from nba_stats_tracking.models.slotted import get_slotted_item_class
+from nba_stats_tracking.models.tracking import (
+    DrivesItem,
+    PlayerOrTeam,
+    TrackingMeasureType,
+)
+from nba_stats_tracking.models.tracking_shots import TrackingShotItem
+
+
+def load_result_set(path):
+    with open(path) as f:
+        return json.loads(f.read())["resultSets"][0]
+
+
+@pytest.mark.parametrize("measure_type", list(TrackingMeasureType))
+def test_slotted_items_match_models(measure_type):
+    result_set = load_result_set(
+        f"tests/data/tracking/2019-20/player-regular-season/{measure_type.value}.json"
+    )
+    models = tracking.parse_tracking_results(
+        measure_type, result_set, "2019-20", SeasonType.regular_season
+    )
+    items = tracking.parse_tracking_results(
+        measure_type,
+        result_set,
+        "2019-20",
+        SeasonType.regular_season,
+        ResultFormat.slotted,
+    )
+    assert not hasattr(items[0], "__dict__")
+    assert [item.dict() for item in items] == [model.dict() for model in models]
+    item_class = tracking.DATA_ITEM_MAP[measure_type]
+    properties = [
+        name for name, value in vars(item_class).items() if isinstance(value, property)
+    ]
+    for name in properties:
+        assert getattr(items[0], name) == getattr(models[0], name)
+
+    model_total = models[0] + models[1]
+    item_total = items[0] + items[1]
+    assert item_total.dict() == model_total.dict()
+    assert item_total.to_model() == model_total
+
+
+def test_slotted_tracking_shot_items_match_models():
+    result_set = load_result_set(
+        "tests/data/tracking_shots/player_overall_response.json"
+    )
+    models = tracking_shots.parse_tracking_shot_results(result_set)
+    items = tracking_shots.parse_tracking_shot_results(result_set, ResultFormat.slotted)
+    assert [item.dict() for item in items] == [model.dict() for model in models]
+    assert items[0].efg == models[0].efg
+
+
+def test_slotted_item_from_kwargs():
+    slotted_drives_item = get_slotted_item_class(DrivesItem)
+    assert get_slotted_item_class(DrivesItem) is slotted_drives_item
+    item = slotted_drives_item(TEAM_ID="00", TEAM_ABBREVIATION="LEAGUE", DRIVES="4")
+    assert item.team_id == 0
+    assert item.drives == 4.0
+    assert item.points == 0
+    assert item.pts_per_drive == 0
+    with pytest.raises(ValueError):
+        slotted_drives_item(TEAM_ABBREVIATION="LEAGUE")
+
+
+def test_slotted_items_can_be_pickled():
+    item = get_slotted_item_class(TrackingShotItem)(TEAM_ID=1, FGA=10, FGM=5)
+    assert pickle.loads(pickle.dumps(item)) == item
+
+
+def test_aggregate_full_season_tracking_stats_slotted():
+    transport.configure_replay("tests/data")
+    stats, league_totals = tracking.aggregate_full_season_tracking_stats_for_seasons(
+        TrackingMeasureType.catch_and_shoot,
+        ["2019-20"],
+        [SeasonType.playoffs],
+        PlayerOrTeam.team,
+        result_format=ResultFormat.slotted,
+    )
+    assert len(stats) == 16
+    assert type(league_totals).__name__ == "SlottedCatchAndShootItem"
+    assert league_totals.fga == 4477
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from ast import alias
 from datetime import date
@@ -97,6 +98,42 @@ def test_team_aggregate_full_season_tracking_stats_for_seasons():
     assert league_totals.fg3a == 105039
 
 
+@responses.activate
+def test_async_team_aggregate_full_season_tracking_stats_for_seasons():
+    with open("tests/data/tracking/2019-20/team-regular-season/CatchShoot.json") as f:
+        tracking_2020_response_json = json.loads(f.read())
+
+    with open("tests/data/tracking/2018-19/team-regular-season/CatchShoot.json") as f:
+        tracking_2019_response_json = json.loads(f.read())
+
+    entity_type = PlayerOrTeam.team
+    measure_type = TrackingMeasureType.catch_and_shoot
+    seasons = ["2018-19", "2019-20"]
+    season_types = [SeasonType.regular_season]
+
+    url_2020 = generate_url(measure_type, seasons[1], season_types[0], entity_type)
+    responses.add(responses.GET, url_2020, json=tracking_2020_response_json, status=200)
+
+    url_2019 = generate_url(measure_type, seasons[0], season_types[0], entity_type)
+    responses.add(responses.GET, url_2019, json=tracking_2019_response_json, status=200)
+
+    stats, league_totals = asyncio.run(
+        tracking.async_aggregate_full_season_tracking_stats_for_seasons(
+            measure_type, seasons, season_types, entity_type
+        )
+    )
+    assert len(stats) == 30
+    for stat in stats:
+        if stat.team_id == 1610612737:
+            assert stat.minutes == 36135.0
+            assert stat.fgm == 1406
+            assert stat.fga == 3962
+
+    assert league_totals.minutes == 1106520.0
+    assert league_totals.fgm == 44236
+    assert league_totals.fga == 117893
+
+
 @responses.activate
 def test_player_aggregate_full_season_tracking_stats_for_seasons():
     with open(
@@ -1,3 +1,4 @@
+import asyncio
 import json
 from datetime import date
 
@@ -189,6 +190,76 @@ def test_get_tracking_shot_stats_team():
             assert stat.fg3pct == stat.fg3m / stat.fg3a
 
 
+@responses.activate
+def test_async_get_tracking_shot_stats_team():
+    with open("tests/data/tracking_shots/team_wide_open_response.json") as f:
+        wide_open_response_json = json.loads(f.read())
+
+    season = "2019-20"
+    season_type = SeasonType.regular_season
+    def_distance = CloseDefDist.range_6_plus_ft
+    general_range = GeneralRange.overall
+
+    base_url = "https://stats.nba.com/stats/leaguedashteamptshot"
+    wide_open_query_params = {
+        "Season": season,
+        "SeasonType": season_type,
+        "DateFrom": "",
+        "DateTo": "",
+        "CloseDefDistRange": def_distance,
+        "ShotClockRange": "",
+        "ShotDistRange": "",
+        "TouchTimeRange": "",
+        "DribbleRange": "",
+        "GeneralRange": general_range,
+        "PerMode": "Totals",
+        "LeagueID": "00",
+    }
+    wide_open_url = furl(base_url).add(wide_open_query_params).url
+    responses.add(
+        responses.GET, wide_open_url, json=wide_open_response_json, status=200
+    )
+
+    with open("tests/data/tracking_shots/team_overall_response.json") as f:
+        overall_response_json = json.loads(f.read())
+
+    overall_query_params = {
+        "Season": season,
+        "SeasonType": season_type,
+        "DateFrom": "",
+        "DateTo": "",
+        "CloseDefDistRange": "",
+        "ShotClockRange": "",
+        "ShotDistRange": "",
+        "TouchTimeRange": "",
+        "DribbleRange": "",
+        "GeneralRange": GeneralRange.overall,
+        "PerMode": "Totals",
+        "LeagueID": "00",
+    }
+    overall_url = furl(base_url).add(overall_query_params).url
+
+    responses.add(responses.GET, overall_url, json=overall_response_json, status=200)
+
+    stats = asyncio.run(
+        tracking_shots.async_get_tracking_shot_stats(
+            tracking_shots.EntityType.team,
+            [season],
+            [season_type],
+            CloseDefDistRange=[def_distance],
+            GeneralRange=[general_range],
+        )
+    )
+    assert len(stats) == 30
+    for stat in stats:
+        if stat.team_id == 1610612749:
+            assert stat.team_abbreviation == "MIL"
+            assert stat.fg3m == 561
+            assert stat.fg3a == 1532
+            assert stat.overall_fg3a == 2804
+            assert stat.fg3pct == stat.fg3m / stat.fg3a
+
+
 @responses.activate
 def test_get_tracking_shot_stats_opponent():
     with open("tests/data/tracking_shots/opponent_wide_open_response.json") as f:
@@ -648,6 +719,83 @@ def test_generate_tracking_shot_game_logs_for_date_with_no_games():
     assert game_logs == []
 
 
+@responses.activate
+def test_async_generate_tracking_shot_game_logs_for_dates_with_no_games():
+    with open("tests/data/scoreboard/response.json") as f:
+        scoreboard_response = json.loads(f.read())
+    scoreboard_response["scoreboard"]["games"] = []
+    for game_date in ["2020-02-02", "2020-02-03"]:
+        scoreboard_response_url = (
+            f"https://stats.nba.com/stats/scoreboardV3?LeagueID=00&GameDate={game_date}"
+        )
+        responses.add(
+            responses.GET, scoreboard_response_url, json=scoreboard_response, status=200
+        )
+
+    game_logs = asyncio.run(
+        tracking_shots.async_generate_tracking_shot_game_logs(
+            tracking_shots.EntityType.player,
+            date(2020, 2, 2),
+            date(2020, 2, 3),
+            CloseDefDistRange=[CloseDefDist.range_6_plus_ft],
+        )
+    )
+    assert game_logs == []
+    assert len(responses.calls) == 2
+
+
+def add_no_games_scoreboard_responses(game_dates):
+    with open("tests/data/scoreboard/response.json") as f:
+        scoreboard_response = json.loads(f.read())
+    scoreboard_response["scoreboard"]["games"] = []
+    for game_date in game_dates:
+        scoreboard_response_url = (
+            f"https://stats.nba.com/stats/scoreboardV3?LeagueID=00&GameDate={game_date}"
+        )
+        responses.add(
+            responses.GET, scoreboard_response_url, json=scoreboard_response, status=200
+        )
+
+
+@responses.activate
+def test_iter_tracking_shot_game_logs_yields_every_date():
+    add_no_games_scoreboard_responses(["2020-02-02", "2020-02-03"])
+
+    game_logs = tracking_shots.iter_tracking_shot_game_logs(
+        tracking_shots.EntityType.player,
+        date(2020, 2, 2),
+        date(2020, 2, 3),
+        CloseDefDistRange=[CloseDefDist.range_6_plus_ft],
+    )
+
+    assert next(game_logs) == (date(2020, 2, 2), [])
+    # next date isn't requested until it is consumed
+    assert len(responses.calls) == 1
+    assert list(game_logs) == [(date(2020, 2, 3), [])]
+
+
+@responses.activate
+def test_async_iter_tracking_shot_game_logs_yields_dates_in_order():
+    game_dates = ["2020-02-02", "2020-02-03", "2020-02-04"]
+    add_no_games_scoreboard_responses(game_dates)
+
+    async def get_dates():
+        return [
+            dt
+            async for dt, game_logs in tracking_shots.async_iter_tracking_shot_game_logs(
+                tracking_shots.EntityType.player,
+                date(2020, 2, 2),
+                date(2020, 2, 4),
+                dates_ahead=2,
+                CloseDefDistRange=[CloseDefDist.range_6_plus_ft],
+            )
+        ]
+
+    dates = asyncio.run(get_dates())
+    assert [dt.isoformat() for dt in dates] == game_dates
+    assert len(responses.calls) == 3
+
+
 def test_0_as_denominator_returns_0_pct():
     a = TrackingShotItem(
         FGA=0, FG2A=0, FG3A=0, overall_fg2a=0, overall_fg3a=0, overall_fga=0
@@ -0,0 +1,63 @@
+import time
+from datetime import date
+
+import pytest
+
+from nba_stats_tracking import helpers, rate_limit, tracking, transport
+from nba_stats_tracking.models.request import SeasonType
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+
+
+@pytest.fixture
+def replay():
+    transport.configure_replay("tests/data")
+    yield
+    transport.set_transport(None)
+
+
+def test_replay_tracking_stats(replay):
+    stats, league_totals = tracking.aggregate_full_season_tracking_stats_for_seasons(
+        TrackingMeasureType.catch_and_shoot,
+        ["2019-20"],
+        [SeasonType.playoffs],
+        PlayerOrTeam.team,
+    )
+    assert len(stats) == 16
+    assert league_totals.fga == 4477
+
+
+def test_replay_is_not_rate_limited(replay):
+    rate_limit.configure_rate_limiter(rate=1, burst=1)
+    start = time.monotonic()
+    for measure_type in TrackingMeasureType:
+        tracking.get_tracking_stats(
+            measure_type, ["2019-20"], [SeasonType.playoffs], PlayerOrTeam.team
+        )
+    assert time.monotonic() - start < 1
+
+
+def test_replay_scoreboard(replay):
+    game_ids = helpers.get_game_ids_for_date(date(2020, 2, 2))
+    assert game_ids == ["0021900737", "0021900738", "0021900739", "0021900740"]
+
+
+def test_replay_matches_on_endpoint_and_canonical_params():
+    replay_transport = transport.ReplayTransport("tests/data")
+    assert len(replay_transport) == 42
+    assert (
+        "http://localhost/stats/SCOREBOARDV3",
+        {"GameDate": date(2020, 2, 2), "LeagueID": "00", "Extra": None},
+    ) in replay_transport
+
+
+def test_replay_missing_response(replay):
+    with pytest.raises(transport.MissingResponseError):
+        helpers.get_game_ids_for_date(date(2020, 2, 3))
+
+
+def test_transports_must_implement_get_json():
+    class IncompleteTransport(transport.Transport):
+        rate_limited = False
+
+    with pytest.raises(TypeError):
+        IncompleteTransport()
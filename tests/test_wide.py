@@ -0,0 +1,94 @@
+import asyncio
+
+from nba_stats_tracking import tracking, transport, wide
+from nba_stats_tracking.models.request import ResultFormat, SeasonType
+from nba_stats_tracking.models.tracking import PlayerOrTeam, TrackingMeasureType
+
+
+def test_get_wide_tracking_stats():
+    transport.configure_replay("tests/data")
+    rows = wide.get_wide_tracking_stats(
+        ["2019-20"], [SeasonType.regular_season], PlayerOrTeam.player
+    )
+    drives = tracking.get_tracking_stats(
+        TrackingMeasureType.drives,
+        ["2019-20"],
+        [SeasonType.regular_season],
+        PlayerOrTeam.player,
+    )
+
+    assert len(rows) == len(drives)
+    row = next(row for row in rows if row["player_id"] == 203507)
+    giannis = next(stat for stat in drives if stat.player_id == 203507)
+    assert row["player_name"] == "Giannis Antetokounmpo"
+    assert row["season"] == "2019-20 Regular Season"
+    assert row["game_id"] is None
+    # shared columns are from the first measure type, minutes are the same for
+    # all measure types in live responses but fixtures were saved at different times
+    assert row["minutes"] == next(
+        stat.minutes
+        for stat in tracking.get_tracking_stats(
+            TrackingMeasureType.catch_and_shoot,
+            ["2019-20"],
+            [SeasonType.regular_season],
+            PlayerOrTeam.player,
+        )
+        if stat.player_id == 203507
+    )
+    assert row["drives_points"] == giannis.points
+    assert row["drives_pts_per_drive"] == giannis.pts_per_drive
+    assert "drives_minutes" not in row
+    assert "speed_distance_avg_speed" in row
+    assert "catch_and_shoot_efg" in row
+    assert all(row.keys() == rows[0].keys() for row in rows)
+
+
+def test_join_tracking_stats_matches_joined_results():
+    transport.configure_replay("tests/data")
+    measure_types = [TrackingMeasureType.drives, TrackingMeasureType.catch_and_shoot]
+    stats_by_measure = {
+        measure_type: tracking.get_tracking_stats(
+            measure_type,
+            ["2019-20"],
+            [SeasonType.playoffs],
+            PlayerOrTeam.team,
+            ResultFormat.slotted,
+        )
+        for measure_type in measure_types
+    }
+    rows = wide.join_tracking_stats(stats_by_measure, PlayerOrTeam.team)
+
+    assert len(rows) == 16
+    assert rows == wide.get_wide_tracking_stats(
+        ["2019-20"], [SeasonType.playoffs], PlayerOrTeam.team, measure_types
+    )
+
+
+def test_missing_measure_columns_are_none():
+    headers = ["PLAYER_ID", "PLAYER_NAME", "TEAM_ID", "TEAM_ABBREVIATION"]
+    results = {
+        "headers": headers + ["DRIVES"],
+        "rowSet": [[1, "A", 10, "AAA", 5], [2, "B", 10, "AAA", None]],
+    }
+    passing = {"headers": headers + ["AST"], "rowSet": [[2, "B", 10, "AAA", 3]]}
+    rows = wide.join_tracking_results(
+        {TrackingMeasureType.drives: results, TrackingMeasureType.passing: passing},
+        PlayerOrTeam.player,
+        "2019-20",
+        SeasonType.regular_season,
+    )
+
+    assert [row["player_id"] for row in rows] == [1, 2]
+    assert rows[0]["drives_drives"] == 5
+    assert rows[0]["passing_assists"] is None
+    assert rows[1]["drives_drives"] == 0
+    assert rows[1]["passing_assists"] == 3
+
+
+def test_async_get_wide_tracking_stats():
+    transport.configure_replay("tests/data")
+    args = (["2019-20"], [SeasonType.playoffs], PlayerOrTeam.team)
+    rows = asyncio.run(wide.async_get_wide_tracking_stats(*args))
+
+    assert rows == wide.get_wide_tracking_stats(*args)
+    assert len(rows) == 16
@@ -0,0 +1,104 @@
+import json
+import multiprocessing
+import time
+from datetime import date
+
+import pytest
+
+from nba_stats_tracking import rate_limit, tracking_shots, transport, worker_pool
+from nba_stats_tracking.models.request import ResultFormat, WorkerType
+from nba_stats_tracking.models.tracking_shots import CloseDefDist
+from nba_stats_tracking.request_key import get_endpoint
+
+GAME_ID = "0021900740"
+
+
+def load_json(path):
+    with open(path) as f:
+        return json.loads(f.read())
+
+
+class GameDateTransport(transport.Transport):
+    # only has a game on 2020-02-02, the CHI @ TOR game
+    rate_limited = False
+
+    def get_json(self, url, params):
+        endpoint = get_endpoint(url)
+        if endpoint == "scoreboardV3":
+            response = load_json("tests/data/scoreboard/response.json")
+            response["scoreboard"]["games"] = [
+                game
+                for game in response["scoreboard"]["games"]
+                if game["gameId"] == GAME_ID and str(params["GameDate"]) == "2020-02-02"
+            ]
+            return response
+        if endpoint == "boxscoretraditionalv3":
+            return load_json(f"tests/data/game/boxscore/{GAME_ID}.json")
+        if params["CloseDefDistRange"] == CloseDefDist.range_6_plus_ft:
+            return load_json(
+                "tests/data/tracking_shots/player_wide_open_single_date_response.json"
+            )
+        return load_json(
+            "tests/data/tracking_shots/player_overall_response_for_date.json"
+        )
+
+
+def generate_game_logs(**kwargs):
+    return tracking_shots.generate_tracking_shot_game_logs(
+        tracking_shots.EntityType.player,
+        date(2020, 1, 31),
+        date(2020, 2, 4),
+        CloseDefDistRange=[CloseDefDist.range_6_plus_ft],
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("worker_type", list(WorkerType))
+def test_workers_give_the_same_game_logs_in_order(worker_type):
+    transport.set_transport(GameDateTransport())
+    if worker_type == WorkerType.process and "fork" not in (
+        multiprocessing.get_all_start_methods()
+    ):
+        pytest.skip("worker processes need to inherit the test transport")
+
+    game_logs = generate_game_logs(result_format=ResultFormat.slotted)
+    pool_game_logs = generate_game_logs(
+        result_format=ResultFormat.slotted, workers=2, worker_type=worker_type
+    )
+
+    assert len(game_logs) > 0
+    assert pool_game_logs == game_logs
+    wide_open = next(
+        game_log for game_log in pool_game_logs if game_log.player_id == 1627832
+    )
+    assert wide_open.game_id == GAME_ID
+    assert wide_open.overall_fga == 11
+
+
+def sleep_and_return(value):
+    # earlier values finish last
+    time.sleep(0.01 * (4 - value))
+    return value
+
+
+def test_map_in_order_keeps_order():
+    with worker_pool.get_executor(4) as executor:
+        results = worker_pool.map_in_order(
+            executor, sleep_and_return, range(4), ahead=4
+        )
+        assert list(results) == [0, 1, 2, 3]
+
+
+def reserve(rate_limiter):
+    rate_limiter.reserve()
+
+
+def test_process_rate_limiter_is_shared_with_worker_processes():
+    rate_limiter = rate_limit.ProcessRateLimiter(rate=0.01, burst=2)
+    process = multiprocessing.Process(target=reserve, args=(rate_limiter,))
+    process.start()
+    process.join()
+
+    # the worker used one of the two tokens
+    assert rate_limiter.reserve() == 0
+    assert rate_limiter.reserve() > 0